@@ -5,6 +5,7 @@ import logging
 import re
 import shutil
 import subprocess
+import threading
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Optional
@@ -438,6 +439,8 @@ class AIToolExecutor:
         # LRU cache for file contents - avoids re-reading same files
         self._file_cache: dict[Path, Optional[str]] = {}
         self._file_cache_max_size = 200
+        # Batches running concurrently share this executor
+        self._file_cache_lock = threading.Lock()
         
         # Tool dispatch table: maps tool name to (handler_name, argument_spec)
         # argument_spec: list of (arg_name, default_value) tuples
@@ -485,24 +488,28 @@ class AIToolExecutor:
         Returns:
             File content or None if unreadable/binary.
         """
-        if file_path in self._file_cache:
-            return self._file_cache[file_path]
-        
+        with self._file_cache_lock:
+            if file_path in self._file_cache:
+                return self._file_cache[file_path]
+
+        # Read outside the lock so other batches are not held up by disk I/O
         content = read_file_content(file_path)
-        
-        # Manage cache size - remove oldest entries if needed
-        if len(self._file_cache) >= self._file_cache_max_size:
-            # Remove first 20% of entries (FIFO-style eviction)
-            keys_to_remove = list(self._file_cache.keys())[:self._file_cache_max_size // 5]
-            for key in keys_to_remove:
-                del self._file_cache[key]
-        
-        self._file_cache[file_path] = content
+
+        with self._file_cache_lock:
+            # Manage cache size - remove oldest entries if needed
+            if len(self._file_cache) >= self._file_cache_max_size:
+                # Remove first 20% of entries (FIFO-style eviction)
+                keys_to_remove = list(self._file_cache.keys())[:self._file_cache_max_size // 5]
+                for key in keys_to_remove:
+                    del self._file_cache[key]
+
+            self._file_cache[file_path] = content
         return content
 
     def clear_file_cache(self) -> None:
         """Clear the file content cache. Call when files change."""
-        self._file_cache.clear()
+        with self._file_cache_lock:
+            self._file_cache.clear()
 
     def _extract_imports_from_content(self, content: str, file_path: str) -> list[dict]:
         """Extract import statements from file content for multiple languages.
@@ -984,16 +991,17 @@ class AIToolExecutor:
 
         full_path = (self.target_directory / file_path).resolve()
 
-        if is_binary_file(full_path):
-            return ToolResult(
-                success=False,
-                data=None,
-                error=f"Cannot read binary file: {file_path}. Binary files cannot be analyzed as text.",
-            )
-
         try:
+            # The read sniffs for binary content itself; only a failed read
+            # needs the separate check to pick the right error
             content = self._get_file_content(full_path)
             if content is None:
+                if is_binary_file(full_path):
+                    return ToolResult(
+                        success=False,
+                        data=None,
+                        error=f"Cannot read binary file: {file_path}. Binary files cannot be analyzed as text.",
+                    )
                 return ToolResult(
                     success=False,
                     data=None,
@@ -1112,14 +1120,13 @@ class AIToolExecutor:
         """
         info = {"path": str(relative_path)}
 
-        # Try to get line count for text files
-        if not is_binary_file(full_path):
-            try:
-                content = self._get_file_content(full_path)
-                if content is not None:
-                    info["lines"] = len(content.split("\n"))
-            except Exception:
-                pass  # Skip line count if we can't read the file
+        # Try to get line count for text files (binary files read as None)
+        try:
+            content = self._get_file_content(full_path)
+            if content is not None:
+                info["lines"] = len(content.split("\n"))
+        except Exception:
+            pass  # Skip line count if we can't read the file
 
         return info
 
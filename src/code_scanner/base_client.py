@@ -1,5 +1,6 @@
 """Abstract base class for LLM clients."""
 
+import random
 from abc import ABC, abstractmethod
 from typing import Any, Optional
 
@@ -20,6 +21,16 @@ class ContextOverflowError(LLMClientError):
     pass
 
 
+class PromptTooLargeError(LLMClientError):
+    """A prompt was estimated not to fit the context limit and was not sent.
+
+    Unlike ContextOverflowError this is detected locally before any request,
+    so the caller can retry with less content.
+    """
+
+    pass
+
+
 class BaseLLMClient(ABC):
     """Abstract base class for LLM clients.
     
@@ -27,6 +38,9 @@ class BaseLLMClient(ABC):
     to ensure interchangeable usage by the Scanner.
     """
 
+    # Empty so subclasses may declare __slots__ and drop the per-instance __dict__
+    __slots__ = ()
+
     @abstractmethod
     def connect(self) -> None:
         """Establish connection to the LLM backend and get model info.
@@ -125,6 +139,20 @@ class BaseLLMClient(ABC):
         pass
 
 
+def retry_backoff_delay(attempt: int, base: float = 0.5, cap: float = 30.0) -> float:
+    """Compute a jittered exponential backoff delay.
+
+    Args:
+        attempt: Zero-based retry number (0 for the first retry).
+        base: Delay in seconds for the first retry.
+        cap: Maximum delay in seconds before jitter.
+
+    Returns:
+        Delay in seconds: min(cap, base * 2**attempt) plus up to 0.25s of jitter.
+    """
+    return min(cap, base * (2 ** attempt)) + random.uniform(0, 0.25)
+
+
 # System prompt template for code analysis (shared across all backends)
 SYSTEM_PROMPT_TEMPLATE = """You are an expert code analysis assistant. Your task is to find real, actionable issues in the provided code.
 
@@ -140,27 +168,70 @@ SYSTEM_PROMPT_TEMPLATE = """You are an expert code analysis assistant. Your task
 
 No issues found: {"issues": []}"""
 
+# JSON schema of the final answer, for backends that constrain decoding to it
+ISSUES_JSON_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "issues": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "file": {"type": "string"},
+                    "line_number": {"type": "integer"},
+                    "description": {"type": "string"},
+                    "suggested_fix": {"type": "string"},
+                    "code_snippet": {"type": "string"},
+                },
+                "required": ["file", "line_number", "description"],
+            },
+        },
+    },
+    "required": ["issues"],
+}
+
+
+def identical_file_copies(files_content: dict[str, str]) -> dict[str, list[str]]:
+    """Group files whose content is byte-identical.
+
+    Args:
+        files_content: Dictionary mapping file paths to their content.
+
+    Returns:
+        Mapping of each duplicated file's first path (in sorted order) to
+        the other paths with the same content. Unique files are omitted.
+    """
+    by_content: dict[str, list[str]] = {}
+    for file_path in sorted(files_content):
+        by_content.setdefault(files_content[file_path], []).append(file_path)
+    return {paths[0]: paths[1:] for paths in by_content.values() if len(paths) > 1}
 
-def build_user_prompt(check_query: str, files_content: dict[str, str]) -> str:
-    """Build the user prompt with file contents.
+
+def serialize_files(files_content: dict[str, str]) -> str:
+    """Serialize files into the "Files to analyze" prompt section.
 
     Files are formatted with line numbers and boundary markers to prevent
-    hallucination and ensure precise line number references.
+    hallucination and ensure precise line number references. Paths are
+    sorted so the same batch always serializes to the same string. Files
+    with identical content are sent once, under the first path, with the
+    other paths listed in its header.
 
     Args:
-        check_query: The check/query to run against the code.
         files_content: Dictionary mapping file paths to their content.
 
     Returns:
-        Formatted user prompt.
+        Formatted file section.
     """
-    prompt_parts = [
-        f"## Check to perform:\n{check_query}\n",
-        "## Files to analyze:\n"
-    ]
+    prompt_parts = ["## Files to analyze:\n"]
 
-    for file_path, content in files_content.items():
-        lines = content.split('\n')
+    copies = identical_file_copies(files_content)
+    duplicates = {path for others in copies.values() for path in others}
+
+    for file_path in sorted(files_content):
+        if file_path in duplicates:
+            continue
+
+        lines = files_content[file_path].split('\n')
         total_lines = len(lines)
         
         # Add line numbers to each line
@@ -168,11 +239,49 @@ def build_user_prompt(check_query: str, files_content: dict[str, str]) -> str:
         for i, line in enumerate(lines, start=1):
             numbered_lines.append(f"L{i}: {line}")
         numbered_content = '\n'.join(numbered_lines)
+
+        copies_note = ""
+        if file_path in copies:
+            copies_note = (
+                f"Identical copies (not repeated, report issues for {file_path} only): "
+                f"{', '.join(copies[file_path])}\n"
+            )
         
         # Format with boundary markers and metadata
         prompt_parts.append(
             f"### File: {file_path} (lines 1-{total_lines}, total: {total_lines})\n"
+            f"{copies_note}"
             f"<<<FILE_START>>>\n{numbered_content}\n<<<FILE_END>>>\n"
         )
 
     return "\n".join(prompt_parts)
+
+
+def build_check_prompt(check_query: str, serialized_files: str) -> str:
+    """Build the user prompt from an already serialized file section.
+
+    Args:
+        check_query: The check/query to run against the code.
+        serialized_files: Output of serialize_files() for the batch.
+
+    Returns:
+        Formatted user prompt.
+    """
+    return f"{serialized_files}\n## Check to perform:\n{check_query}\n"
+
+
+def build_user_prompt(check_query: str, files_content: dict[str, str]) -> str:
+    """Build the user prompt with file contents.
+
+    The file section comes first and the check query last. Every check run
+    against the same batch therefore shares a byte-identical prompt prefix,
+    which backends with prompt/KV caching can reuse.
+
+    Args:
+        check_query: The check/query to run against the code.
+        files_content: Dictionary mapping file paths to their content.
+
+    Returns:
+        Formatted user prompt.
+    """
+    return build_check_prompt(check_query, serialize_files(files_content))
@@ -22,6 +22,7 @@ from .base_client import BaseLLMClient, LLMClientError
 from .lmstudio_client import LMStudioClient
 from .ollama_client import OllamaClient
 from .output import OutputGenerator
+from .result_cache import ResultCache
 from .scanner import Scanner
 from .utils import setup_logging
 
@@ -203,6 +204,11 @@ class Application:
             output_generator=self.output_generator,
             ctags_index=self.ctags_index,
             file_filter=self.file_filter,
+            result_cache=(
+                ResultCache(self.config.result_cache_path)
+                if self.config.result_cache_enabled
+                else None
+            ),
         )
 
     def _acquire_lock(self) -> None:
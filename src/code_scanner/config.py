@@ -39,14 +39,25 @@ class Config:
     # Home directory files
     log_file: str = "code_scanner.log"
     lock_file: str = "code_scanner.lock"
+    result_cache_file: str = "result_cache.json"
+    result_cache_enabled: bool = True  # [cache] enabled
 
     # Polling intervals
     git_poll_interval: int = 30  # seconds
+    git_idle_poll_max: int = 120  # seconds; idle polling backs off up to this
+    fs_watch_interval: float = 2.0  # seconds between worktree fingerprints; 0 disables ([watch] interval)
     llm_retry_interval: int = 10  # seconds
 
     # Retry limits
     max_llm_retries: int = 3
 
+    # Maximum LLM requests in flight at once, across checks and batches
+    # (1 = sequential); set by `concurrency` in the [llm] section
+    llm_concurrency: int = 1
+
+    # Minimum seconds between incremental output file writes during a scan
+    output_write_interval: float = 2.0
+
     @property
     def home_dir(self) -> Path:
         """Get the code-scanner home directory (~/.code-scanner/)."""
@@ -72,6 +83,11 @@ class Config:
         """
         return self.home_dir / self.lock_file
 
+    @property
+    def result_cache_path(self) -> Path:
+        """Get full path to the check result cache (in ~/.code-scanner/)."""
+        return self.home_dir / self.result_cache_file
+
 
 def load_config(
     target_directory: Path,
@@ -124,7 +140,7 @@ def load_config(
         raise ConfigError(f"Invalid TOML in config file: {e}")
 
     # Validate no unsupported top-level sections
-    SUPPORTED_SECTIONS = {"llm", "checks"}
+    SUPPORTED_SECTIONS = {"llm", "checks", "watch", "cache"}
     unsupported_sections = set(data.keys()) - SUPPORTED_SECTIONS
     if unsupported_sections:
         raise ConfigError(
@@ -201,7 +217,7 @@ def load_config(
     llm_data = data.get("llm", {})
     
     # Validate no unsupported LLM parameters
-    SUPPORTED_LLM_PARAMS = {"backend", "host", "port", "model", "timeout", "context_limit"}
+    SUPPORTED_LLM_PARAMS = {"backend", "host", "port", "model", "timeout", "context_limit", "concurrency"}
     unsupported_llm_params = set(llm_data.keys()) - SUPPORTED_LLM_PARAMS
     if unsupported_llm_params:
         raise ConfigError(
@@ -283,6 +299,53 @@ def load_config(
     except ValueError as e:
         raise ConfigError(f"LLM Configuration Error: {e}")
 
+    # Optional number of concurrent LLM requests
+    llm_concurrency = llm_data.get("concurrency", 1)
+    if isinstance(llm_concurrency, bool) or not isinstance(llm_concurrency, int) or llm_concurrency < 1:
+        raise ConfigError(
+            f"Configuration Error: 'concurrency' in [llm] section must be a positive integer, "
+            f"got {llm_concurrency!r}.\n"
+            "Example: concurrency = 2  # Requests sent to the LLM server at once"
+        )
+
+    # Extract optional worktree watching settings
+    watch_data = data.get("watch", {})
+    supported_watch_params = {"interval"}
+    unsupported_watch_params = set(watch_data.keys()) - supported_watch_params
+    if unsupported_watch_params:
+        raise ConfigError(
+            f"Unsupported parameter(s) in [watch] section: {sorted(unsupported_watch_params)}\n"
+            f"Supported parameters are: {sorted(supported_watch_params)}\n\n"
+            "Remove unsupported parameters from the [watch] section."
+        )
+
+    fs_watch_interval = watch_data.get("interval", Config.fs_watch_interval)
+    if isinstance(fs_watch_interval, bool) or not isinstance(fs_watch_interval, (int, float)) or fs_watch_interval < 0:
+        raise ConfigError(
+            f"Configuration Error: 'interval' in [watch] section must be a non-negative number, "
+            f"got {fs_watch_interval!r}.\n"
+            "Example: interval = 5  # Seconds between worktree checks, 0 disables watching"
+        )
+
+    # Extract optional result cache settings
+    cache_data = data.get("cache", {})
+    supported_cache_params = {"enabled"}
+    unsupported_cache_params = set(cache_data.keys()) - supported_cache_params
+    if unsupported_cache_params:
+        raise ConfigError(
+            f"Unsupported parameter(s) in [cache] section: {sorted(unsupported_cache_params)}\n"
+            f"Supported parameters are: {sorted(supported_cache_params)}\n\n"
+            "Remove unsupported parameters from the [cache] section."
+        )
+
+    result_cache_enabled = cache_data.get("enabled", Config.result_cache_enabled)
+    if not isinstance(result_cache_enabled, bool):
+        raise ConfigError(
+            f"Configuration Error: 'enabled' in [cache] section must be true or false, "
+            f"got {result_cache_enabled!r}.\n"
+            "Example: enabled = false  # Always query the LLM, never reuse cached results"
+        )
+
     # Build config
     config = Config(
         target_directory=target_directory,
@@ -291,6 +354,9 @@ def load_config(
         commit_hash=commit_hash,
         llm=llm_config,
         debug=debug,
+        llm_concurrency=llm_concurrency,
+        fs_watch_interval=float(fs_watch_interval),
+        result_cache_enabled=result_cache_enabled,
     )
 
     total_checks = sum(len(g.checks) for g in config.check_groups)
@@ -21,11 +21,16 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on memoized per-path decisions; a full cache is simply cleared
+_MATCH_CACHE_MAX = 65536
+
 
 class FileFilter:
     """Unified file filter combining all exclusion rules.
     
     Provides O(1) or O(patterns) filtering without subprocess calls.
+    Decisions are memoized per path, since the same changed files are
+    checked on every poll; the add_* and reload methods invalidate them.
     """
 
     def __init__(
@@ -49,6 +54,10 @@ class FileFilter:
         self.scanner_files = scanner_files or set()
         self.config_patterns = config_ignore_patterns or []
         
+        # Memoized should_skip() and is_gitignored() results per path
+        self._skip_cache: dict[str, tuple[bool, str]] = {}
+        self._gitignored_cache: dict[str, bool] = {}
+
         # Load gitignore patterns for in-memory matching
         self._gitignore_spec: Optional["pathspec.PathSpec"] = None
         if load_gitignore:
@@ -101,6 +110,16 @@ class FileFilter:
             Tuple of (should_skip, reason).
             reason is empty string if file should not be skipped.
         """
+        result = self._skip_cache.get(path)
+        if result is None:
+            result = self._check_path(path)
+            if len(self._skip_cache) >= _MATCH_CACHE_MAX:
+                self._skip_cache.clear()
+            self._skip_cache[path] = result
+        return result
+
+    def _check_path(self, path: str) -> tuple[bool, str]:
+        """Apply the exclusion rules to a path (uncached should_skip)."""
         # 1. Check scanner files (O(1) set lookup)
         if path in self.scanner_files:
             return True, "scanner_file"
@@ -171,9 +190,15 @@ class FileFilter:
         Returns:
             True if the file matches gitignore patterns.
         """
-        if self._gitignore_spec is not None:
-            return self._gitignore_spec.match_file(path)
-        return False
+        if self._gitignore_spec is None:
+            return False
+        result = self._gitignored_cache.get(path)
+        if result is None:
+            result = self._gitignore_spec.match_file(path)
+            if len(self._gitignored_cache) >= _MATCH_CACHE_MAX:
+                self._gitignored_cache.clear()
+            self._gitignored_cache[path] = result
+        return result
 
     def add_scanner_files(self, *files: str) -> None:
         """Add additional scanner files to exclude.
@@ -182,6 +207,7 @@ class FileFilter:
             files: File paths to add to exclusion set.
         """
         self.scanner_files.update(files)
+        self._skip_cache.clear()
 
     def add_config_patterns(self, *patterns: str) -> None:
         """Add additional config patterns to exclude.
@@ -190,6 +216,7 @@ class FileFilter:
             patterns: Glob patterns to add.
         """
         self.config_patterns.extend(patterns)
+        self._skip_cache.clear()
 
     def reload_gitignore(self) -> None:
         """Reload .gitignore patterns from disk.
@@ -197,3 +224,5 @@ class FileFilter:
         Call this if .gitignore has changed.
         """
         self._gitignore_spec = self._load_gitignore()
+        self._skip_cache.clear()
+        self._gitignored_cache.clear()
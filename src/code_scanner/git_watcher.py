@@ -1,6 +1,7 @@
 """Git integration for monitoring file changes."""
 
 import logging
+import os
 from pathlib import Path
 from typing import Optional
 
@@ -134,6 +135,65 @@ class GitWatcher:
         self._cached_state = None
         self._cache_time = 0.0
 
+    def worktree_snapshot(self) -> dict[str, tuple[int, int]]:
+        """Stat the worktree without running git.
+
+        Walks the worktree with os.scandir, pruning .git, gitignored
+        directories and excluded files. Comparing two snapshots shows which
+        files were created, edited or deleted. The current branch ref
+        (.git/HEAD and the ref it points to) and any merge/rebase markers are
+        included under their .git/ paths so commits, branch switches and the
+        end of a merge or rebase show up too.
+
+        Returns:
+            Mapping of relative file path to (mtime_ns, size).
+        """
+        snapshot: dict[str, tuple[int, int]] = {}
+
+        git_dir = Path(self._repo.git_dir) if self._repo is not None else self.repo_path / ".git"
+        head_refs = ["HEAD"]
+        try:
+            head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+            if head.startswith("ref: "):
+                head_refs.append(head[5:])
+        except OSError:
+            pass
+        for ref in head_refs + ["MERGE_HEAD", "REBASE_HEAD", "rebase-merge", "rebase-apply"]:
+            try:
+                st = (git_dir / ref).stat()
+                snapshot[f".git/{ref}"] = (st.st_mtime_ns, st.st_size)
+            except OSError:
+                pass
+
+        stack: list[tuple[str, str]] = [("", str(self.repo_path))]
+        while stack:
+            rel_dir, dir_path = stack.pop()
+            try:
+                entries = os.scandir(dir_path)
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    name = entry.name
+                    if name == ".git" or name in self.excluded_files:
+                        continue
+                    rel_path = rel_dir + name
+                    if rel_path in self.excluded_files:
+                        continue
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if self._file_filter is None or not self._file_filter.is_gitignored(rel_path + "/"):
+                                stack.append((rel_path + "/", entry.path))
+                            continue
+                        if self._file_filter is not None and self._file_filter.is_gitignored(rel_path):
+                            continue
+                        st = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    snapshot[rel_path] = (st.st_mtime_ns, st.st_size)
+
+        return snapshot
+
     def _get_changed_files(self) -> list[ChangedFile]:
         """Get list of files with uncommitted changes.
 
@@ -8,7 +8,7 @@ from typing import Any, Optional
 
 from openai import OpenAI, APIConnectionError, APIError
 
-from .base_client import BaseLLMClient, LLMClientError, ContextOverflowError
+from .base_client import BaseLLMClient, LLMClientError, ContextOverflowError, ISSUES_JSON_SCHEMA
 from .models import LLMConfig
 
 logger = logging.getLogger(__name__)
@@ -16,6 +16,12 @@ logger = logging.getLogger(__name__)
 # Re-export exceptions for backward compatibility
 __all__ = ["LMStudioClient", "LLMClient", "LLMClientError", "ContextOverflowError"]
 
+# Structured output: the server constrains decoding to the issues schema
+_ISSUES_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {"name": "issues", "schema": ISSUES_JSON_SCHEMA},
+}
+
 
 class LMStudioClient(BaseLLMClient):
     """Client for communicating with LM Studio via OpenAI-compatible API."""
@@ -245,10 +251,10 @@ class LMStudioClient(BaseLLMClient):
                     request_params["tools"] = tools
                     request_params["tool_choice"] = "auto"
 
-                # Only add response_format if supported and no tools
-                # (some models don't support both simultaneously)
+                # Constrain the final answer to the issues schema if supported
+                # and no tools (some models don't support both simultaneously)
                 if self._supports_json_format and not tools:
-                    request_params["response_format"] = {"type": "json_object"}
+                    request_params["response_format"] = _ISSUES_RESPONSE_FORMAT
 
                 response = self._client.chat.completions.create(**request_params)
 
@@ -336,9 +342,9 @@ class LMStudioClient(BaseLLMClient):
                         f"{'='*70}"
                     )
                 # Check if this is a response_format not supported error
-                if "response_format" in error_msg.lower() or "json_object" in error_msg.lower():
+                if "response_format" in error_msg.lower() or "json_schema" in error_msg.lower():
                     logger.info(
-                        "[OK] Model doesn't support response_format='json_object' parameter (this is normal for many models). "
+                        "[OK] Model doesn't support structured output via response_format (this is normal for many models). "
                         "Using prompt-based JSON formatting instead. This does not affect functionality."
                     )
                     self._supports_json_format = False
@@ -392,7 +398,7 @@ class LMStudioClient(BaseLLMClient):
 
             # Add response_format if supported
             if self._supports_json_format:
-                fix_params["response_format"] = {"type": "json_object"}
+                fix_params["response_format"] = _ISSUES_RESPONSE_FORMAT
 
             response = self._client.chat.completions.create(**fix_params)
             content = response.choices[0].message.content
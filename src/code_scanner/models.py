@@ -1,5 +1,8 @@
 """Data models for the code scanner."""
 
+import fnmatch
+import os
+import re
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
@@ -173,6 +176,37 @@ class CheckGroup:
     pattern: str  # Glob pattern like "*.cpp, *.h" or "*" for all files
     checks: list[str]  # List of checks to run
 
+    # Compiled form of `pattern`, rebuilt whenever the pattern changes
+    _compiled: Optional[tuple[str, Optional[re.Pattern], Optional[re.Pattern]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def _matchers(self) -> tuple[Optional[re.Pattern], Optional[re.Pattern]]:
+        """Get (file_regex, dir_regex) for the current pattern.
+
+        All comma-separated glob patterns are folded into at most two
+        precompiled regexes so matching a path costs one or two regex calls
+        instead of an fnmatch call per pattern.
+        """
+        compiled = self._compiled
+        if compiled is not None and compiled[0] == self.pattern:
+            return compiled[1], compiled[2]
+
+        file_patterns: list[str] = []
+        dir_patterns: list[str] = []
+        for pattern in self.pattern.split(","):
+            pattern = pattern.strip()
+            # Directory pattern: /*dirname*/
+            if pattern.startswith("/") and pattern.endswith("/") and len(pattern) > 2:
+                dir_patterns.append(fnmatch.translate(os.path.normcase(pattern[1:-1])))
+            else:
+                file_patterns.append(fnmatch.translate(os.path.normcase(pattern)))
+
+        file_regex = re.compile("|".join(file_patterns)) if file_patterns else None
+        dir_regex = re.compile("|".join(dir_patterns)) if dir_patterns else None
+        self._compiled = (self.pattern, file_regex, dir_regex)
+        return file_regex, dir_regex
+
     def matches_file(self, file_path: str) -> bool:
         """Check if the file matches this check group's pattern.
 
@@ -187,27 +221,23 @@ class CheckGroup:
         Returns:
             True if the file matches the pattern.
         """
-        from fnmatch import fnmatch
-
-        # Split patterns by comma and strip whitespace
-        patterns = [p.strip() for p in self.pattern.split(",")]
-
-        # Get just the filename for matching
-        filename = file_path.split("/")[-1] if "/" in file_path else file_path
-
-        # Check if any pattern matches
-        for pattern in patterns:
-            # Check for directory pattern: /*dirname*/
-            if pattern.startswith("/") and pattern.endswith("/") and len(pattern) > 2:
-                dir_pattern = pattern[1:-1]  # Remove leading and trailing /
-                # Check if any directory component matches the pattern
-                path_parts = file_path.replace("\\", "/").split("/")
-                for part in path_parts[:-1]:  # Exclude the filename itself
-                    if fnmatch(part, dir_pattern):
-                        return True
-            elif fnmatch(filename, pattern) or fnmatch(file_path, pattern):
+        # Same case handling as fnmatch.fnmatch
+        normcase = os.path.normcase
+        file_regex, dir_regex = self._matchers()
+
+        if file_regex is not None:
+            # Match against just the filename or the full path
+            filename = file_path.rsplit("/", 1)[-1]
+            if file_regex.match(normcase(filename)) or file_regex.match(normcase(file_path)):
                 return True
 
+        if dir_regex is not None:
+            # Check if any directory component matches the pattern
+            path_parts = file_path.replace("\\", "/").split("/")
+            for part in path_parts[:-1]:  # Exclude the filename itself
+                if dir_regex.match(normcase(part)):
+                    return True
+
         return False
 
 
@@ -3,22 +3,77 @@
 import json
 import logging
 import re
+import threading
 import time
 import urllib.error
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Optional
 
-from .base_client import BaseLLMClient, LLMClientError, ContextOverflowError
+from .base_client import (
+    BaseLLMClient,
+    LLMClientError,
+    ContextOverflowError,
+    ISSUES_JSON_SCHEMA,
+    PromptTooLargeError,
+    retry_backoff_delay,
+)
 from .models import LLMConfig
+from .utils import estimate_tokens
 
 logger = logging.getLogger(__name__)
 
-__all__ = ["OllamaClient", "LLMClientError", "ContextOverflowError"]
+__all__ = ["OllamaClient", "LLMClientError", "ContextOverflowError", "PromptTooLargeError"]
+
+# Context limits discovered via /api/show, keyed by (base_url, model_id).
+# The value never changes for a running server, so reconnects and other
+# client instances in the same process reuse the first successful lookup.
+_CONTEXT_LIMIT_CACHE: dict[tuple[str, str], int] = {}
+
+# Matches the "num_ctx 4096" line in the /api/show parameters string
+_NUM_CTX_PATTERN = re.compile(r"^\s*num_ctx\s+(\d+)", re.MULTILINE)
+
+# Trailing comma before a closing bracket/brace (common LLM JSON mistake)
+_TRAILING_COMMA_PATTERN = re.compile(r",\s*([\]}])")
+
+# Shared by all clients for auxiliary requests that can overlap with others
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _untagged_model_name(name: str) -> str:
+    """Strip the ":tag" suffix from an Ollama model name, if it has one.
+
+    Only the last colon can start a tag, and a suffix containing "/" is part
+    of a registry host:port ("reg:5000/model"), not a tag.
+    """
+    base, sep, tag = name.rpartition(":")
+    return base if sep and "/" not in tag else name
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Get the process-wide executor for auxiliary Ollama requests, creating it lazily."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="ollama")
+        return _executor
 
 
 class OllamaClient(BaseLLMClient):
     """Client for communicating with Ollama via native /api/chat endpoint."""
 
+    __slots__ = (
+        "config",
+        "_context_limit",
+        "_model_id",
+        "_connected",
+        "_model_context_limit",
+        "_encoded_system_message",
+        "_encoded_tools",
+        "_supports_json_format",
+    )
+
     def __init__(self, config: LLMConfig):
         """Initialize the Ollama client.
 
@@ -30,6 +85,10 @@ class OllamaClient(BaseLLMClient):
         self._model_id: Optional[str] = None
         self._connected: bool = False
         self._model_context_limit: Optional[int] = None  # Actual limit from model
+        # Last system prompt / tools and their JSON encodings, reused across queries
+        self._encoded_system_message: Optional[tuple[str, str]] = None
+        self._encoded_tools: Optional[tuple[list[dict[str, Any]], str]] = None
+        self._supports_json_format: bool = True  # Assume supported, fallback if not
 
     @property
     def backend_name(self) -> str:
@@ -53,11 +112,59 @@ class OllamaClient(BaseLLMClient):
 
         self._model_id = self.config.model
 
+        # /api/show does not depend on /api/tags, so fetch the context limit
+        # concurrently with model validation instead of after it
+        context_limit_future = _get_executor().submit(self._get_model_context_limit)
+        try:
+            self._validate_model_available()
+        finally:
+            # Always collect the lookup so it never outlives a failed connect
+            self._model_context_limit = context_limit_future.result()
+
+        # Handle context limit configuration
+        if self.config.context_limit:
+            if self._model_context_limit and self.config.context_limit > self._model_context_limit:
+                raise LLMClientError(
+                    f"\n{'='*70}\n"
+                    f"CONTEXT LIMIT ERROR\n"
+                    f"{'='*70}\n\n"
+                    f"Configuration specifies context_limit = {self.config.context_limit} tokens,\n"
+                    f"but model '{self._model_id}' only supports {self._model_context_limit} tokens.\n\n"
+                    f"To fix this, either:\n"
+                    f"1. Reduce context_limit in config.toml to {self._model_context_limit} or less\n"
+                    f"2. Use a model with larger context window\n\n"
+                    f"{'='*70}"
+                )
+            elif self._model_context_limit and self.config.context_limit < self._model_context_limit:
+                logger.warning(
+                    f"Configuration context_limit ({self.config.context_limit}) is less than "
+                    f"model's available context ({self._model_context_limit}). "
+                    f"Using configured value."
+                )
+            self._context_limit = self.config.context_limit
+            logger.info(f"Using configured context limit: {self._context_limit} tokens")
+        elif self._model_context_limit:
+            self._context_limit = self._model_context_limit
+            logger.info(f"Context window size: {self._context_limit} tokens")
+        else:
+            logger.warning(
+                "Could not determine context limit from Ollama API. "
+                "Context limit must be set manually."
+            )
+
+        self._connected = True
+
+    def _validate_model_available(self) -> None:
+        """Check that Ollama is reachable and the configured model is installed.
+
+        Raises:
+            LLMClientError: If connection fails or model not found.
+        """
         # Check if Ollama is running by querying /api/tags
         try:
             url = f"{self.config.base_url}/api/tags"
             with urllib.request.urlopen(url, timeout=10) as response:
-                data = json.loads(response.read().decode())
+                data = json.loads(response.read())  # json accepts UTF-8 bytes directly
                 available_models = [m.get("name", "") for m in data.get("models", [])]
                 
                 if not available_models:
@@ -65,13 +172,18 @@ class OllamaClient(BaseLLMClient):
 
                 # Check if requested model is available
                 # Ollama model names can be "qwen3" or "qwen3:4b" etc
-                model_found = False
-                for available in available_models:
-                    if (available == self._model_id or 
-                        available.startswith(f"{self._model_id}:") or
-                        self._model_id.startswith(f"{available}:")):
-                        model_found = True
-                        break
+                available_names = set(available_models)
+                available_bare_names = {_untagged_model_name(name) for name in available_names}
+                model_found = (
+                    self._model_id in available_names  # exact "qwen3:4b"
+                    or self._model_id in available_bare_names  # "qwen3" vs "qwen3:4b"
+                    or _untagged_model_name(self._model_id) in available_names  # "qwen3:4b" vs "qwen3"
+                    # Prefix match in either direction for any other naming
+                    or any(
+                        name.startswith(f"{self._model_id}:") or self._model_id.startswith(f"{name}:")
+                        for name in available_names
+                    )
+                )
 
                 if not model_found:
                     raise LLMClientError(
@@ -105,45 +217,29 @@ class OllamaClient(BaseLLMClient):
         except json.JSONDecodeError as e:
             raise LLMClientError(f"Invalid response from Ollama: {e}")
 
-        # Get context limit from model info
-        self._model_context_limit = self._get_model_context_limit()
-        
-        # Handle context limit configuration
-        if self.config.context_limit:
-            if self._model_context_limit and self.config.context_limit > self._model_context_limit:
-                raise LLMClientError(
-                    f"\n{'='*70}\n"
-                    f"CONTEXT LIMIT ERROR\n"
-                    f"{'='*70}\n\n"
-                    f"Configuration specifies context_limit = {self.config.context_limit} tokens,\n"
-                    f"but model '{self._model_id}' only supports {self._model_context_limit} tokens.\n\n"
-                    f"To fix this, either:\n"
-                    f"1. Reduce context_limit in config.toml to {self._model_context_limit} or less\n"
-                    f"2. Use a model with larger context window\n\n"
-                    f"{'='*70}"
-                )
-            elif self._model_context_limit and self.config.context_limit < self._model_context_limit:
-                logger.warning(
-                    f"Configuration context_limit ({self.config.context_limit}) is less than "
-                    f"model's available context ({self._model_context_limit}). "
-                    f"Using configured value."
-                )
-            self._context_limit = self.config.context_limit
-            logger.info(f"Using configured context limit: {self._context_limit} tokens")
-        elif self._model_context_limit:
-            self._context_limit = self._model_context_limit
-            logger.info(f"Context window size: {self._context_limit} tokens")
-        else:
-            logger.warning(
-                "Could not determine context limit from Ollama API. "
-                "Context limit must be set manually."
-            )
-
-        self._connected = True
 
     def _get_model_context_limit(self) -> Optional[int]:
         """Get context limit from model info via /api/show.
 
+        Results are cached per (base_url, model) in _CONTEXT_LIMIT_CACHE.
+
+        Returns:
+            Context limit in tokens, or None if unavailable.
+        """
+        cache_key = (self.config.base_url, self._model_id)
+        cached_limit = _CONTEXT_LIMIT_CACHE.get(cache_key)
+        if cached_limit is not None:
+            logger.debug(f"Using cached context limit for {self._model_id}: {cached_limit}")
+            return cached_limit
+
+        limit = self._fetch_model_context_limit()
+        if limit is not None:
+            _CONTEXT_LIMIT_CACHE[cache_key] = limit
+        return limit
+
+    def _fetch_model_context_limit(self) -> Optional[int]:
+        """Query /api/show for the model's context limit.
+
         Returns:
             Context limit in tokens, or None if unavailable.
         """
@@ -158,7 +254,7 @@ class OllamaClient(BaseLLMClient):
             )
             
             with urllib.request.urlopen(req, timeout=30) as response:
-                data = json.loads(response.read().decode())
+                data = json.loads(response.read())
                 
                 # Ollama returns model info in 'modelinfo' or 'details' field
                 model_info = data.get("modelinfo", {})
@@ -174,12 +270,9 @@ class OllamaClient(BaseLLMClient):
                 
                 # Try to extract from parameters string
                 # Format: "num_ctx 4096\nnum_gpu ..."
-                if "num_ctx" in parameters:
-                    for line in parameters.split("\n"):
-                        if line.strip().startswith("num_ctx"):
-                            parts = line.split()
-                            if len(parts) >= 2:
-                                return int(parts[1])
+                match = _NUM_CTX_PATTERN.search(parameters)
+                if match:
+                    return int(match.group(1))
 
         except Exception as e:
             logger.warning(f"Could not get context limit from Ollama: {e}")
@@ -229,14 +322,35 @@ class OllamaClient(BaseLLMClient):
 
         Raises:
             LLMClientError: If query fails after all retries.
-            ContextOverflowError: If context limit is exceeded.
+            PromptTooLargeError: If the prompt is estimated to exceed the
+                context limit; the request is not sent.
+            ContextOverflowError: If the server reports a context overflow.
         """
         if not self._connected:
             raise LLMClientError("Not connected")
 
+        # Ollama silently truncates a prompt longer than num_ctx instead of
+        # rejecting it, so the model would only see part of the files. The
+        # estimate tends to undercount for code, so this only catches prompts
+        # that would certainly be truncated.
+        if self._context_limit:
+            estimated_tokens = estimate_tokens(system_prompt) + estimate_tokens(user_prompt)
+            if estimated_tokens > self._context_limit:
+                raise PromptTooLargeError(
+                    f"Prompt (~{estimated_tokens} tokens estimated) exceeds the context "
+                    f"limit of {self._context_limit} tokens; request not sent"
+                )
+
         last_raw_response = "(no response received)"
+        temperature = 0.1  # Low temperature for consistent output
 
         for attempt in range(max_retries):
+            if attempt > 0:
+                # Give an overloaded server time to recover before retrying
+                delay = retry_backoff_delay(attempt - 1)
+                logger.debug(f"Retrying Ollama query in {delay:.2f}s")
+                time.sleep(delay)
+
             try:
                 logger.debug(
                     f"Sending query to Ollama (attempt {attempt + 1}/{max_retries})\n"
@@ -244,16 +358,13 @@ class OllamaClient(BaseLLMClient):
                     f"--- USER PROMPT ---\n{user_prompt}\n--- END USER PROMPT ---"
                 )
 
-                # Build request for /api/chat
+                # Build request for /api/chat (messages and tools are added
+                # by _encode_chat_request, which reuses their encodings)
                 request_data = {
                     "model": self._model_id,
-                    "messages": [
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": user_prompt},
-                    ],
                     "stream": False,  # Get complete response
                     "options": {
-                        "temperature": 0.1,  # Low temperature for consistent output
+                        "temperature": temperature,
                     }
                 }
 
@@ -261,20 +372,21 @@ class OllamaClient(BaseLLMClient):
                 if self._context_limit:
                     request_data["options"]["num_ctx"] = self._context_limit
 
-                # Add tools if provided (Ollama supports native function calling)
-                if tools:
-                    request_data["tools"] = tools
+                # Constrain the final answer to the issues schema (not combined
+                # with tools, which must stay free to emit tool calls)
+                if self._supports_json_format and not tools:
+                    request_data["format"] = ISSUES_JSON_SCHEMA
 
                 url = f"{self.config.base_url}/api/chat"
                 req = urllib.request.Request(
                     url,
-                    data=json.dumps(request_data).encode("utf-8"),
+                    data=self._encode_chat_request(request_data, system_prompt, user_prompt, tools),
                     headers={"Content-Type": "application/json"},
                     method="POST"
                 )
 
                 with urllib.request.urlopen(req, timeout=self.config.timeout) as response:
-                    data = json.loads(response.read().decode())
+                    data = json.loads(response.read())
 
                 # Check if Ollama wants to call tools
                 message = data.get("message", {})
@@ -315,20 +427,29 @@ class OllamaClient(BaseLLMClient):
                     )
                     logger.debug(f"--- Raw response ---\n{raw_preview}\n--- End raw response ---")
                     
+                    # Cheap local recovery first (surrounding prose, trailing commas)
+                    local_result = self._try_local_json_recovery(content)
+                    if local_result is not None:
+                        logger.info("Recovered valid JSON from Ollama response locally.")
+                        return local_result
+
                     # Try to get LLM to fix its own response
                     fix_result = self._try_fix_json_response(content)
                     if fix_result is not None:
                         logger.info("Ollama successfully reformatted response to valid JSON.")
                         return fix_result
-                    
+
+                    # Nudge the model away from repeating the same malformed output
+                    temperature = 0.1 + 0.05 * (attempt + 1)
                     continue
 
             except urllib.error.HTTPError as e:
-                error_body = e.read().decode() if e.fp else str(e)
+                error_body = e.read().decode(errors="replace") if e.fp else str(e)
+                error_text = error_body.lower()
                 
                 # Check for context overflow error
-                if "context" in error_body.lower() and ("overflow" in error_body.lower() or 
-                    "too long" in error_body.lower() or "exceeds" in error_body.lower()):
+                if "context" in error_text and ("overflow" in error_text or
+                    "too long" in error_text or "exceeds" in error_text):
                     raise ContextOverflowError(
                         f"\n{'='*70}\n"
                         f"CONTEXT LENGTH EXCEEDED\n"
@@ -342,7 +463,16 @@ class OllamaClient(BaseLLMClient):
                         f"Error: {error_body}\n"
                         f"{'='*70}"
                     )
-                
+
+                # Older Ollama versions only accept format="json"
+                if "format" in error_text and self._supports_json_format:
+                    logger.info(
+                        "Ollama doesn't support schema-constrained output; "
+                        "using prompt-based JSON formatting instead."
+                    )
+                    self._supports_json_format = False
+                    continue
+
                 logger.warning(f"Ollama HTTP error (attempt {attempt + 1}): {e}")
                 continue
 
@@ -380,6 +510,72 @@ class OllamaClient(BaseLLMClient):
             f"--- Last raw LLM response ---\n{raw_preview}\n--- End raw response ---"
         )
 
+    def _encode_chat_request(
+        self,
+        request_data: dict[str, Any],
+        system_prompt: str,
+        user_prompt: str,
+        tools: Optional[list[dict[str, Any]]],
+    ) -> bytes:
+        """Serialize an /api/chat request body.
+
+        The system prompt and tool schema are identical across the queries of
+        a scan, so their JSON encodings are cached and spliced into the body;
+        only the user prompt is serialized per call.
+
+        Args:
+            request_data: Request fields other than messages and tools.
+            system_prompt: System instructions for the LLM.
+            user_prompt: User message with code context.
+            tools: Optional list of tool definitions for function calling.
+
+        Returns:
+            UTF-8 encoded JSON request body.
+        """
+        if self._encoded_system_message is None or self._encoded_system_message[0] != system_prompt:
+            self._encoded_system_message = (
+                system_prompt,
+                json.dumps({"role": "system", "content": system_prompt}),
+            )
+        user_message = json.dumps({"role": "user", "content": user_prompt})
+
+        body = json.dumps(request_data)[:-1]  # Drop closing brace to append fields
+        body += f', "messages": [{self._encoded_system_message[1]}, {user_message}]'
+
+        # Add tools if provided (Ollama supports native function calling)
+        if tools:
+            if self._encoded_tools is None or self._encoded_tools[0] is not tools:
+                self._encoded_tools = (tools, json.dumps(tools))
+            body += f', "tools": {self._encoded_tools[1]}'
+
+        return (body + "}").encode("utf-8")
+
+    def _try_local_json_recovery(self, malformed_content: str) -> Optional[dict]:
+        """Try to recover a JSON object from a malformed response without the LLM.
+
+        Handles the common cases of a single JSON object wrapped in prose
+        and trailing commas before closing brackets.
+
+        Args:
+            malformed_content: The malformed response from LLM.
+
+        Returns:
+            Parsed JSON dict if recovery succeeded, None otherwise.
+        """
+        start = malformed_content.find("{")
+        end = malformed_content.rfind("}")
+        if start < 0 or end <= start:
+            return None
+
+        candidate = malformed_content[start:end + 1]
+        for text in (candidate, _TRAILING_COMMA_PATTERN.sub(r"\1", candidate)):
+            try:
+                return json.loads(text)
+            except json.JSONDecodeError:
+                continue
+
+        return None
+
     def _try_fix_json_response(self, malformed_content: str) -> Optional[dict]:
         """Try to get Ollama to fix its own malformed JSON response.
 
@@ -414,6 +610,8 @@ class OllamaClient(BaseLLMClient):
                     "temperature": 0.0,
                 }
             }
+            if self._supports_json_format:
+                fix_request["format"] = ISSUES_JSON_SCHEMA
 
             url = f"{self.config.base_url}/api/chat"
             req = urllib.request.Request(
@@ -424,7 +622,7 @@ class OllamaClient(BaseLLMClient):
             )
 
             with urllib.request.urlopen(req, timeout=60) as response:
-                data = json.loads(response.read().decode())
+                data = json.loads(response.read())
                 content = data.get("message", {}).get("content", "")
 
             if content:
@@ -448,28 +646,29 @@ class OllamaClient(BaseLLMClient):
         """
         content = content.strip()
 
-        # Pattern to match ```json or ``` at start and ``` at end
-        fence_pattern = re.compile(
-            r'^```(?:json)?\s*\n?(.*?)\n?```\s*$',
-            re.DOTALL | re.IGNORECASE
-        )
-
-        match = fence_pattern.match(content)
-        if match:
-            return match.group(1).strip()
+        # Plain prefix/suffix checks instead of a regex: the content is already
+        # stripped, so a closing fence can only be the last three characters
+        if len(content) >= 6 and content.startswith("```") and content.endswith("```"):
+            body = content[3:-3]
+            if body[:4].lower() == "json":
+                body = body[4:]
+            return body.strip()
 
         return content
 
     def wait_for_connection(self, retry_interval: int = 10) -> None:
         """Wait for Ollama to become available.
 
-        Retries connection every `retry_interval` seconds until successful.
+        Retries with jittered exponential backoff starting at 0.5 seconds, so a
+        server that comes up quickly is picked up quickly, while a long outage
+        settles to one attempt every `retry_interval` seconds.
 
         Args:
-            retry_interval: Seconds between retry attempts.
+            retry_interval: Maximum seconds between retry attempts.
         """
         logger.info("Waiting for Ollama connection...")
 
+        attempt = 0
         while True:
             try:
                 self.connect()
@@ -477,8 +676,10 @@ class OllamaClient(BaseLLMClient):
                 return
             except LLMClientError as e:
                 logger.warning(f"Connection failed: {e}")
-                logger.info(f"Retrying in {retry_interval} seconds...")
-                time.sleep(retry_interval)
+                delay = retry_backoff_delay(attempt, base=0.5, cap=retry_interval)
+                logger.info(f"Retrying in {delay:.1f} seconds...")
+                time.sleep(delay)
+                attempt += 1
 
 
 
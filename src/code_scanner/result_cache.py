@@ -0,0 +1,173 @@
+"""Persistent cache of check results."""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ResultCache:
+    """Caches LLM issues per (model, check query, batch contents).
+
+    Entries live in a JSON file so results survive restarts. The file is
+    loaded lazily on first use and written back by save(). Entries expire
+    ttl_seconds after they were stored; beyond max_entries the least recently
+    used are dropped. All methods are thread-safe.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        ttl_seconds: float = 24 * 60 * 60,
+        max_entries: int = 10000,
+    ):
+        """Initialize the cache.
+
+        Args:
+            path: JSON file backing the cache.
+            ttl_seconds: Age after which an entry is ignored and dropped.
+            max_entries: Maximum number of entries kept on save (most recently used win).
+        """
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+        # key -> (stored_at, issues); dict order is least to most recently used
+        self._entries: Optional[dict[str, tuple[float, list[dict[str, Any]]]]] = None
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(
+        check_query: str,
+        batch: dict[str, str],
+        model_id: str = "",
+        prompt_version: str = "",
+    ) -> str:
+        """Build a cache key from the inputs that determine a check result.
+
+        Args:
+            check_query: The check query.
+            batch: File batch content (path -> content).
+            model_id: Identifier of the model answering the check.
+            prompt_version: Identifier of the prompts and schemas sent with the
+                check, so results from older prompts are not reused.
+
+        Returns:
+            Hex digest identifying the (model, prompts, check, batch) combination.
+        """
+        digest = hashlib.sha256()
+        digest.update(model_id.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(prompt_version.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(check_query.encode("utf-8"))
+        for file_path in sorted(batch):
+            digest.update(b"\0")
+            digest.update(file_path.encode("utf-8"))
+            digest.update(b"\0")
+            digest.update(hashlib.sha256(batch[file_path].encode("utf-8", errors="replace")).digest())
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[list[dict[str, Any]]]:
+        """Look up cached issues.
+
+        Args:
+            key: Key from make_key().
+
+        Returns:
+            Cached issue dictionaries, or None on a miss or expired entry.
+        """
+        with self._lock:
+            entries = self._load()
+            entry = entries.get(key)
+            if entry is not None and time.time() - entry[0] > self.ttl_seconds:
+                del entries[key]
+                self._dirty = True
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            # Move to the most recently used end
+            del entries[key]
+            entries[key] = entry
+            self._dirty = True
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: str, issues: list[dict[str, Any]]) -> None:
+        """Store issues for a key.
+
+        Args:
+            key: Key from make_key().
+            issues: Issue dictionaries in LLM response format.
+        """
+        with self._lock:
+            entries = self._load()
+            entries.pop(key, None)
+            entries[key] = (time.time(), issues)
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache to disk if it changed since the last load/save."""
+        with self._lock:
+            if not self._dirty or self._entries is None:
+                return
+
+            now = time.time()
+            live = [
+                (key, entry) for key, entry in self._entries.items()
+                if now - entry[0] <= self.ttl_seconds
+            ]
+            if len(live) > self.max_entries:
+                live = live[len(live) - self.max_entries:]
+            self._entries = dict(live)
+
+            data = {key: [stored_at, issues] for key, (stored_at, issues) in self._entries.items()}
+            tmp_path = self.path.with_name(f"{self.path.name}.tmp")
+            try:
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(data, f)
+                os.replace(tmp_path, self.path)
+                self._dirty = False
+                logger.debug(f"Saved {len(data)} cached result(s) to {self.path}")
+            except OSError as e:
+                logger.warning(f"Could not save result cache {self.path}: {e}")
+
+    def _load(self) -> dict[str, tuple[float, list[dict[str, Any]]]]:
+        """Load entries from disk on first use. Caller must hold the lock."""
+        if self._entries is not None:
+            return self._entries
+
+        self._entries = {}
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return self._entries
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable result cache {self.path}: {e}")
+            return self._entries
+
+        if isinstance(data, dict):
+            for key, entry in data.items():
+                # Skip malformed entries (e.g. a hand-edited file) rather than failing lookups
+                if (
+                    isinstance(entry, list)
+                    and len(entry) == 2
+                    and isinstance(entry[0], (int, float))
+                    and not isinstance(entry[0], bool)
+                    and isinstance(entry[1], list)
+                ):
+                    self._entries[key] = (float(entry[0]), entry[1])
+        return self._entries
@@ -1,29 +1,92 @@
 """AI Scanner thread - executes checks against code."""
 
+import dataclasses
+import hashlib
+import json
 import logging
+import os
 import threading
 import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from datetime import datetime, timezone
+from pathlib import Path
 from typing import Any, Optional
 
+from .ai_tools import AI_TOOLS_SCHEMA, AIToolExecutor
+from .base_client import (
+    ISSUES_JSON_SCHEMA,
+    SYSTEM_PROMPT_TEMPLATE,
+    BaseLLMClient,
+    ContextOverflowError,
+    LLMClientError,
+    PromptTooLargeError,
+    build_check_prompt,
+    identical_file_copies,
+    serialize_files,
+)
 from .config import Config
 from .ctags_index import CtagsIndex
 from .file_filter import FileFilter
 from .git_watcher import GitWatcher
 from .issue_tracker import IssueTracker
-from .base_client import BaseLLMClient, LLMClientError, ContextOverflowError, SYSTEM_PROMPT_TEMPLATE, build_user_prompt
-from .models import Issue, GitState, ChangedFile, CheckGroup
+from .models import ChangedFile, CheckGroup, GitState, Issue
 from .output import OutputGenerator
+from .result_cache import ResultCache
 from .utils import (
+    CHARS_PER_TOKEN,
     estimate_tokens,
-    read_file_content,
-    is_binary_file,
     group_files_by_directory,
+    read_if_text,
 )
-from .ai_tools import AIToolExecutor, AI_TOOLS_SCHEMA
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on threads used to read changed files concurrently
+_FILE_READ_WORKERS = 16
+
+# Bounds (seconds) of the retry delay after an unexpected error in the scanner loop
+_ERROR_BACKOFF_MIN = 1.0
+_ERROR_BACKOFF_MAX = 30.0
+
+# The system prompt never changes, so estimate its size once
+_SYSTEM_PROMPT_TOKENS = estimate_tokens(SYSTEM_PROMPT_TEMPLATE)
+
+# Fingerprint of everything sent with a check besides the query and files;
+# part of the result cache key so prompt changes invalidate cached results
+_PROMPT_VERSION = hashlib.sha256(
+    "\0".join([
+        SYSTEM_PROMPT_TEMPLATE,
+        build_check_prompt("", ""),
+        json.dumps(ISSUES_JSON_SCHEMA, sort_keys=True),
+        json.dumps(AI_TOOLS_SCHEMA, sort_keys=True),
+    ]).encode("utf-8")
+).hexdigest()
+
+# Capacity of the changed-path queue; a full queue means "assume anything changed"
+_CHANGED_PATHS_MAX = 1024
+
+# Worktree watching: wait at least this many times a snapshot's duration between
+# snapshots, and don't watch trees with more files than this (their gitignore
+# matches would also overflow FileFilter's match cache)
+_WATCH_DUTY_FACTOR = 20
+_WATCH_MAX_PATHS = 40_000
+
+# Share of the context window available for file content; the rest is left
+# for the system prompt, tool calls and the response
+_FILE_CONTENT_SHARE = 0.55
+
+# A UTF-8 character is at most this many bytes, so a file whose size exceeds
+# available tokens * CHARS_PER_TOKEN * this can never fit a batch
+_MAX_BYTES_PER_CHAR = 4
+
+# Weight of the latest result in each check's moving average of issues found
+_CHECK_YIELD_ALPHA = 0.2
+
+# Files modified this recently are re-read even if their stat is unchanged,
+# since a second write within the same mtime tick would go unnoticed
+_RACY_MTIME_NS = 2_000_000_000
+
 
 class Scanner:
     """AI Scanner that executes checks against code changes."""
@@ -37,6 +100,7 @@ class Scanner:
         output_generator: OutputGenerator,
         ctags_index: CtagsIndex,
         file_filter: Optional[FileFilter] = None,
+        result_cache: Optional[ResultCache] = None,
     ):
         """Initialize the scanner.
 
@@ -48,6 +112,8 @@ class Scanner:
             output_generator: Output generator instance.
             ctags_index: Ctags index for symbol navigation.
             file_filter: Optional unified file filter for efficient filtering.
+            result_cache: Optional cache of check results; batches whose
+                check, model and contents are unchanged skip the LLM call.
         """
         self.config = config
         self.git_watcher = git_watcher
@@ -56,6 +122,7 @@ class Scanner:
         self.output_generator = output_generator
         self.ctags_index = ctags_index
         self._file_filter = file_filter
+        self._result_cache = result_cache
 
         # Initialize AI tool executor for context expansion
         self._tool_executor = None
@@ -63,12 +130,56 @@ class Scanner:
         # Threading controls
         self._stop_event = threading.Event()
         self._refresh_event = threading.Event()  # Signals to refresh file contents
+        # Paths reported by _watch_loop since the last drain. deque append/popleft
+        # are atomic, so producer and consumer need no lock
+        self._changed_paths: deque[str] = deque(maxlen=_CHANGED_PATHS_MAX)
         self._thread: Optional[threading.Thread] = None
+        self._watch_thread: Optional[threading.Thread] = None
+        # Worker pools for concurrent checks and batches, by name -> (size, pool),
+        # kept for the scanner's lifetime
+        self._pools: dict[str, tuple[int, ThreadPoolExecutor]] = {}
+        self._pools_lock = threading.Lock()  # check-pool workers look up the batch pool
+        # Serializes issue tracker and output updates from concurrent checks
+        self._tracker_lock = threading.RLock()
+        self._last_output_write = float("-inf")  # time.monotonic() of last output write
 
         # State
         self._last_scanned_files: set[str] = set()  # Files scanned in last cycle
         self._last_file_contents_hash: dict[str, int] = {}  # Hash of file contents
+        # (check query, file path) -> content hash the check last completed on
+        self._checked_content: dict[tuple[str, str], int] = {}
+        # File path -> ((mtime_ns, size), content) from the last read, so rescans
+        # only re-read files that changed on disk
+        self._file_cache: dict[str, tuple[tuple[int, int], str]] = {}
+        # File path -> size in bytes of changed files too large to ever fit a
+        # batch, as of their last read; reported as skipped by each scan
+        self._oversized_files: dict[str, int] = {}
+        # Reported issue path -> whether it is a file, reset every scan so
+        # repeated issues in one file cost a single stat
+        self._file_exists_cache: dict[str, bool] = {}
+        # Fallback: files generated by code-scanner that should never be
+        # scanned, as normalized POSIX paths to match Git's relative paths
+        self._scanner_files = frozenset(
+            Path(path).as_posix()
+            for path in (
+                config.output_file,  # code_scanner_results.md
+                f"{config.output_file}.bak",  # code_scanner_results.md.bak
+                config.log_file,  # code_scanner.log
+            )
+        )
         self._scan_info: dict = {}
+        self._idle_ticks = 0  # Consecutive idle polls without a refresh signal
+        # Check query -> moving average of issues it reported per run; checks
+        # that tend to find issues run first
+        self._check_yield: dict[str, float] = {}
+        # Check query -> batches sent to the LLM since the check's result was
+        # last taken; cached or unchanged batches don't count toward the yield
+        self._queried_batches: dict[str, int] = {}
+        self._error_backoff = _ERROR_BACKOFF_MIN  # Next retry delay after a loop error
+        # Serialized file section per batch, shared by every check on that batch.
+        # Keyed by (path, id(content)) pairs; the value keeps the contents alive
+        # so their ids cannot be reused while the entry exists.
+        self._serialized_batches: dict[tuple[tuple[str, int], ...], tuple[list[str], str]] = {}
 
     @property
     def tool_executor(self) -> AIToolExecutor:
@@ -95,6 +206,9 @@ class Scanner:
         self._refresh_event.clear()
         self._thread = threading.Thread(target=self._run_loop, daemon=True)
         self._thread.start()
+        if self.config.fs_watch_interval > 0:
+            self._watch_thread = threading.Thread(target=self._watch_loop, daemon=True)
+            self._watch_thread.start()
         logger.info("Scanner thread started")
 
     def stop(self) -> None:
@@ -104,14 +218,44 @@ class Scanner:
         self._refresh_event.set()  # Wake up if waiting
         if self._thread is not None:
             self._thread.join(timeout=5)
+        if self._watch_thread is not None:
+            self._watch_thread.join(timeout=5)
+            self._watch_thread = None
+        with self._pools_lock:
+            for _, pool in self._pools.values():
+                pool.shutdown(wait=False, cancel_futures=True)
+            self._pools.clear()
         logger.info("Scanner thread stopped")
 
+    def _get_pool(self, name: str, size: int) -> ThreadPoolExecutor:
+        """Get a named worker pool, creating it on first use.
+
+        Pools outlive individual scans so each scan does not pay for
+        spinning up fresh threads; a pool is replaced only if its size changes.
+        A replaced pool finishes its queued work in the background, so this
+        never blocks, even when called from another pool's worker.
+
+        Args:
+            name: Pool name ("check" or "batch"), also used for thread names.
+            size: Number of worker threads.
+
+        Returns:
+            Thread pool with `size` workers.
+        """
+        with self._pools_lock:
+            entry = self._pools.get(name)
+            if entry is None or entry[0] != size:
+                if entry is not None:
+                    entry[1].shutdown(wait=False)
+                entry = (size, ThreadPoolExecutor(max_workers=size, thread_name_prefix=f"scanner-{name}"))
+                self._pools[name] = entry
+            return entry[1]
+
     def _signal_refresh(self) -> None:
         """Signal the scanner to refresh file contents for the current check.
         
         ⚠️ TEST ONLY: This method is intended for unit tests to simulate
-        file system change signals. Production code should rely on the
-        git watcher's file system monitoring.
+        file system change signals. Production code relies on _watch_loop.
         
         When files change, the scanner will continue from its current position
         with refreshed file contents, rather than restarting from the beginning.
@@ -119,6 +263,80 @@ class Scanner:
         logger.info("Refresh signal received - worktree changes detected by git watcher")
         self._refresh_event.set()
 
+    def _watch_loop(self) -> None:
+        """Queue changed paths and signal a refresh when the worktree changes.
+
+        Diffs git_watcher.worktree_snapshot() every fs_watch_interval seconds,
+        which only stats files, so edits wake the scanner loop promptly even
+        while git polling has backed off.
+
+        The wait stretches so snapshots take at most 1/_WATCH_DUTY_FACTOR of
+        the time. Watching stops (leaving change detection to git polling)
+        on worktrees with more than _WATCH_MAX_PATHS files, or once a
+        snapshot is so slow the stretched wait would exceed git_poll_interval.
+        """
+        try:
+            started = time.monotonic()
+            last_snapshot = self.git_watcher.worktree_snapshot()
+            elapsed = time.monotonic() - started
+        except Exception as e:
+            logger.warning(f"Worktree watching disabled: {e}")
+            return
+        if len(last_snapshot) > _WATCH_MAX_PATHS:
+            logger.info(
+                f"Worktree watching disabled: {len(last_snapshot)} files exceed "
+                f"{_WATCH_MAX_PATHS}; relying on git polling"
+            )
+            return
+
+        while True:
+            interval = max(self.config.fs_watch_interval, elapsed * _WATCH_DUTY_FACTOR)
+            if interval > max(self.config.fs_watch_interval, self.config.git_poll_interval):
+                logger.info(
+                    f"Worktree watching disabled: snapshots take {elapsed:.2f}s; "
+                    "relying on git polling"
+                )
+                return
+            if self._stop_event.wait(interval):
+                return
+            try:
+                started = time.monotonic()
+                snapshot = self.git_watcher.worktree_snapshot()
+                elapsed = time.monotonic() - started
+            except Exception as e:
+                logger.debug(f"Could not snapshot worktree: {e}")
+                continue
+            if snapshot == last_snapshot:
+                continue
+
+            changed = [path for path, stat in snapshot.items() if last_snapshot.get(path) != stat]
+            changed.extend(path for path in last_snapshot if path not in snapshot)
+            last_snapshot = snapshot
+            logger.debug(f"Worktree change detected in {len(changed)} path(s), signalling refresh")
+            self._changed_paths.extend(changed)
+            # Make sure the woken loop sees fresh git status, not the TTL cache
+            self.git_watcher.invalidate_cache()
+            self._refresh_event.set()
+
+    def _drain_changed_paths(self) -> Optional[set[str]]:
+        """Take the paths queued by _watch_loop since the last drain.
+
+        Returns:
+            The changed paths, or None if they are unknown (nothing queued,
+            e.g. a manual refresh signal, or the queue overflowed).
+        """
+        paths: set[str] = set()
+        count = 0
+        while True:
+            try:
+                paths.add(self._changed_paths.popleft())
+            except IndexError:
+                break
+            count += 1
+        if count == 0 or count >= _CHANGED_PATHS_MAX:
+            return None
+        return paths
+
     def _run_loop(self) -> None:
         """Main scanner loop."""
         logger.info("Scanner loop started")
@@ -131,47 +349,82 @@ class Scanner:
                 # Wait if merge/rebase in progress
                 if git_state.is_conflict_resolution_in_progress:
                     logger.info("Waiting for merge/rebase to complete...")
-                    time.sleep(self.config.git_poll_interval)
-                    continue
+                    # The worktree watcher signals when the merge markers go away
+                    if self._refresh_event.wait(timeout=self.config.git_poll_interval):
+                        self._refresh_event.clear()
 
                 # Wait if no changes
-                if not git_state.has_changes:
+                elif not git_state.has_changes:
                     logger.debug("No changes detected, waiting...")
                     # Clear tracking since files were committed/reverted
                     self._last_scanned_files.clear()
                     self._last_file_contents_hash.clear()
+                    self._checked_content.clear()
+                    self._file_cache.clear()
                     # Wait for refresh signal or timeout
-                    was_signaled = self._refresh_event.wait(timeout=self.config.git_poll_interval)
-                    self._refresh_event.clear()
-                    if was_signaled:
+                    if self._wait_idle():
                         logger.debug("Woke up from refresh signal (no changes state)")
-                    continue
 
                 # Check if files have actually changed since last scan
-                current_files = {f.path for f in git_state.changed_files if not f.is_deleted}
-                logger.debug(f"Checking if files changed: git_state.has_changes={git_state.has_changes}, "
-                            f"current_files={len(current_files)}")
-                has_changed = self._has_files_changed(current_files, git_state)
-                logger.debug(f"_has_files_changed returned: {has_changed}")
-                if has_changed:
+                elif self._has_files_changed(
+                    {f.path for f in git_state.changed_files if not f.is_deleted},
+                    git_state,
+                ):
                     # Clear refresh event before scan - any signals during scan will set it again
                     self._refresh_event.clear()
+                    self._changed_paths.clear()
                     # Run scan
                     self._run_scan(git_state)
+
                 else:
                     # No new changes - wait for refresh signal or timeout
                     logger.debug("No new file changes since last scan, waiting...")
-                    was_signaled = self._refresh_event.wait(timeout=self.config.git_poll_interval)
-                    self._refresh_event.clear()
-                    if was_signaled:
+                    if self._wait_idle():
                         logger.debug("Woke up from refresh signal (no content changes state)")
 
             except Exception as e:
                 logger.error(f"Scanner error: {e}", exc_info=True)
-                time.sleep(5)  # Brief pause before retrying
+                # Back off before retrying; only stop cuts the wait short, since a
+                # pending refresh signal would otherwise turn this into a busy loop
+                self._stop_event.wait(timeout=self._error_backoff)
+                self._error_backoff = min(self._error_backoff * 2, _ERROR_BACKOFF_MAX)
+            else:
+                self._error_backoff = _ERROR_BACKOFF_MIN
 
         logger.info("Scanner loop ended")
 
+    def _write_output(self, force: bool = False) -> None:
+        """Write the output file, at most once per output_write_interval.
+
+        Incremental writes during a scan rewrite the whole results file, so
+        they are rate-limited; the final write of a scan passes force=True.
+
+        Args:
+            force: Write regardless of when the last write happened.
+        """
+        with self._tracker_lock:
+            now = time.monotonic()
+            if not force and now - self._last_output_write < self.config.output_write_interval:
+                return
+            self.output_generator.write(self.issue_tracker, self._scan_info)
+            self._last_output_write = now
+
+    def _wait_idle(self) -> bool:
+        """Wait for a refresh signal while idle, backing off the poll interval.
+
+        Each consecutive idle timeout doubles the wait, from git_poll_interval
+        up to git_idle_poll_max. A refresh signal or a scan resets it.
+
+        Returns:
+            True if woken by a refresh signal, False on timeout.
+        """
+        base = self.config.git_poll_interval
+        timeout = min(base * (2 ** min(self._idle_ticks, 16)), max(base, self.config.git_idle_poll_max))
+        was_signaled = self._refresh_event.wait(timeout=timeout)
+        self._refresh_event.clear()
+        self._idle_ticks = 0 if was_signaled else self._idle_ticks + 1
+        return was_signaled
+
     def _is_file_ignored(self, file_path: str) -> bool:
         """Check if a file should be ignored from scanning.
         
@@ -196,12 +449,19 @@ class Scanner:
                 return True
         return False
 
-    def _has_files_changed(self, current_files: set[str], git_state: GitState) -> bool:
+    def _has_files_changed(
+        self,
+        current_files: set[str],
+        git_state: GitState,
+        changed_paths: Optional[set[str]] = None,
+    ) -> bool:
         """Check if files have changed since the last scan.
         
         Args:
             current_files: Set of current file paths (non-deleted).
             git_state: Current git state.
+            changed_paths: Paths known to have changed on disk, if known.
+                Only these are re-read for the content comparison.
             
         Returns:
             True if files have changed and need rescanning.
@@ -231,43 +491,45 @@ class Scanner:
         for changed_file in git_state.changed_files:
             if changed_file.is_deleted:
                 continue
+            if changed_paths is not None and changed_file.path not in changed_paths:
+                continue
             
             # Skip ignored files - they don't affect scan results
             # Skip early to avoid unnecessary hash checks and file reading
             if self._is_file_ignored(changed_file.path):
                 continue
             
-            file_path = self.config.target_directory / changed_file.path
             try:
-                # Use helper for safe file reading (handles encoding issues)
-                content = read_file_content(file_path)
+                # Served from the stat-keyed file cache when the file is unchanged,
+                # so idle polls do not re-read every changed file
+                content = self._read_text_file(changed_file.path)
                 if content is None:
                     # Binary or unreadable file - check if it's new
                     if changed_file.path not in self._last_scanned_files:
-                        logger.debug(f"New binary/unreadable file detected: {changed_file.path}")
+                        logger.debug("New binary/unreadable file detected: %s", changed_file.path)
                         return True
                     continue
                 
                 content_hash = hash(content)
                 
                 if changed_file.path not in self._last_file_contents_hash:
-                    logger.debug(f"New file detected: {changed_file.path}")
+                    logger.debug("New file detected: %s", changed_file.path)
                     return True
                 if self._last_file_contents_hash[changed_file.path] != content_hash:
-                    logger.debug(f"File content changed: {changed_file.path}")
+                    logger.debug("File content changed: %s", changed_file.path)
                     return True
             except OSError as e:
                 # File system error - file doesn't exist or can't be accessed
                 # Check if it's a new file (not in _last_scanned_files)
                 if changed_file.path not in self._last_scanned_files:
-                    logger.debug(f"New file detected (OSError): {changed_file.path}")
+                    logger.debug("New file detected (OSError): %s", changed_file.path)
                     return True
                 # Existing file that can't be read - skip it (don't assume it changed)
-                logger.debug(f"Cannot read existing file {changed_file.path}, skipping: {e}")
+                logger.debug("Cannot read existing file %s, skipping: %s", changed_file.path, e)
                 continue
             except Exception as e:
                 # Other errors (encoding, etc.) - assume it changed
-                logger.debug(f"Cannot read file {changed_file.path}, assuming changed: {e}")
+                logger.debug("Cannot read file %s, assuming changed: %s", changed_file.path, e)
                 return True
         
         logger.info("Refresh event processed: no actual file content changes detected")
@@ -284,8 +546,12 @@ class Scanner:
         Args:
             git_state: Current Git state with changed files.
         """
-        # Clear file cache since we're starting a new scan with potentially changed files
+        # Changes were found, so go back to polling at the base interval afterwards
+        self._idle_ticks = 0
+
+        # Clear file caches since we're starting a new scan with potentially changed files
         self.tool_executor.clear_file_cache()
+        self._file_exists_cache.clear()
         
         # Log changed files at the start of scan cycle
         changed_file_paths = [f.path for f in git_state.changed_files if not f.is_deleted]
@@ -295,20 +561,43 @@ class Scanner:
             files_to_log = changed_file_paths[:20]
             logger.info(f"Changed files: {files_to_log}{'...' if len(changed_file_paths) > 20 else ''}")
 
+        # Most productive checks first, so a stop or restart mid-scan cancels
+        # the least useful ones. Fixed for the whole scan: the watermark loop
+        # relies on checks keeping their indices across rebuilds.
+        check_yield = dict(self._check_yield)
+
+        # Content the latest check list was built from, i.e. what was scanned
+        scanned_content: dict[str, str] = {}
+
         # Build flat list of (check_group, check, filtered_batches) for index-based iteration
         # This needs to be rebuilt each iteration to get fresh file content
         def build_check_list() -> list[tuple[CheckGroup, str, list[dict[str, str]]]]:
             """Build list of checks with their filtered batches using fresh file content."""
+            nonlocal scanned_content
+            scanned_content = {}
             files_content = self._get_files_content(git_state.changed_files)
-            if not files_content:
+
+            # Files never read because their size alone rules them out
+            oversized = [
+                path for path in list(self._oversized_files)
+                if not self._is_file_ignored(path)
+            ]
+            if not files_content and not oversized:
                 return []
+            available_tokens = int(self.llm_client.context_limit * _FILE_CONTENT_SHARE)
+            for path in oversized:
+                logger.warning(
+                    f"Skipping oversized file: {path} "
+                    f"({self._oversized_files.get(path, 0)} bytes, "
+                    f"more than {available_tokens} tokens available)"
+                )
 
             # Filter out files matching ignore patterns
             filtered_content, ignored = self._filter_ignored_files(files_content)
             if ignored:
                 logger.debug(f"Ignoring {len(ignored)} file(s) matching ignore patterns")
             
-            if not filtered_content:
+            if not filtered_content and not oversized:
                 return []
 
             # Update scan info - preserve checks_run count across iterations
@@ -316,12 +605,17 @@ class Scanner:
             existing_total_checks = self._scan_info.get("total_checks", 0) if self._scan_info else 0
             self._scan_info = {
                 "files_scanned": list(filtered_content.keys()),
-                "skipped_files": ignored,
+                "skipped_files": ignored + oversized,
                 "checks_run": existing_checks_run,
                 "total_checks": existing_total_checks,
             }
 
+            if not filtered_content:
+                return []
+            scanned_content = filtered_content
+
             batches = self._create_batches(filtered_content)
+            self._serialized_batches.clear()
             
             check_list: list[tuple[CheckGroup, str, list[dict[str, str]]]] = []
             for check_group in self.config.check_groups:
@@ -334,7 +628,9 @@ class Scanner:
                 
                 for check in check_group.checks:
                     check_list.append((check_group, check, filtered_batches))
-            
+
+            # Stable sort: checks without history (or tied) keep config order
+            check_list.sort(key=lambda item: -check_yield.get(item[1], 1.0))
             return check_list
 
         # Reset scan info for new scan cycle
@@ -356,6 +652,19 @@ class Scanner:
 
         logger.info(f"Created {total_checks} check(s) to run")
 
+        # Independent checks can overlap their LLM round-trips
+        concurrency = min(self.config.llm_concurrency, total_checks)
+        executor: Optional[ThreadPoolExecutor] = None
+        if concurrency > 1:
+            executor = self._get_pool("check", concurrency)
+            logger.info(f"Running up to {concurrency} checks concurrently")
+        # LLM calls all run on the shared batch pool, which bounds the total
+        # in flight to llm_concurrency however many checks overlap. Create it
+        # here so concurrent checks all find it ready.
+        batch_concurrency = self.config.llm_concurrency
+        if batch_concurrency > 1:
+            self._get_pool("batch", batch_concurrency)
+
         # Watermark loop: run checks until no changes occur during the run
         while run_until > 0:
             iteration += 1
@@ -368,28 +677,49 @@ class Scanner:
                     break
 
             last_change_at: int | None = None
+            pending: dict[int, Future] = {}
 
             for check_idx in range(run_until):
                 if self._stop_event.is_set():
                     break
 
+                # Submit the next wave of checks when running concurrently;
+                # results are still consumed in check order below
+                if executor is not None and check_idx not in pending:
+                    wave_end = min(check_idx + concurrency, run_until)
+                    for wave_idx in range(check_idx, wave_end):
+                        _, wave_check, wave_batches = check_list[wave_idx]
+                        pending[wave_idx] = executor.submit(self._run_check, wave_check, wave_batches, batch_concurrency)
+
                 check_group, check, filtered_batches = check_list[check_idx]
-                logger.info(f"Running check {check_idx + 1}/{total_checks}: {check[:50]}...")
+                logger.info("Running check %s/%s: %s...", check_idx + 1, total_checks, check[:50])
 
                 try:
                     # Run check against filtered batches (uses fresh content per batch)
-                    check_issues = self._run_check(check, filtered_batches)
+                    future = pending.pop(check_idx, None)
+                    if future is not None:
+                        check_issues = future.result()
+                    else:
+                        check_issues = self._run_check(check, filtered_batches, batch_concurrency)
                     all_issues.extend(check_issues)
                     self._scan_info["checks_run"] += 1
 
-                    # Immediately add new issues to tracker
-                    if check_issues:
-                        new_count = self.issue_tracker.add_issues(check_issues)
-                        if new_count > 0:
-                            logger.info(f"Added {new_count} new issue(s) to tracker")
+                    with self._tracker_lock:
+                        # Only a check the LLM actually ran says anything about its yield
+                        if self._queried_batches.pop(check, 0):
+                            self._check_yield[check] = (
+                                (1 - _CHECK_YIELD_ALPHA) * self._check_yield.get(check, 1.0)
+                                + _CHECK_YIELD_ALPHA * len(check_issues)
+                            )
+
+                        # Immediately add new issues to tracker
+                        if check_issues:
+                            new_count = self.issue_tracker.add_issues(check_issues)
+                            if new_count > 0:
+                                logger.info("Added %s new issue(s) to tracker", new_count)
 
-                    # Update output file after every check for incremental progress
-                    self.output_generator.write(self.issue_tracker, self._scan_info)
+                        # Update output file for incremental progress (rate-limited)
+                        self._write_output()
 
                 except ContextOverflowError as e:
                     # Context overflow despite dynamic token tracking - this indicates
@@ -439,13 +769,20 @@ class Scanner:
                 if self._refresh_event.is_set():
                     self._refresh_event.clear()
                     # Verify content actually changed before triggering rescan
-                    # The git watcher uses mtime which can have false positives
+                    # The git watcher uses mtime which can have false positives;
+                    # only the paths it reported need re-reading
                     current_files = {f.path for f in git_state.changed_files if not f.is_deleted}
-                    if self._has_files_changed(current_files, git_state):
+                    if self._has_files_changed(current_files, git_state, self._drain_changed_paths()):
                         last_change_at = check_idx
-                        logger.info(f"Worktree changed at check {check_idx + 1}, will rescan checks 1-{check_idx + 1}")
+                        logger.info("Worktree changed at check %s, will rescan checks 1-%s", check_idx + 1, check_idx + 1)
                     else:
-                        logger.debug(f"Refresh event received at check {check_idx + 1}, but no actual content changes detected")
+                        logger.debug("Refresh event received at check %s, but no actual content changes detected", check_idx + 1)
+
+            # Drop checks submitted for a wave that was cut short by stop,
+            # and let any already running finish before the scan moves on
+            for future in pending.values():
+                future.cancel()
+            wait(pending.values())
 
             if self._stop_event.is_set():
                 break
@@ -468,11 +805,8 @@ class Scanner:
 
         # Determine which files have actually changed content since last scan
         # Only resolve issues for files with changed content (LLM results are non-deterministic)
-        files_content = self._get_files_content(git_state.changed_files)
-        files_content, _ = self._filter_ignored_files(files_content)
-        
         actually_changed_files: list[str] = []
-        for file_path, content in files_content.items():
+        for file_path, content in scanned_content.items():
             current_hash = hash(content)
             previous_hash = self._last_file_contents_hash.get(file_path)
             if previous_hash is None or current_hash != previous_hash:
@@ -490,19 +824,27 @@ class Scanner:
         logger.info(f"Scan complete: {new_count} new issues, {resolved_count} resolved")
 
         # Write output
-        self.output_generator.write(self.issue_tracker, self._scan_info)
+        self._write_output(force=True)
         logger.info(f"Output file updated with {self.issue_tracker.get_stats()['total']} total issues")
 
+        if self._result_cache is not None:
+            logger.info(
+                f"Result cache: {self._result_cache.hits} hit(s), "
+                f"{self._result_cache.misses} miss(es) since startup"
+            )
+            self._result_cache.save()
+
         # Track scanned files and their content hashes to avoid rescanning unchanged files
         # Store only non-ignored files to match what's in _last_file_contents_hash
         all_changed_paths = {f.path for f in git_state.changed_files if not f.is_deleted}
         all_changed_non_ignored = {f for f in all_changed_paths if not self._is_file_ignored(f)}
         self._last_scanned_files = all_changed_non_ignored
         
-        # Update hash tracking with current content (reuse files_content from above)
-        self._last_file_contents_hash = {}
-        for file_path, content in files_content.items():
-            self._last_file_contents_hash[file_path] = hash(content)
+        # Track the content that was scanned, so an edit that landed after the
+        # last rebuild still counts as a change on the next poll
+        self._last_file_contents_hash = {
+            file_path: hash(content) for file_path, content in scanned_content.items()
+        }
         logger.info("Scan cycle complete. Waiting for new file changes...")
 
     def _filter_batches_by_pattern(
@@ -539,7 +881,7 @@ class Scanner:
         """Get content of changed files.
 
         Uses FileFilter for unified filtering if available,
-        otherwise falls back to manual scanner_files check.
+        otherwise falls back to skipping the scanner's own output files.
 
         Args:
             changed_files: List of changed files.
@@ -548,6 +890,7 @@ class Scanner:
             Dictionary mapping file paths to content.
         """
         files_content: dict[str, str] = {}
+        to_read: list[str] = []
 
         for file_info in changed_files:
             if file_info.is_deleted:
@@ -557,33 +900,83 @@ class Scanner:
             if self._file_filter is not None:
                 should_skip, reason = self._file_filter.should_skip(file_info.path)
                 if should_skip:
-                    logger.debug(f"Skipping file (reason: {reason}): {file_info.path}")
-                    continue
-            else:
-                # Fallback: Files generated by code-scanner that should never be scanned
-                scanner_files = {
-                    self.config.output_file,  # code_scanner_results.md
-                    f"{self.config.output_file}.bak",  # code_scanner_results.md.bak
-                    self.config.log_file,     # code_scanner.log
-                }
-                if file_info.path in scanner_files:
-                    logger.debug(f"Skipping scanner output file: {file_info.path}")
+                    logger.debug("Skipping file (reason: %s): %s", reason, file_info.path)
                     continue
+            elif file_info.path in self._scanner_files:
+                logger.debug("Skipping scanner output file: %s", file_info.path)
+                continue
 
-            file_path = self.config.target_directory / file_info.path
+            to_read.append(file_info.path)
 
-            if is_binary_file(file_path):
-                logger.debug(f"Skipping binary file: {file_info.path}")
-                continue
+        # Forget files that are no longer changed
+        for path in self._file_cache.keys() - set(to_read):
+            del self._file_cache[path]
+        for path in self._oversized_files.keys() - set(to_read):
+            del self._oversized_files[path]
+
+        if not to_read:
+            return files_content
+
+        # Reads are blocking I/O, so overlap them on a small thread pool.
+        # map() keeps results in changed-file order.
+        if len(to_read) == 1:
+            results = [self._read_text_file(to_read[0])]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(_FILE_READ_WORKERS, len(to_read)),
+                thread_name_prefix="scanner-read",
+            ) as executor:
+                results = list(executor.map(self._read_text_file, to_read))
 
-            content = read_file_content(file_path)
+        for path, content in zip(to_read, results, strict=True):
             if content is not None:
-                files_content[file_info.path] = content
-            else:
-                logger.warning(f"Could not read file: {file_info.path}")
+                files_content[path] = content
 
         return files_content
 
+    def _read_text_file(self, relative_path: str) -> Optional[str]:
+        """Read a changed file for scanning.
+
+        Content is reused from the previous read while the file's mtime and
+        size are unchanged, so a rescan only re-reads files edited since.
+
+        Args:
+            relative_path: Path relative to the target directory.
+
+        Returns:
+            File content, or None if the file is binary, unreadable or too
+            large to fit in a batch.
+        """
+        file_path = self.config.target_directory / relative_path
+
+        # Reuse the previous read if the file's stat signature is unchanged
+        try:
+            st = os.stat(file_path)
+            signature: Optional[tuple[int, int]] = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            signature = None
+        cached = self._file_cache.get(relative_path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        # Don't read files too large to ever fit a batch (_create_batches
+        # would skip them anyway)
+        if signature is not None:
+            available_tokens = int(self.llm_client.context_limit * _FILE_CONTENT_SHARE)
+            if signature[1] > available_tokens * CHARS_PER_TOKEN * _MAX_BYTES_PER_CHAR:
+                self._file_cache.pop(relative_path, None)
+                self._oversized_files[relative_path] = signature[1]
+                return None
+        self._oversized_files.pop(relative_path, None)
+
+        content = read_if_text(file_path)
+        if content is None:
+            self._file_cache.pop(relative_path, None)
+            logger.debug("Skipping binary or unreadable file: %s", relative_path)
+        elif signature is not None and time.time_ns() - signature[0] > _RACY_MTIME_NS:
+            self._file_cache[relative_path] = (signature, content)
+        return content
+
     def _filter_ignored_files(
         self,
         files_content: dict[str, str],
@@ -622,7 +1015,7 @@ class Scanner:
             for pattern_group in ignore_patterns:
                 if pattern_group.matches_file(file_path):
                     should_ignore = True
-                    logger.debug(f"File '{file_path}' matches ignore pattern '{pattern_group.pattern}'")
+                    logger.debug("File '%s' matches ignore pattern '%s'", file_path, pattern_group.pattern)
                     break
 
             if should_ignore:
@@ -647,32 +1040,31 @@ class Scanner:
         context_limit = self.llm_client.context_limit
 
         # Reserve tokens for prompt overhead, tool calling, and response
-        # Using 55% for file content leaves 45% for system prompt & tools
-        available_tokens = int(context_limit * 0.55)
+        available_tokens = int(context_limit * _FILE_CONTENT_SHARE)
         
+        # Estimate each file once; the counts are reused by every packing step below
+        token_counts = {path: estimate_tokens(c) for path, c in files_content.items()}
+
         # Try all files together first
-        total_tokens = sum(estimate_tokens(c) for c in files_content.values())
+        total_tokens = sum(token_counts.values())
         if total_tokens <= available_tokens:
             return [files_content]
 
         # Group by directory hierarchy
-        batches: list[dict[str, str]] = []
         groups = group_files_by_directory(list(files_content.keys()))
         
         # Ensure skipped_files list exists
         if "skipped_files" not in self._scan_info:
             self._scan_info["skipped_files"] = []
 
-        current_batch: dict[str, str] = {}
-        current_tokens = 0
-
+        # Packing items: a directory that fits in one batch stays whole so
+        # related files are analyzed together; larger directories are split
+        # into individual files.
+        items: list[tuple[int, str, list[str]]] = []  # (tokens, dir_path, file_paths)
         for dir_path, file_paths in groups.items():
-            dir_content: dict[str, str] = {}
-            dir_tokens = 0
-
+            kept: list[str] = []
             for file_path in file_paths:
-                content = files_content[file_path]
-                tokens = estimate_tokens(content)
+                tokens = token_counts[file_path]
 
                 # Skip files that alone exceed the limit
                 if tokens > available_tokens:
@@ -683,47 +1075,78 @@ class Scanner:
                     self._scan_info["skipped_files"].append(file_path)
                     continue
 
-                dir_content[file_path] = content
-                dir_tokens += tokens
+                kept.append(file_path)
 
-            if not dir_content:
+            if not kept:
                 continue
 
-            # Check if directory group fits in current batch
-            if current_tokens + dir_tokens <= available_tokens:
-                current_batch.update(dir_content)
-                current_tokens += dir_tokens
+            dir_tokens = sum(token_counts[p] for p in kept)
+            if dir_tokens <= available_tokens:
+                items.append((dir_tokens, dir_path, kept))
             else:
-                # Try to fit individual files
-                if dir_tokens <= available_tokens:
-                    # Start new batch with this directory
-                    if current_batch:
-                        batches.append(current_batch)
-                    current_batch = dir_content
-                    current_tokens = dir_tokens
-                else:
-                    # Split directory into individual files
-                    if current_batch:
-                        batches.append(current_batch)
-                        current_batch = {}
-                        current_tokens = 0
-
-                    for file_path, content in dir_content.items():
-                        tokens = estimate_tokens(content)
-                        if current_tokens + tokens <= available_tokens:
-                            current_batch[file_path] = content
-                            current_tokens += tokens
-                        else:
-                            if current_batch:
-                                batches.append(current_batch)
-                            current_batch = {file_path: content}
-                            current_tokens = tokens
+                items.extend((token_counts[p], dir_path, [p]) for p in kept)
 
-        if current_batch:
-            batches.append(current_batch)
+        # First-fit decreasing: place the largest items first, each into the
+        # earliest batch with room. This needs far fewer batches (and thus
+        # LLM calls) than filling batches in directory order.
+        items.sort(key=lambda item: (-item[0], item[1]))
+
+        batches: list[dict[str, str]] = []
+        remaining: list[int] = []  # Free tokens per batch
+        for tokens, _, file_paths in items:
+            target = next((i for i, free in enumerate(remaining) if tokens <= free), None)
+            if target is None:
+                target = len(batches)
+                batches.append({})
+                remaining.append(available_tokens)
+
+            for file_path in file_paths:
+                batches[target][file_path] = files_content[file_path]
+            remaining[target] -= tokens
 
         return batches
 
+    def _unchecked_files(self, check_query: str, batch: dict[str, str]) -> dict[str, str]:
+        """Drop files this check has already analyzed with identical content.
+
+        Args:
+            check_query: The check query about to run.
+            batch: File batch content.
+
+        Returns:
+            The batch itself if every file needs checking, otherwise a new
+            dict with only the files that do (possibly empty).
+        """
+        unchecked = {
+            file_path: content
+            for file_path, content in batch.items()
+            if self._checked_content.get((check_query, file_path)) != hash(content)
+        }
+        return batch if len(unchecked) == len(batch) else unchecked
+
+    def _serialize_batch(self, batch: dict[str, str]) -> str:
+        """Get the serialized file section for a batch, reusing earlier work.
+
+        Batches filtered per check group or per check are new dicts holding
+        the same content strings, so entries are keyed by path and content
+        identity: every check that sends the same files shares one
+        serialization of the (potentially large) file section.
+
+        Args:
+            batch: File batch content.
+
+        Returns:
+            Serialized file section for the batch.
+        """
+        key = tuple((path, id(batch[path])) for path in sorted(batch))
+        cached = self._serialized_batches.get(key)
+        if cached is not None:
+            return cached[1]
+
+        serialized = serialize_files(batch)
+        self._serialized_batches[key] = (list(batch.values()), serialized)
+        return serialized
+
     def _parse_issues_from_response(
         self,
         response: dict[str, Any],
@@ -744,7 +1167,9 @@ class Scanner:
             List of parsed Issue objects with valid file paths.
         """
         issues_data = response.get("issues", [])
-        logger.info(f"LLM returned {len(issues_data)} issue(s) for batch {batch_idx + 1}")
+        logger.info("LLM returned %s issue(s) for batch %s", len(issues_data), batch_idx + 1)
+        if not issues_data:
+            return []
         timestamp = datetime.now(timezone.utc)
 
         parsed_issues: list[Issue] = []
@@ -766,8 +1191,11 @@ class Scanner:
                     skipped_count += 1
                     continue
                 
-                file_path = self.config.target_directory / issue.file_path
-                if not file_path.is_file():
+                exists = self._file_exists_cache.get(issue.file_path)
+                if exists is None:
+                    exists = (self.config.target_directory / issue.file_path).is_file()
+                    self._file_exists_cache[issue.file_path] = exists
+                if not exists:
                     logger.warning(
                         f"Skipping issue for non-existent file: {issue.file_path} "
                         f"(LLM hallucination or stale reference)"
@@ -776,12 +1204,13 @@ class Scanner:
                     continue
                 
                 parsed_issues.append(issue)
-                logger.debug(f"Parsed issue: {issue.file_path}:{issue.line_number}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Parsed issue: %s:%s", issue.file_path, issue.line_number)
             except Exception as e:
                 logger.warning(f"Failed to parse issue: {e}, data: {issue_data}")
 
         if skipped_count > 0:
-            logger.info(f"Skipped {skipped_count} issue(s) with invalid or non-existent file paths")
+            logger.info("Skipped %s issue(s) with invalid or non-existent file paths", skipped_count)
         
         return parsed_issues
 
@@ -789,6 +1218,7 @@ class Scanner:
         self,
         check_query: str,
         batches: list[dict[str, str]],
+        concurrency: int = 1,
     ) -> list[Issue]:
         """Run a single check against all batches with AI tool support.
 
@@ -798,44 +1228,161 @@ class Scanner:
         Args:
             check_query: The check query to run.
             batches: List of file batches.
+            concurrency: Size of the shared batch pool (1 = run batches sequentially
+                on the calling thread).
 
         Returns:
-            List of issues found.
+            List of issues found, in batch order.
         """
         all_issues: list[Issue] = []
 
-        for batch_idx, batch in enumerate(batches):
-            if self._stop_event.is_set():
-                break
+        if concurrency <= 1:
+            for batch_idx, batch in enumerate(batches):
+                if self._stop_event.is_set():
+                    break
+                all_issues.extend(self._run_batch(check_query, batch, batch_idx, len(batches)))
+            return all_issues
+
+        # Batches are independent, so overlap their LLM round-trips on the shared
+        # batch pool; the first failure propagates and batches not yet started
+        # are dropped (a retried check skips the batches that did finish)
+        executor = self._get_pool("batch", concurrency)
+        futures = [
+            executor.submit(self._run_batch, check_query, batch, batch_idx, len(batches))
+            for batch_idx, batch in enumerate(batches)
+        ]
+        try:
+            for future in futures:
+                all_issues.extend(future.result())
+        except BaseException:
+            # Don't let the remaining batches of a failed check hold up the pool
+            for future in futures:
+                future.cancel()
+            raise
 
-            logger.debug(f"Processing batch {batch_idx + 1}/{len(batches)}")
+        return all_issues
 
-            # Run check with tool support (may involve multiple rounds)
-            batch_issues = self._run_check_with_tools(
-                check_query=check_query,
-                batch=batch,
-                batch_idx=batch_idx,
+    def _run_batch(
+        self,
+        check_query: str,
+        batch: dict[str, str],
+        batch_idx: int,
+        total_batches: int,
+    ) -> list[Issue]:
+        """Run a check against one batch and record its issues.
+
+        Args:
+            check_query: The check query to run.
+            batch: File batch content (path -> content).
+            batch_idx: Index of the batch, for logging.
+            total_batches: Number of batches in the check, for logging.
+
+        Returns:
+            List of issues found in the batch.
+        """
+        if self._stop_event.is_set():
+            return []
+
+        # Only send files whose content changed since this check last ran on them;
+        # issues for the others are still in the tracker from that run
+        batch = self._unchecked_files(check_query, batch)
+        if not batch:
+            logger.info("Skipping batch %s/%s: unchanged since last checked", batch_idx + 1, total_batches)
+            return []
+
+        logger.debug("Processing batch %s/%s", batch_idx + 1, total_batches)
+
+        cache_key: Optional[str] = None
+        cached: Optional[list[dict[str, Any]]] = None
+        if self._result_cache is not None:
+            cache_key = ResultCache.make_key(
+                check_query, batch, self.llm_client.model_id, _PROMPT_VERSION
             )
-            all_issues.extend(batch_issues)
+            cached = self._result_cache.get(cache_key)
+
+        answered = True  # False if the LLM never gave a final answer
+        if cached is not None:
+            logger.info("Using cached result for batch %s/%s", batch_idx + 1, total_batches)
+            batch_issues = self._parse_issues_from_response({"issues": cached}, check_query, batch_idx)
+        else:
+            # Run check with tool support (may involve multiple rounds)
+            try:
+                result = self._run_check_with_tools(
+                    check_query=check_query,
+                    batch=batch,
+                    batch_idx=batch_idx,
+                )
+            except PromptTooLargeError as e:
+                if len(batch) < 2:
+                    logger.warning("Skipping batch %s/%s: %s", batch_idx + 1, total_batches, e)
+                    result = None
+                else:
+                    # The client's size estimate disagrees with the one the batch
+                    # was packed with; check the two halves separately
+                    logger.info("Batch %s/%s too large for the model, splitting it", batch_idx + 1, total_batches)
+                    paths = list(batch)
+                    half = len(paths) // 2
+                    return [
+                        issue
+                        for part in (paths[:half], paths[half:])
+                        for issue in self._run_batch(
+                            check_query, {path: batch[path] for path in part}, batch_idx, total_batches
+                        )
+                    ]
+            answered = result is not None
+            batch_issues = result if result is not None else []
+            # An unanswered batch means "unknown", not "no issues", so it must
+            # not be cached
+            if answered and cache_key is not None:
+                self._result_cache.set(cache_key, [
+                    {
+                        "file": issue.file_path,
+                        "line_number": issue.line_number,
+                        "description": issue.description,
+                        "suggested_fix": issue.suggested_fix,
+                        "code_snippet": issue.code_snippet,
+                    }
+                    for issue in batch_issues
+                ])
+
+        # Identical files are sent once under the first path; give each copy
+        # the issues reported for it
+        copies = identical_file_copies(batch)
+        if copies:
+            batch_issues = batch_issues + [
+                dataclasses.replace(issue, file_path=copy_path)
+                for issue in batch_issues
+                for copy_path in copies.get(issue.file_path, ())
+            ]
+
+        # Only an answered batch counts as checked; otherwise the next scan
+        # must query it again rather than skip it as unchanged
+        if answered:
+            for file_path, content in batch.items():
+                self._checked_content[(check_query, file_path)] = hash(content)
+
+        with self._tracker_lock:
+            if cached is None and answered:
+                self._queried_batches[check_query] = self._queried_batches.get(check_query, 0) + 1
 
             # Immediately add batch issues to tracker and update output
             if batch_issues:
                 new_count = self.issue_tracker.add_issues(batch_issues)
                 if new_count > 0:
-                    logger.info(f"Added {new_count} new issue(s) from batch {batch_idx + 1}")
+                    logger.info("Added %s new issue(s) from batch %s", new_count, batch_idx + 1)
 
-            # Update output after each batch for immediate feedback
-            self.output_generator.write(self.issue_tracker, self._scan_info)
-            logger.info(f"Output updated after batch {batch_idx + 1}/{len(batches)}")
+            # Update output after each batch for immediate feedback (rate-limited)
+            self._write_output()
+        logger.info("Finished batch %s/%s", batch_idx + 1, total_batches)
 
-        return all_issues
+        return batch_issues
 
     def _run_check_with_tools(
         self,
         check_query: str,
         batch: dict[str, str],
         batch_idx: int,
-    ) -> list[Issue]:
+    ) -> Optional[list[Issue]]:
         """Run a check with iterative tool calling support.
 
         This method handles the conversation loop:
@@ -850,12 +1397,13 @@ class Scanner:
             batch_idx: Batch index for logging.
 
         Returns:
-            List of issues found.
+            List of issues found, or None if the LLM gave no final answer
+            within the tool iteration limit.
         """
         # Build initial user prompt
-        user_prompt = build_user_prompt(check_query, batch)
-        logger.info(f"Sending query to LLM: {check_query}")
-        logger.debug(f"User prompt length: {len(user_prompt)} chars")
+        user_prompt = build_check_prompt(check_query, self._serialize_batch(batch))
+        logger.info("Sending query to LLM: %s", check_query)
+        logger.debug("User prompt length: %s chars", len(user_prompt))
 
         # Conversation history for multi-turn interactions
         messages = [
@@ -869,11 +1417,8 @@ class Scanner:
         max_context_tokens = int(context_limit * context_safety_threshold)
         
         # Track accumulated tokens
-        accumulated_tokens = (
-            estimate_tokens(SYSTEM_PROMPT_TEMPLATE) + 
-            estimate_tokens(user_prompt)
-        )
-        logger.debug(f"Initial context usage: {accumulated_tokens} tokens ({accumulated_tokens * 100 // context_limit}% of {context_limit})")
+        accumulated_tokens = _SYSTEM_PROMPT_TOKENS + estimate_tokens(user_prompt)
+        logger.debug("Initial context usage: %s tokens (%s%% of %s)", accumulated_tokens, accumulated_tokens * 100 // context_limit, context_limit)
 
         # Calculate dynamic iteration limit based on available context
         # Estimate average tokens per tool call (conservative estimate)
@@ -883,7 +1428,7 @@ class Scanner:
         
         # Cap at 50 to prevent endless loops, but use context-based limit if smaller
         max_tool_iterations = min(estimated_possible_iterations, 50)
-        logger.debug(f"Max tool iterations set to {max_tool_iterations} (based on context: {estimated_possible_iterations}, capped at 50)")
+        logger.debug("Max tool iterations set to %s (based on context: %s, capped at 50)", max_tool_iterations, estimated_possible_iterations)
         
         iteration = 0
 
@@ -903,7 +1448,7 @@ class Scanner:
                 if "tool_calls" in response:
                     tool_calls = response["tool_calls"]
                     tool_names = [tc["tool_name"] for tc in tool_calls]
-                    logger.info(f"LLM requested {len(tool_calls)} tool call(s): {', '.join(tool_names)} (iteration {iteration})")
+                    logger.info("LLM requested %s tool call(s): %s (iteration %s)", len(tool_calls), ', '.join(tool_names), iteration)
 
                     # Execute all requested tools
                     tool_results = []
@@ -912,22 +1457,23 @@ class Scanner:
                         arguments = tool_call["arguments"]
 
                         # Log tool execution with compact argument summary
-                        args_summary = self._format_tool_args_for_log(tool_name, arguments)
-                        logger.info(f"  → {tool_name}: {args_summary}")
+                        if logger.isEnabledFor(logging.INFO):
+                            args_summary = self._format_tool_args_for_log(tool_name, arguments)
+                            logger.info("  → %s: %s", tool_name, args_summary)
 
-                        logger.debug(f"Executing tool: {tool_name} with args: {arguments}")
+                        logger.debug("Executing tool: %s with args: %s", tool_name, arguments)
                         result = self.tool_executor.execute_tool(tool_name, arguments)
 
                         # Format tool result for LLM
                         if result.success:
                             result_msg = f"Tool {tool_name} succeeded:\n{self._format_tool_result(result)}"
                             if result.warning:
-                                logger.info(f"  ✓ {tool_name} completed with warning: {result.warning[:100]}...")
+                                logger.info("  ✓ %s completed with warning: %s...", tool_name, result.warning[:100])
                                 result_msg = f"{result.warning}\n\n{result_msg}"
                             else:
-                                logger.info(f"  ✓ {tool_name} completed successfully")
+                                logger.info("  ✓ %s completed successfully", tool_name)
                         else:
-                            logger.info(f"  ✗ {tool_name} failed: {result.error}")
+                            logger.info("  ✗ %s failed: %s", tool_name, result.error)
                             result_msg = f"Tool {tool_name} failed: {result.error}"
 
                         tool_results.append(result_msg)
@@ -940,7 +1486,7 @@ class Scanner:
                     new_total = accumulated_tokens + tool_results_tokens
                     context_usage_pct = new_total * 100 // context_limit
                     
-                    logger.debug(f"Context usage after tools: {new_total} tokens ({context_usage_pct}% of {context_limit})")
+                    logger.debug("Context usage after tools: %s tokens (%s%% of %s)", new_total, context_usage_pct, context_limit)
                     
                     if new_total > max_context_tokens:
                         # Approaching context limit - ask LLM to finalize with current info
@@ -979,16 +1525,18 @@ class Scanner:
 
                 else:
                     # LLM provided final answer (no more tool calls)
-                    logger.debug(f"LLM provided final answer after {iteration} iteration(s)")
+                    logger.debug("LLM provided final answer after %s iteration(s)", iteration)
                     return self._parse_issues_from_response(response, check_query, batch_idx)
 
+            except PromptTooLargeError:
+                raise
             except LLMClientError as e:
                 logger.error(f"Check failed after retries: {e}")
                 raise
 
         # Max iterations reached
-        logger.warning(f"Max tool iterations ({max_tool_iterations}) reached, using last response")
-        return []
+        logger.warning(f"Max tool iterations ({max_tool_iterations}) reached without a final answer")
+        return None
 
     def _format_tool_args_for_log(self, tool_name: str, arguments: dict) -> str:
         """Format tool arguments for compact logging.
@@ -1046,11 +1594,8 @@ class Scanner:
         Returns:
             Formatted string representation.
         """
-        import json
-
-        if isinstance(result.data, dict):
-            return json.dumps(result.data, indent=2)
-        elif isinstance(result.data, list):
-            return json.dumps(result.data, indent=2)
+        if isinstance(result.data, (dict, list)):
+            # Unindented so the C encoder is used; indentation also costs tokens
+            return json.dumps(result.data, ensure_ascii=False)
         else:
             return str(result.data)
@@ -1,6 +1,7 @@
 """Text utilities for string processing and fuzzy matching."""
 
-import difflib
+import heapq
+import os
 from pathlib import Path
 from typing import Optional
 
@@ -9,6 +10,12 @@ from typing import Optional
 MAX_OUTPUT_LINES = 2000
 MAX_OUTPUT_BYTES = 50 * 1024  # 50KB
 
+# Directories never searched for file suggestions (hidden ones are skipped too)
+_EXCLUDED_DIRS = frozenset({"node_modules", "__pycache__", "build", "dist", "target", ".git"})
+
+# Cap on candidate files collected by suggest_similar_files
+_MAX_SUGGESTION_CANDIDATES = 10000
+
 
 def levenshtein_distance(s1: str, s2: str) -> int:
     """Calculate the Levenshtein distance between two strings.
@@ -23,27 +30,53 @@ def levenshtein_distance(s1: str, s2: str) -> int:
     Returns:
         Edit distance between the strings.
     """
+    if s1 == s2:
+        return 0
     if len(s1) < len(s2):
-        return levenshtein_distance(s2, s1)
+        s1, s2 = s2, s1
+
+    # A shared prefix or suffix never adds edits, so only the differing
+    # middle needs the O(n*m) table (similar file names share most of theirs)
+    start = 0
+    end1, end2 = len(s1), len(s2)
+    while start < end2 and s1[start] == s2[start]:
+        start += 1
+    while end2 > start and s1[end1 - 1] == s2[end2 - 1]:
+        end1 -= 1
+        end2 -= 1
+    s1 = s1[start:end1]
+    s2 = s2[start:end2]
 
     if len(s2) == 0:
         return len(s1)
 
-    previous_row = range(len(s2) + 1)
+    previous_row = list(range(len(s2) + 1))
     for i, c1 in enumerate(s1):
         current_row = [i + 1]
+        left = i + 1
         for j, c2 in enumerate(s2):
-            insertions = previous_row[j + 1] + 1
-            deletions = current_row[j] + 1
-            substitutions = previous_row[j] + (c1 != c2)
-            current_row.append(min(insertions, deletions, substitutions))
+            # min(insertion, deletion, substitution)
+            cost = previous_row[j] + (c1 != c2)
+            above = previous_row[j + 1] + 1
+            if above < cost:
+                cost = above
+            if left + 1 < cost:
+                cost = left + 1
+            current_row.append(cost)
+            left = cost
         previous_row = current_row
 
     return previous_row[-1]
 
 
 def similarity_ratio(s1: str, s2: str) -> float:
-    """Calculate similarity ratio between two strings using SequenceMatcher.
+    """Calculate similarity ratio between two strings.
+
+    The ratio is 2 * LCS / (len(s1) + len(s2)), where LCS is the length of
+    the longest common subsequence (the normalized indel similarity). It is
+    computed with a bit-parallel algorithm (Hyyrö), one big-int operation
+    per character of s2. Unlike difflib.SequenceMatcher there is no
+    autojunk heuristic, and scores are never lower than SequenceMatcher's.
     
     Args:
         s1: First string.
@@ -52,7 +85,36 @@ def similarity_ratio(s1: str, s2: str) -> float:
     Returns:
         Similarity ratio between 0.0 (completely different) and 1.0 (identical).
     """
-    return difflib.SequenceMatcher(None, s1, s2).ratio()
+    total = len(s1) + len(s2)
+    if not total:
+        return 1.0
+    return 2.0 * _lcs_length(s1, s2) / total
+
+
+def _lcs_length(s1: str, s2: str) -> int:
+    """Length of the longest common subsequence, using bit-parallel LCS."""
+    if not s1 or not s2:
+        return 0
+
+    # Bit i of masks[c] is set where s1[i] == c
+    masks: dict[str, int] = {}
+    for i, c in enumerate(s1):
+        masks[c] = masks.get(c, 0) | (1 << i)
+
+    full = (1 << len(s1)) - 1
+    v = full
+    for c in s2:
+        u = v & masks.get(c, 0)
+        v = ((v + u) | (v - u)) & full
+
+    # Each cleared bit is one character of the common subsequence
+    return len(s1) - v.bit_count()
+
+
+def _length_ratio_bound(s1: str, s2: str) -> float:
+    """Upper bound on similarity_ratio(s1, s2) from the string lengths alone."""
+    total = len(s1) + len(s2)
+    return 2.0 * min(len(s1), len(s2)) / total if total else 1.0
 
 
 def fuzzy_match(target: str, candidate: str, threshold: float = 0.7) -> bool:
@@ -86,15 +148,17 @@ def find_similar_strings(
     Returns:
         List of (candidate, similarity) tuples, sorted by similarity descending.
     """
+    # The length bound rejects most candidates before the full comparison
     results = []
     for candidate in candidates:
+        if _length_ratio_bound(target, candidate) < threshold:
+            continue
         ratio = similarity_ratio(target, candidate)
         if ratio >= threshold:
             results.append((candidate, ratio))
     
-    # Sort by similarity descending
-    results.sort(key=lambda x: x[1], reverse=True)
-    return results[:max_results]
+    # Highest similarity first; ties keep candidate order
+    return heapq.nlargest(max_results, results, key=lambda x: x[1])
 
 
 def normalize_whitespace(text: str) -> str:
@@ -130,22 +194,25 @@ def truncate_output(
     was_truncated = False
     hint = ""
     
-    # Check byte limit first
-    content_bytes = content.encode('utf-8')
-    if len(content_bytes) > max_bytes:
-        # Truncate to approximately max_bytes
-        content = content_bytes[:max_bytes].decode('utf-8', errors='ignore')
-        was_truncated = True
-        hint = (
-            f"⚠️ OUTPUT TRUNCATED: Content exceeded {max_bytes // 1024}KB limit. "
-            "Use search_text to find specific patterns or read_file with line range."
-        )
+    # Check byte limit first. A character is 1-4 bytes in UTF-8, so only
+    # the first max_bytes characters ever need encoding.
+    if len(content) * 4 > max_bytes:
+        head_bytes = content[:max_bytes].encode('utf-8')
+        if len(head_bytes) > max_bytes or len(content) > max_bytes:
+            # Truncate to approximately max_bytes
+            content = head_bytes[:max_bytes].decode('utf-8', errors='ignore')
+            was_truncated = True
+            hint = (
+                f"⚠️ OUTPUT TRUNCATED: Content exceeded {max_bytes // 1024}KB limit. "
+                "Use search_text to find specific patterns or read_file with line range."
+            )
     
-    # Then check line limit
-    lines = content.split('\n')
-    if len(lines) > max_lines:
-        lines = lines[:max_lines]
-        content = '\n'.join(lines)
+    # Then check line limit, cutting at the max_lines-th newline
+    if content.count('\n') >= max_lines:
+        cut = -1
+        for _ in range(max_lines):
+            cut = content.find('\n', cut + 1)
+        content = content[:max(cut, 0)]
         was_truncated = True
         hint = (
             f"⚠️ OUTPUT TRUNCATED: Content exceeded {max_lines} lines. "
@@ -170,49 +237,61 @@ def suggest_similar_files(
     Returns:
         List of similar file paths.
     """
-    target_name = Path(target_path).name
     target_parts = Path(target_path).parts
+    target_name = target_parts[-1] if target_parts else ""
+    target_parent = "/".join(target_parts[:-1])
     
-    # Collect candidate files
+    # Collect (path, name, parent) candidates, pruning hidden and build
+    # directories before descending into them. Parents are "/"-joined so
+    # scores don't depend on the platform separator.
     candidates = []
+    stack = [("", "", str(directory))]
     try:
-        for file_path in directory.rglob("*"):
-            if not file_path.is_file():
+        # Limit search to avoid slowness on large repos
+        while stack and len(candidates) <= _MAX_SUGGESTION_CANDIDATES:
+            rel_dir, parent, dir_path = stack.pop()
+            try:
+                entries = os.scandir(dir_path)
+            except OSError:
                 continue
-            
-            # Skip hidden files and common build directories
-            relative_path = file_path.relative_to(directory)
-            if any(part.startswith(".") for part in relative_path.parts):
-                continue
-            if any(
-                part in {"node_modules", "__pycache__", "build", "dist", "target", ".git"}
-                for part in relative_path.parts
-            ):
-                continue
-            
-            candidates.append(str(relative_path))
-            
-            # Limit search to avoid slowness on large repos
-            if len(candidates) > 10000:
-                break
+            with entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.startswith(".") or name in _EXCLUDED_DIRS:
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append((
+                            rel_dir + name + os.sep,
+                            f"{parent}/{name}" if parent else name,
+                            entry.path,
+                        ))
+                    elif entry.is_file():
+                        candidates.append((rel_dir + name, name, parent))
+                        if len(candidates) > _MAX_SUGGESTION_CANDIDATES:
+                            break
     except Exception:
         return []
     
     # Score each candidate
     scored = []
-    for candidate in candidates:
-        candidate_name = Path(candidate).name
-        candidate_parts = Path(candidate).parts
+    for candidate, candidate_name, candidate_parent in candidates:
+        compare_parents = bool(target_parent) and bool(candidate_parent)
+
+        # Cheap upper bound first: a ratio can't exceed 2*min(len)/(sum of
+        # lens), so skip hopeless candidates
+        bound = _length_ratio_bound(target_name, candidate_name) * 0.7
+        if compare_parents:
+            bound += _length_ratio_bound(target_parent, candidate_parent) * 0.3
+        if bound <= 0.3:
+            continue
         
         # Name similarity is most important
         name_sim = similarity_ratio(target_name, candidate_name)
         
         # Path component similarity is secondary
         path_sim = 0.0
-        if len(target_parts) > 1 and len(candidate_parts) > 1:
+        if compare_parents:
             # Compare parent directories
-            target_parent = "/".join(target_parts[:-1])
-            candidate_parent = "/".join(candidate_parts[:-1])
             path_sim = similarity_ratio(target_parent, candidate_parent)
         
         # Combined score (name weighted more heavily)
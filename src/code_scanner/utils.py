@@ -190,26 +190,45 @@ def read_file_content(file_path: Path) -> str | None:
     Returns:
         File content as string, or None if binary/unreadable.
     """
-    if is_binary_file(file_path):
+    return read_if_text(file_path)
+
+
+def read_if_text(file_path: Path, sniff_bytes: int = 8192) -> str | None:
+    """Read a text file with a single open, returning None for binary files.
+
+    Applies the same checks as is_binary_file() to the first sniff_bytes
+    of the file before reading the rest, instead of opening it twice.
+    Decodes as UTF-8 with a latin-1 fallback and normalizes newlines like
+    a text-mode read.
+
+    Args:
+        file_path: Path to the file to read.
+        sniff_bytes: Number of leading bytes checked for null bytes.
+
+    Returns:
+        File content as string, or None if binary/unreadable.
+    """
+    if file_path.suffix.lower() in BINARY_EXTENSIONS:
         return None
 
     try:
-        with open(file_path, encoding="utf-8") as f:
-            return f.read()
-    except UnicodeDecodeError:
-        # Try with fallback encoding
-        try:
-            with open(file_path, encoding="latin-1") as f:
-                return f.read()
-        except Exception as e:
-            logger.warning(f"Failed to read {file_path} with fallback encoding: {e}")
-            return None
-    except (OSError, IOError) as e:
+        with open(file_path, "rb") as f:
+            head = f.read(sniff_bytes)
+            if b"\x00" in head:
+                return None
+            data = head + f.read()
+    except OSError as e:
         logger.warning(f"Could not read file {file_path}: {e}")
         return None
 
+    try:
+        text = data.decode("utf-8")
+    except UnicodeDecodeError:
+        text = data.decode("latin-1")
 
-
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
 
 
 def setup_logging(log_file: Path, debug: bool = False) -> None:
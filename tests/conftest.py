@@ -46,6 +46,39 @@ def skip_without_integration(integration_enabled):
         pytest.skip("Integration tests disabled. Use --run-integration to enable.")
 
 
+@pytest.fixture(autouse=True)
+def reset_ollama_context_limit_cache():
+    """Clear the process-wide Ollama context limit cache between tests."""
+    from code_scanner import ollama_client
+
+    ollama_client._CONTEXT_LIMIT_CACHE.clear()
+    yield
+    ollama_client._CONTEXT_LIMIT_CACHE.clear()
+
+
+@pytest.fixture
+def route_ollama_urlopen():
+    """Route a mocked urlopen to per-endpoint Ollama responses.
+
+    OllamaClient.connect() queries /api/tags and /api/show concurrently,
+    so tests cannot rely on call order. Pass a list of responses (or
+    exceptions to raise) per endpoint name, e.g. tags=[...], show=[...].
+    """
+    def _route(mock_urlopen: MagicMock, **responses: list) -> None:
+        queues = {endpoint: list(items) for endpoint, items in responses.items()}
+
+        def _urlopen(request, timeout=None):
+            url = request if isinstance(request, str) else request.full_url
+            item = queues[url.rsplit("/", 1)[-1]].pop(0)
+            if isinstance(item, BaseException):
+                raise item
+            return item
+
+        mock_urlopen.side_effect = _urlopen
+
+    return _route
+
+
 @pytest.fixture
 def temp_dir() -> Generator[Path, None, None]:
     """Create a temporary directory for tests."""
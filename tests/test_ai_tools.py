@@ -338,6 +338,16 @@ class TestAIToolExecutor:
         assert not result.success
         assert "Cannot read binary file" in result.error
 
+    def test_read_file_text_skips_binary_sniff(self, temp_repo):
+        """Test that a successful read does not sniff the file separately."""
+        executor = AIToolExecutor(temp_repo, 8192, make_mock_ctags(temp_repo))
+
+        with patch("code_scanner.ai_tools.is_binary_file") as mock_sniff:
+            result = executor.execute_tool("read_file", {"file_path": "src/main.py"})
+
+        assert result.success
+        mock_sniff.assert_not_called()
+
     def test_read_file_with_line_range(self, temp_repo):
         """Test reading a file with specific line range."""
         executor = AIToolExecutor(temp_repo, 8192, make_mock_ctags(temp_repo))
@@ -950,6 +960,28 @@ class TestPaginationSupport:
 class TestAdditionalCoverage:
     """Additional tests to increase code coverage."""
 
+    def test_file_cache_shared_across_threads(self, tmp_path):
+        """Test that concurrent reads keep the file cache bounded and consistent."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        executor = AIToolExecutor(
+            target_directory=tmp_path,
+            context_limit=8192,
+            ctags_index=make_mock_ctags(tmp_path),
+        )
+        executor._file_cache_max_size = 10
+        paths = []
+        for i in range(50):
+            path = tmp_path / f"f{i}.py"
+            path.write_text(f"x = {i}\n")
+            paths.append(path)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            contents = list(pool.map(executor._get_file_content, paths * 4))
+
+        assert contents == [f"x = {i}\n" for i in range(50)] * 4
+        assert len(executor._file_cache) <= executor._file_cache_max_size
+
     def test_search_text_skips_gitignored_directories(self, temp_repo):
         """Test that search_text respects .gitignore (ripgrep default behavior)."""
         # Create a .gitignore file
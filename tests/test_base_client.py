@@ -8,7 +8,11 @@ from code_scanner.base_client import (
     LLMClientError,
     ContextOverflowError,
     SYSTEM_PROMPT_TEMPLATE,
+    build_check_prompt,
     build_user_prompt,
+    identical_file_copies,
+    serialize_files,
+    retry_backoff_delay,
 )
 
 
@@ -244,3 +248,77 @@ class TestBuildUserPrompt:
         assert "L1: line1" in prompt
         assert "L2: " in prompt  # Empty line still gets number
         assert "L3: line3" in prompt
+
+    def test_check_query_follows_files(self):
+        """Test that the check query is placed after the file section."""
+        prompt = build_user_prompt(
+            check_query="Check for bugs",
+            files_content={"test.py": "pass"},
+        )
+
+        assert prompt.index("<<<FILE_END>>>") < prompt.index("Check for bugs")
+
+    def test_shared_prefix_across_checks(self):
+        """Test that different checks on the same batch share the file prefix."""
+        files_content = {"b.py": "b = 2", "a.py": "a = 1"}
+        first = build_user_prompt("First check", files_content)
+        second = build_user_prompt("Second check", dict(reversed(files_content.items())))
+
+        prefix = first[:first.index("## Check to perform")]
+        assert second.startswith(prefix)
+        assert prefix.index("a.py") < prefix.index("b.py")
+
+
+class TestSerializeFiles:
+    """Tests for serialize_files and build_check_prompt."""
+
+    def test_matches_build_user_prompt(self):
+        """Test that prompts built from a serialized batch are identical."""
+        files_content = {"a.py": "x = 1", "b.py": "y = 2\nz = 3"}
+
+        serialized = serialize_files(files_content)
+
+        assert build_check_prompt("Check", serialized) == build_user_prompt("Check", files_content)
+
+    def test_no_check_query(self):
+        """Test that the serialized section contains only files."""
+        serialized = serialize_files({"a.py": "x = 1"})
+
+        assert serialized.startswith("## Files to analyze:")
+        assert "Check to perform" not in serialized
+
+
+class TestIdenticalFiles:
+    """Tests for identical_file_copies and duplicate handling in serialize_files."""
+
+    def test_groups_by_content(self):
+        """Test that copies map from the first sorted path to the others."""
+        files_content = {"c.py": "same", "a.py": "same", "b.py": "other", "d.py": "same"}
+
+        assert identical_file_copies(files_content) == {"a.py": ["c.py", "d.py"]}
+
+    def test_duplicate_content_sent_once(self):
+        """Test that a duplicated body appears once with its copies listed."""
+        files_content = {"pkg/__init__.py": "x = 1", "lib/__init__.py": "x = 1"}
+
+        serialized = serialize_files(files_content)
+
+        assert serialized.count("<<<FILE_START>>>") == 1
+        assert "### File: lib/__init__.py" in serialized
+        assert "Identical copies" in serialized
+        assert "pkg/__init__.py" in serialized
+
+
+class TestRetryBackoffDelay:
+    """Tests for retry_backoff_delay helper."""
+
+    def test_grows_exponentially(self):
+        """Test that delays double per attempt, plus bounded jitter."""
+        for attempt, expected in enumerate([0.5, 1.0, 2.0, 4.0]):
+            delay = retry_backoff_delay(attempt)
+            assert expected <= delay <= expected + 0.25
+
+    def test_capped(self):
+        """Test that the delay never exceeds the cap plus jitter."""
+        delay = retry_backoff_delay(20, cap=30.0)
+        assert 30.0 <= delay <= 30.25
@@ -199,6 +199,32 @@ class TestApplicationSetup:
             
             mock_output.write.assert_called_once()
 
+    @pytest.mark.parametrize("enabled", [True, False])
+    def test_setup_honors_result_cache_setting(self, mock_config, enabled):
+        """Setup only gives the scanner a result cache when it is enabled."""
+        app = Application(mock_config)
+        mock_config.result_cache_enabled = enabled
+
+        mock_llm = MagicMock()
+        mock_llm.backend_name = "LM Studio"
+
+        with patch.object(app, '_acquire_lock'), \
+             patch.object(app, '_backup_existing_output', return_value=None), \
+             patch('code_scanner.cli.setup_logging'), \
+             patch('code_scanner.cli.verify_ripgrep'), \
+             patch('code_scanner.cli.GitWatcher'), \
+             patch('code_scanner.cli.create_llm_client', return_value=mock_llm), \
+             patch('code_scanner.cli.IssueTracker'), \
+             patch('code_scanner.cli.OutputGenerator'), \
+             patch('code_scanner.cli.CtagsIndex'), \
+             patch('code_scanner.cli.ResultCache') as mock_result_cache, \
+             patch('code_scanner.cli.Scanner') as mock_scanner:
+
+            app._setup()
+
+            expected = mock_result_cache.return_value if enabled else None
+            assert mock_scanner.call_args.kwargs["result_cache"] is expected
+
 
 class TestApplicationMainLoop:
     """Tests for Application _run_main_loop method."""
@@ -137,6 +137,128 @@ context_limit = 16384
         
         assert config.llm.context_limit == 16384
 
+    def test_llm_concurrency_from_config(self, temp_dir: Path):
+        """Test that concurrency is read from [llm] and defaults to 1."""
+        config_file = temp_dir / "config.toml"
+        base = """
+checks = ["test check"]
+
+[llm]
+backend = "lm-studio"
+host = "localhost"
+port = 1234
+context_limit = 16384
+"""
+        config_file.write_text(base)
+        assert load_config(temp_dir, config_file).llm_concurrency == 1
+
+        config_file.write_text(base + "concurrency = 3\n")
+        assert load_config(temp_dir, config_file).llm_concurrency == 3
+
+    @pytest.mark.parametrize("value", ["0", "-1", "1.5", '"2"', "true"])
+    def test_invalid_llm_concurrency_raises_error(self, temp_dir: Path, value: str):
+        """Test that concurrency must be a positive integer."""
+        config_file = temp_dir / "config.toml"
+        config_file.write_text(f"""
+checks = ["test check"]
+
+[llm]
+backend = "lm-studio"
+host = "localhost"
+port = 1234
+context_limit = 16384
+concurrency = {value}
+""")
+
+        with pytest.raises(ConfigError) as exc_info:
+            load_config(temp_dir, config_file)
+
+        assert "concurrency" in str(exc_info.value)
+
+    def test_watch_interval_from_config(self, temp_dir: Path):
+        """Test that [watch] interval sets fs_watch_interval."""
+        config_file = temp_dir / "config.toml"
+        config_file.write_text("""
+checks = ["test check"]
+
+[llm]
+backend = "lm-studio"
+host = "localhost"
+port = 1234
+context_limit = 16384
+
+[watch]
+interval = 0
+""")
+
+        config = load_config(temp_dir, config_file)
+
+        assert config.fs_watch_interval == 0.0
+
+    @pytest.mark.parametrize("body", ["interval = -1", 'interval = "fast"', "enabled = true"])
+    def test_invalid_watch_section_raises_error(self, temp_dir: Path, body: str):
+        """Test that [watch] rejects bad intervals and unknown keys."""
+        config_file = temp_dir / "config.toml"
+        config_file.write_text(f"""
+checks = ["test check"]
+
+[llm]
+backend = "lm-studio"
+host = "localhost"
+port = 1234
+context_limit = 16384
+
+[watch]
+{body}
+""")
+
+        with pytest.raises(ConfigError) as exc_info:
+            load_config(temp_dir, config_file)
+
+        assert "[watch]" in str(exc_info.value)
+
+    def test_cache_enabled_from_config(self, temp_dir: Path):
+        """Test that [cache] enabled sets result_cache_enabled."""
+        config_file = temp_dir / "config.toml"
+        config_file.write_text("""
+checks = ["test check"]
+
+[llm]
+backend = "lm-studio"
+host = "localhost"
+port = 1234
+context_limit = 16384
+
+[cache]
+enabled = false
+""")
+
+        config = load_config(temp_dir, config_file)
+
+        assert config.result_cache_enabled is False
+
+    @pytest.mark.parametrize("body", ["enabled = 0", 'enabled = "no"', "ttl = 60"])
+    def test_invalid_cache_section_raises_error(self, temp_dir: Path, body: str):
+        """Test that [cache] rejects non-boolean values and unknown keys."""
+        config_file = temp_dir / "config.toml"
+        config_file.write_text(f"""
+checks = ["test check"]
+
+[llm]
+backend = "lm-studio"
+host = "localhost"
+port = 1234
+context_limit = 16384
+
+[cache]
+{body}
+""")
+
+        with pytest.raises(ConfigError) as exc_info:
+            load_config(temp_dir, config_file)
+
+        assert "[cache]" in str(exc_info.value)
+
     def test_commit_hash_passed_through(self, temp_dir: Path):
         """Test that commit hash is passed through to config."""
         config_file = temp_dir / "config.toml"
@@ -452,6 +574,23 @@ class TestCheckGroupPatternMatching:
         # Neither matches
         assert group.matches_file("src/main.cpp") is False
 
+    def test_pattern_change_is_picked_up(self):
+        """Test that the compiled matcher follows changes to the pattern."""
+        group = CheckGroup(pattern="*.cpp", checks=["test"])
+        assert group.matches_file("main.cpp") is True
+
+        group.pattern = "*.py"
+
+        assert group.matches_file("main.cpp") is False
+        assert group.matches_file("main.py") is True
+
+    def test_compiled_matcher_ignored_in_equality(self):
+        """Test that matching does not affect CheckGroup equality."""
+        used = CheckGroup(pattern="*.cpp", checks=["test"])
+        used.matches_file("main.cpp")
+
+        assert used == CheckGroup(pattern="*.cpp", checks=["test"])
+
     def test_directory_pattern_nested_path(self):
         """Test directory pattern matching in deeply nested paths."""
         group = CheckGroup(pattern="/*node_modules*/", checks=[])
@@ -385,6 +385,26 @@ class TestFileFilterMutations:
         assert filter.is_gitignored("file.pyc") is False
 
 
+    def test_add_config_patterns_invalidates_cached_decisions(self, tmp_path):
+        """A path checked before a pattern is added is re-evaluated after."""
+        filter = FileFilter(repo_path=tmp_path)
+        assert filter.should_skip("notes.txt") == (False, "")
+
+        filter.add_config_patterns("*.txt")
+
+        assert filter.should_skip("notes.txt") == (True, "config_pattern:*.txt")
+
+    def test_should_skip_memoized(self, tmp_path):
+        """Repeated checks of a path do not re-run the pattern matching."""
+        filter = FileFilter(repo_path=tmp_path, config_ignore_patterns=["*.md"])
+
+        with patch.object(filter, "_check_path", wraps=filter._check_path) as mock_check:
+            for _ in range(3):
+                assert filter.should_skip("README.md")[0] is True
+
+        assert mock_check.call_count == 1
+
+
 class TestFileFilterWithoutPathspec:
     """Tests for graceful degradation without pathspec."""
 
@@ -263,3 +263,69 @@ class TestGitWatcher:
             watcher.connect()
         
         assert "Invalid commit hash" in str(exc_info.value)
+
+
+class TestWorktreeSnapshot:
+    """Tests for GitWatcher.worktree_snapshot."""
+
+    def test_unchanged_worktree_is_stable(self, git_repo: Path):
+        """Test that the snapshot is stable without changes."""
+        watcher = GitWatcher(git_repo)
+        watcher.connect()
+
+        snapshot = watcher.worktree_snapshot()
+
+        assert "README.md" in snapshot
+        assert ".git/HEAD" in snapshot
+        assert watcher.worktree_snapshot() == snapshot
+
+    def test_edit_create_and_delete_show_up(self, git_repo: Path):
+        """Test that edited, created and deleted files differ between snapshots."""
+        watcher = GitWatcher(git_repo)
+        watcher.connect()
+        (git_repo / "old.py").write_text("x = 1\n")
+        before = watcher.worktree_snapshot()
+
+        (git_repo / "README.md").write_text("Edited content\n")
+        (git_repo / "new.py").write_text("y = 2\n")
+        (git_repo / "old.py").unlink()
+        after = watcher.worktree_snapshot()
+
+        assert after["README.md"] != before["README.md"]
+        assert "new.py" in after and "new.py" not in before
+        assert "old.py" in before and "old.py" not in after
+
+    @pytest.mark.parametrize("marker", ["MERGE_HEAD", "REBASE_HEAD"])
+    def test_merge_marker_shows_up(self, git_repo: Path, marker: str):
+        """Test that finishing a merge or rebase changes the snapshot."""
+        watcher = GitWatcher(git_repo)
+        watcher.connect()
+        marker_path = git_repo / ".git" / marker
+        marker_path.write_text("0" * 40 + "\n")
+        during = watcher.worktree_snapshot()
+
+        marker_path.unlink()
+
+        assert f".git/{marker}" in during
+        assert f".git/{marker}" not in watcher.worktree_snapshot()
+
+    def test_excluded_and_ignored_paths_skipped(self, git_repo: Path):
+        """Test that excluded files and gitignored directories are left out."""
+        from code_scanner.file_filter import FileFilter
+
+        (git_repo / ".gitignore").write_text("build/\n")
+        (git_repo / "build").mkdir()
+        (git_repo / "build" / "out.o").write_text("binary")
+        (git_repo / "results.md").write_text("# Results")
+        watcher = GitWatcher(
+            git_repo,
+            excluded_files={"results.md"},
+            file_filter=FileFilter(git_repo),
+        )
+        watcher.connect()
+
+        snapshot = watcher.worktree_snapshot()
+
+        assert "build/out.o" not in snapshot
+        assert "results.md" not in snapshot
+        assert ".gitignore" in snapshot
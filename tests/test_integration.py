@@ -214,8 +214,12 @@ def hello():
         config.output_file = "results.md"
         config.log_file = "scanner.log"
         config.git_poll_interval = 1.0
+        config.git_idle_poll_max = 120
+        config.fs_watch_interval = 0
         config.llm_retry_interval = 1.0
         config.max_llm_retries = 3
+        config.llm_concurrency = 1
+        config.output_write_interval = 2.0
         config.check_groups = [
             CheckGroup(pattern="*.py", checks=["Check for unused imports"]),
         ]
@@ -259,8 +263,12 @@ def hello():
         config.output_file = "results.md"
         config.log_file = "scanner.log"
         config.git_poll_interval = 1.0
+        config.git_idle_poll_max = 120
+        config.fs_watch_interval = 0
         config.llm_retry_interval = 1.0
         config.max_llm_retries = 3
+        config.llm_concurrency = 1
+        config.output_write_interval = 2.0
         config.check_groups = [
             CheckGroup(
                 pattern="*.cpp, *.h",
@@ -11,6 +11,7 @@ from code_scanner.lmstudio_client import (
     build_user_prompt,
     SYSTEM_PROMPT_TEMPLATE,
 )
+from code_scanner.base_client import ISSUES_JSON_SCHEMA
 from code_scanner.config import LLMConfig
 
 
@@ -140,6 +141,25 @@ class TestLMStudioClientQuery:
         assert result == {"issues": []}
         assert client._supports_json_format is False
 
+    def test_query_requests_issues_schema(self):
+        """Query without tools asks for schema-constrained output."""
+        config = LLMConfig(backend="lm-studio", host="localhost", port=1234, context_limit=16384)
+        client = LMStudioClient(config)
+        client._client = MagicMock()
+        client._model_id = "test-model"
+        client._context_limit = 8000
+
+        success_response = MagicMock()
+        success_response.choices = [MagicMock()]
+        success_response.choices[0].message.content = '{"issues": []}'
+        client._client.chat.completions.create.return_value = success_response
+
+        client.query("system", "user")
+
+        response_format = client._client.chat.completions.create.call_args.kwargs["response_format"]
+        assert response_format["type"] == "json_schema"
+        assert response_format["json_schema"]["schema"] == ISSUES_JSON_SCHEMA
+
     def test_query_connection_lost(self):
         """Query raises error on connection loss."""
         config = LLMConfig(backend="lm-studio", host="localhost", port=1234, context_limit=16384)
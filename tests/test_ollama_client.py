@@ -3,10 +3,11 @@
 import pytest
 from unittest.mock import patch, MagicMock
 import json
+import threading
 import urllib.error
 
 from code_scanner.ollama_client import OllamaClient
-from code_scanner.base_client import LLMClientError, ContextOverflowError
+from code_scanner.base_client import LLMClientError, ContextOverflowError, ISSUES_JSON_SCHEMA
 from code_scanner.models import LLMConfig
 
 
@@ -44,6 +45,14 @@ class TestOllamaClientInit:
         with pytest.raises(LLMClientError):
             _ = client.model_id
 
+    def test_uses_slots(self, ollama_config: LLMConfig):
+        """Test that instances have no per-instance __dict__."""
+        client = OllamaClient(ollama_config)
+
+        assert not hasattr(client, "__dict__")
+        with pytest.raises(AttributeError):
+            client.unexpected_attribute = True
+
 
 class TestOllamaClientConnect:
     """Tests for OllamaClient connection."""
@@ -74,7 +83,7 @@ class TestOllamaClientConnect:
         assert "model" in str(exc_info.value).lower()
 
     @patch("code_scanner.ollama_client.urllib.request.urlopen")
-    def test_connect_success(self, mock_urlopen, ollama_config: LLMConfig):
+    def test_connect_success(self, mock_urlopen, ollama_config: LLMConfig, route_ollama_urlopen):
         """Test successful connection."""
         # First call for /api/tags
         tags_response = MagicMock()
@@ -92,7 +101,7 @@ class TestOllamaClientConnect:
         show_response.__enter__ = MagicMock(return_value=show_response)
         show_response.__exit__ = MagicMock(return_value=False)
         
-        mock_urlopen.side_effect = [tags_response, show_response]
+        route_ollama_urlopen(mock_urlopen, tags=[tags_response], show=[show_response])
         
         client = OllamaClient(ollama_config)
         client.connect()
@@ -100,6 +109,32 @@ class TestOllamaClientConnect:
         assert client.model_id == "llama3"
         assert client.context_limit == 8192
 
+    @patch("code_scanner.ollama_client.urllib.request.urlopen")
+    def test_connect_fetches_context_limit_concurrently(self, mock_urlopen, ollama_config: LLMConfig):
+        """Test that /api/show is in flight while /api/tags is still pending."""
+        show_started = threading.Event()
+
+        def make_response(payload):
+            response = MagicMock()
+            response.read.return_value = json.dumps(payload).encode()
+            response.__enter__ = MagicMock(return_value=response)
+            response.__exit__ = MagicMock(return_value=False)
+            return response
+
+        def urlopen(request, timeout=None):
+            if isinstance(request, str):  # /api/tags
+                assert show_started.wait(timeout=5), "/api/show was not issued concurrently"
+                return make_response({"models": [{"name": "llama3:latest"}]})
+            show_started.set()
+            return make_response({"modelinfo": {"num_ctx": 8192}})
+
+        mock_urlopen.side_effect = urlopen
+
+        client = OllamaClient(ollama_config)
+        client.connect()
+
+        assert client.context_limit == 8192
+
     @patch("code_scanner.ollama_client.urllib.request.urlopen")
     def test_connect_model_not_found(self, mock_urlopen, ollama_config: LLMConfig):
         """Test connection when model not found."""
@@ -138,6 +173,73 @@ class TestOllamaClientConnect:
         
         assert "no models available" in str(exc_info.value).lower()
 
+    @patch("code_scanner.ollama_client.urllib.request.urlopen")
+    def test_connect_tagged_model_matches_untagged_name(self, mock_urlopen, route_ollama_urlopen):
+        """Test that 'llama3:8b' matches an installed 'llama3' but not 'llama3:70b'."""
+        config = LLMConfig(
+            backend="ollama",
+            host="localhost",
+            port=11434,
+            model="llama3:8b",
+            timeout=120,
+        )
+        tags_response = MagicMock()
+        tags_response.read.return_value = json.dumps({
+            "models": [{"name": "llama3"}]
+        }).encode()
+        tags_response.__enter__ = MagicMock(return_value=tags_response)
+        tags_response.__exit__ = MagicMock(return_value=False)
+        show_response = MagicMock()
+        show_response.read.return_value = json.dumps({"modelinfo": {"num_ctx": 8192}}).encode()
+        show_response.__enter__ = MagicMock(return_value=show_response)
+        show_response.__exit__ = MagicMock(return_value=False)
+        route_ollama_urlopen(mock_urlopen, tags=[tags_response], show=[show_response])
+
+        client = OllamaClient(config)
+        client.connect()
+        assert client.model_id == "llama3:8b"
+
+        tags_response.read.return_value = json.dumps({
+            "models": [{"name": "llama3:70b"}]
+        }).encode()
+        route_ollama_urlopen(mock_urlopen, tags=[tags_response])  # /api/show cached
+
+        with pytest.raises(LLMClientError) as exc_info:
+            OllamaClient(config).connect()
+        assert "not found" in str(exc_info.value).lower()
+
+    @pytest.mark.parametrize("model, installed", [
+        ("reg:5000/m", "reg:5000/m:latest"),
+        ("reg:5000/m:latest", "reg:5000/m"),
+        ("a:b", "a:b:c"),
+        ("a:b:c", "a:b"),
+        ("a", "a:b:c"),
+    ])
+    @patch("code_scanner.ollama_client.urllib.request.urlopen")
+    def test_connect_matches_registry_and_multi_colon_names(self, mock_urlopen, model, installed):
+        """Test that tags are split at the last colon, never inside host:port."""
+        config = LLMConfig(
+            backend="ollama",
+            host="localhost",
+            port=11434,
+            model=model,
+            timeout=120,
+        )
+        tags_response = MagicMock()
+        tags_response.read.return_value = json.dumps({"models": [{"name": installed}]}).encode()
+        tags_response.__enter__ = MagicMock(return_value=tags_response)
+        tags_response.__exit__ = MagicMock(return_value=False)
+        show_response = MagicMock()
+        show_response.read.return_value = json.dumps({"modelinfo": {"num_ctx": 8192}}).encode()
+        show_response.__enter__ = MagicMock(return_value=show_response)
+        show_response.__exit__ = MagicMock(return_value=False)
+        mock_urlopen.side_effect = [tags_response, show_response]
+
+        client = OllamaClient(config)
+        client.connect()
+
+        assert client.model_id == model
+
     @patch("code_scanner.ollama_client.urllib.request.urlopen")
     def test_connect_ollama_not_running(self, mock_urlopen, ollama_config: LLMConfig):
         """Test connection when Ollama is not running."""
@@ -269,6 +371,91 @@ class TestOllamaClientQuery:
         assert mock_urlopen.call_count == 2
 
 
+    @patch("code_scanner.ollama_client.urllib.request.urlopen")
+    def test_query_request_body_reuses_encoded_prompt(self, mock_urlopen, ollama_config: LLMConfig):
+        """Test that the request body is valid and system prompt/tools encodings are reused."""
+        client = OllamaClient(ollama_config)
+        client._connected = True
+        client._model_id = "llama3:latest"
+        client._context_limit = 8192
+
+        query_response = MagicMock()
+        query_response.read.return_value = json.dumps({
+            "message": {"content": '{"issues": []}'},
+        }).encode()
+        query_response.__enter__ = MagicMock(return_value=query_response)
+        query_response.__exit__ = MagicMock(return_value=False)
+        mock_urlopen.return_value = query_response
+
+        tools = [{"type": "function", "function": {"name": "read_file"}}]
+        client.query("system \"prompt\"", "first", tools=tools)
+        encoded_system = client._encoded_system_message
+        encoded_tools = client._encoded_tools
+        client.query("system \"prompt\"", "second", tools=tools)
+
+        assert client._encoded_system_message is encoded_system
+        assert client._encoded_tools is encoded_tools
+
+        body = json.loads(mock_urlopen.call_args.args[0].data)
+        assert body == {
+            "model": "llama3:latest",
+            "stream": False,
+            "options": {"temperature": 0.1, "num_ctx": 8192},
+            "messages": [
+                {"role": "system", "content": "system \"prompt\""},
+                {"role": "user", "content": "second"},
+            ],
+            "tools": tools,
+        }
+
+    @patch("code_scanner.ollama_client.urllib.request.urlopen")
+    def test_query_without_tools_requests_issues_schema(self, mock_urlopen, ollama_config: LLMConfig):
+        """Test that the final answer is constrained to the issues schema."""
+        client = OllamaClient(ollama_config)
+        client._connected = True
+        client._model_id = "llama3:latest"
+
+        query_response = MagicMock()
+        query_response.read.return_value = json.dumps({
+            "message": {"content": '{"issues": []}'},
+        }).encode()
+        query_response.__enter__ = MagicMock(return_value=query_response)
+        query_response.__exit__ = MagicMock(return_value=False)
+        mock_urlopen.return_value = query_response
+
+        client.query("system", "user")
+
+        body = json.loads(mock_urlopen.call_args.args[0].data)
+        assert body["format"] == ISSUES_JSON_SCHEMA
+
+    @patch("code_scanner.ollama_client.urllib.request.urlopen")
+    def test_query_falls_back_when_schema_unsupported(self, mock_urlopen, ollama_config: LLMConfig):
+        """Test that an older server rejecting the schema gets prompt-only JSON."""
+        client = OllamaClient(ollama_config)
+        client._connected = True
+        client._model_id = "llama3:latest"
+
+        error_body = MagicMock()
+        error_body.read.return_value = b'{"error": "invalid format"}'
+        http_error = urllib.error.HTTPError(
+            "http://localhost:11434/api/chat", 400, "Bad Request", {}, error_body
+        )
+        query_response = MagicMock()
+        query_response.read.return_value = json.dumps({
+            "message": {"content": '{"issues": []}'},
+        }).encode()
+        query_response.__enter__ = MagicMock(return_value=query_response)
+        query_response.__exit__ = MagicMock(return_value=False)
+        mock_urlopen.side_effect = [http_error, query_response]
+
+        with patch("code_scanner.ollama_client.time.sleep"):
+            result = client.query("system", "user")
+
+        assert result == {"issues": []}
+        assert client._supports_json_format is False
+        assert "format" not in json.loads(mock_urlopen.call_args.args[0].data)
+
+
 class TestOllamaClientContextLimit:
     """Tests for context limit handling."""
 
@@ -327,7 +514,7 @@ class TestOllamaClientContextLimit:
             client.set_context_limit(-1000)
 
     @patch("code_scanner.ollama_client.urllib.request.urlopen")
-    def test_config_limit_exceeds_model_raises_error(self, mock_urlopen):
+    def test_config_limit_exceeds_model_raises_error(self, mock_urlopen, route_ollama_urlopen):
         """Test that config context_limit > model context_limit raises error."""
         config = LLMConfig(
             backend="ollama",
@@ -354,7 +541,7 @@ class TestOllamaClientContextLimit:
         show_response.__enter__ = MagicMock(return_value=show_response)
         show_response.__exit__ = MagicMock(return_value=False)
         
-        mock_urlopen.side_effect = [tags_response, show_response]
+        route_ollama_urlopen(mock_urlopen, tags=[tags_response], show=[show_response])
         
         client = OllamaClient(config)
         
@@ -364,6 +551,35 @@ class TestOllamaClientContextLimit:
         assert "context limit" in str(exc_info.value).lower()
 
 
+    @patch("code_scanner.ollama_client.urllib.request.urlopen")
+    def test_context_limit_lookup_shared_across_instances(
+        self, mock_urlopen, ollama_config: LLMConfig, route_ollama_urlopen
+    ):
+        """Test that /api/show is only queried once per (host, model)."""
+        def make_response(payload):
+            response = MagicMock()
+            response.read.return_value = json.dumps(payload).encode()
+            response.__enter__ = MagicMock(return_value=response)
+            response.__exit__ = MagicMock(return_value=False)
+            return response
+
+        tags_payload = {"models": [{"name": "llama3:latest"}]}
+        route_ollama_urlopen(
+            mock_urlopen,
+            tags=[make_response(tags_payload), make_response(tags_payload)],
+            show=[make_response({"modelinfo": {"num_ctx": 8192}})],  # Queried once
+        )
+
+        first = OllamaClient(ollama_config)
+        first.connect()
+        second = OllamaClient(ollama_config)
+        second.connect()
+
+        assert first.context_limit == 8192
+        assert second.context_limit == 8192
+        assert mock_urlopen.call_count == 3
+
+
 class TestOllamaClientModelInfo:
     """Tests for model information retrieval."""
 
@@ -426,6 +642,24 @@ class TestStripMarkdownFences:
         result = client._strip_markdown_fences(content)
         assert result == '{"issues": []}'
 
+    def test_strip_fences_case_insensitive_language_and_whitespace(self, client: OllamaClient):
+        """Test ```JSON fences with surrounding whitespace are stripped."""
+        content = '  \n```JSON  \n{"issues": []}\n```  \n'
+        result = client._strip_markdown_fences(content)
+        assert result == '{"issues": []}'
+
+    def test_unclosed_fence_unchanged(self, client: OllamaClient):
+        """Test content with only an opening fence is returned stripped but intact."""
+        content = '```json\n{"issues": []}'
+        result = client._strip_markdown_fences(content)
+        assert result == content
+
+    def test_inner_fences_preserved(self, client: OllamaClient):
+        """Test fences inside the payload (e.g. in code snippets) are kept."""
+        content = '```json\n{"code_snippet": "```py\\nx\\n```"}\n```'
+        result = client._strip_markdown_fences(content)
+        assert result == '{"code_snippet": "```py\\nx\\n```"}'
+
 
 class TestBuildUserPrompt:
     """Tests for build_user_prompt function."""
@@ -1,10 +1,19 @@
 
-import pytest
-from unittest.mock import patch, MagicMock
 import json
 import urllib.error
-from code_scanner.ollama_client import OllamaClient, LLMClientError, ContextOverflowError
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from code_scanner import ollama_client
 from code_scanner.models import LLMConfig
+from code_scanner.ollama_client import (
+    ContextOverflowError,
+    LLMClientError,
+    OllamaClient,
+    PromptTooLargeError,
+)
+
 
 class TestOllamaClientCoverage:
     """Additional tests for OllamaClient execution coverage."""
@@ -20,7 +29,7 @@ class TestOllamaClientCoverage:
         )
 
     @patch("code_scanner.ollama_client.urllib.request.urlopen")
-    def test_get_model_context_limit_alternatives(self, mock_urlopen, ollama_config):
+    def test_get_model_context_limit_alternatives(self, mock_urlopen, ollama_config, route_ollama_urlopen):
         """Test getting context limit from different fields in the response."""
         # Setup common mocks
         tags_response = MagicMock()
@@ -48,7 +57,11 @@ class TestOllamaClientCoverage:
         resp3.__enter__ = MagicMock(return_value=resp3)
         resp3.__exit__ = MagicMock(return_value=False)
 
-        mock_urlopen.side_effect = [tags_response, resp1, tags_response, resp2, tags_response, resp3]
+        route_ollama_urlopen(
+            mock_urlopen,
+            tags=[tags_response, tags_response, tags_response],
+            show=[resp1, resp2, resp3],
+        )
 
         # Test Case 1
         client1 = OllamaClient(ollama_config)
@@ -56,18 +69,20 @@ class TestOllamaClientCoverage:
         assert client1.context_limit == 4096
 
         # Test Case 2
+        ollama_client._CONTEXT_LIMIT_CACHE.clear()
         client2 = OllamaClient(ollama_config)
         client2.connect()
         assert client2.context_limit == 2048
 
         # Test Case 3
+        ollama_client._CONTEXT_LIMIT_CACHE.clear()
         client3 = OllamaClient(ollama_config)
         client3.connect()
         assert client3.context_limit == 1024
 
     @patch("code_scanner.ollama_client.time.sleep")
     @patch("code_scanner.ollama_client.urllib.request.urlopen")
-    def test_wait_for_connection(self, mock_urlopen, mock_sleep, ollama_config):
+    def test_wait_for_connection(self, mock_urlopen, mock_sleep, ollama_config, route_ollama_urlopen):
         """Test wait_for_connection re-tries."""
         # First call raises URLError, second call succeeds
         error_side_effect = urllib.error.URLError("Connection refused")
@@ -83,13 +98,33 @@ class TestOllamaClientCoverage:
         show_response.__enter__ = MagicMock(return_value=show_response)
         show_response.__exit__ = MagicMock(return_value=False)
 
-        mock_urlopen.side_effect = [error_side_effect, tags_response, show_response]
+        # /api/show succeeds on the first attempt and is cached for the retry
+        route_ollama_urlopen(
+            mock_urlopen,
+            tags=[error_side_effect, tags_response],
+            show=[show_response],
+        )
         
         client = OllamaClient(ollama_config)
         client.wait_for_connection(retry_interval=1)
         
         assert mock_sleep.call_count == 1
 
+    @patch("code_scanner.ollama_client.time.sleep")
+    @patch("code_scanner.ollama_client.urllib.request.urlopen")
+    def test_wait_for_connection_backs_off(self, mock_urlopen, mock_sleep, ollama_config):
+        """Test that retry delays grow from 0.5 seconds up to retry_interval."""
+        client = OllamaClient(ollama_config)
+        failures = [LLMClientError("Connection refused")] * 5
+        with patch.object(OllamaClient, "connect", side_effect=[*failures, None]):
+            client.wait_for_connection(retry_interval=2)
+
+        delays = [call.args[0] for call in mock_sleep.call_args_list]
+        assert len(delays) == 5
+        assert 0.5 <= delays[0] <= 0.75
+        assert 1.0 <= delays[1] <= 1.25
+        assert all(2.0 <= d <= 2.25 for d in delays[2:])
+
     @patch("code_scanner.ollama_client.urllib.request.urlopen")
     def test_query_json_fix_mechanism(self, mock_urlopen, ollama_config):
         """Test that malformed JSON is auto-fixed."""
@@ -119,6 +154,42 @@ class TestOllamaClientCoverage:
         result = client.query("sys", "user")
         assert result == {"issues": []}
         
+    @patch("code_scanner.ollama_client.urllib.request.urlopen")
+    def test_query_recovers_json_locally_without_fix_call(self, mock_urlopen, ollama_config):
+        """Test that prose-wrapped JSON with trailing commas skips the LLM fix call."""
+        client = OllamaClient(ollama_config)
+        client._connected = True
+        client._model_id = "llama3"
+        client._context_limit = 4096
+
+        wrapped_resp = MagicMock()
+        wrapped_resp.read.return_value = json.dumps({
+            "message": {"content": 'Here you go: {"issues": [{"file": "a.py",},],} Hope it helps!'}
+        }).encode()
+        wrapped_resp.__enter__ = MagicMock(return_value=wrapped_resp)
+        wrapped_resp.__exit__ = MagicMock(return_value=False)
+
+        mock_urlopen.side_effect = [wrapped_resp]
+
+        result = client.query("sys", "user")
+        assert result == {"issues": [{"file": "a.py"}]}
+        assert mock_urlopen.call_count == 1
+
+    @patch("code_scanner.ollama_client.urllib.request.urlopen")
+    def test_query_oversized_prompt_rejected_before_sending(self, mock_urlopen, ollama_config):
+        """Test that a prompt estimated above the context limit is never sent."""
+        client = OllamaClient(ollama_config)
+        client._connected = True
+        client._model_id = "llama3"
+        client._context_limit = 100
+
+        with pytest.raises(PromptTooLargeError) as exc_info:
+            client.query("sys", "x" * 1000)
+
+        assert not isinstance(exc_info.value, ContextOverflowError)
+        assert "request not sent" in str(exc_info.value)
+        mock_urlopen.assert_not_called()
+
     @patch("code_scanner.ollama_client.urllib.request.urlopen")
     def test_query_context_overflow_error(self, mock_urlopen, ollama_config):
         """Test handling of context overflow HTTP error."""
@@ -225,10 +296,20 @@ class TestOllamaClientCoverage:
         ]
         
         # Should raise LLMClientError after retries exhausted
-        with pytest.raises(LLMClientError) as exc_info:
+        with patch("code_scanner.ollama_client.time.sleep") as mock_sleep, \
+             pytest.raises(LLMClientError) as exc_info:
             client.query("sys", "user", max_retries=3)
-            
+
         assert "Failed to get valid JSON" in str(exc_info.value)
+        # Backoff only between attempts, not before the first one
+        assert mock_sleep.call_count == 2
+        # Temperature is raised on each JSON-parse retry
+        query_bodies = [
+            json.loads(call.args[0].data)
+            for call in mock_urlopen.call_args_list[::2]
+        ]
+        temperatures = [body["options"]["temperature"] for body in query_bodies]
+        assert temperatures == pytest.approx([0.1, 0.15, 0.2])
 
     @patch("code_scanner.ollama_client.urllib.request.urlopen")
     def test_query_tool_calls(self, mock_urlopen, ollama_config):
@@ -155,8 +155,12 @@ class TestSampleQtProjectScan:
         config.output_file = "results.md"
         config.log_file = "scanner.log"
         config.git_poll_interval = 1.0
+        config.git_idle_poll_max = 120
+        config.fs_watch_interval = 0
         config.llm_retry_interval = 1.0
         config.max_llm_retries = 2
+        config.llm_concurrency = 1
+        config.output_write_interval = 2.0
         config.check_groups = [
             CheckGroup(
                 pattern="*.cpp, *.h",
@@ -219,8 +223,12 @@ class TestSampleQtProjectScan:
         config.output_file = "results.md"
         config.log_file = "scanner.log"
         config.git_poll_interval = 1.0
+        config.git_idle_poll_max = 120
+        config.fs_watch_interval = 0
         config.llm_retry_interval = 1.0
         config.max_llm_retries = 2
+        config.llm_concurrency = 1
+        config.output_write_interval = 2.0
         config.check_groups = [
             CheckGroup(pattern="*.cpp, *.h", checks=["Check for issues"]),
         ]
@@ -257,8 +265,12 @@ class TestSampleQtProjectScan:
         config.output_file = "results.md"
         config.log_file = "scanner.log"
         config.git_poll_interval = 1.0
+        config.git_idle_poll_max = 120
+        config.fs_watch_interval = 0
         config.llm_retry_interval = 1.0
         config.max_llm_retries = 2
+        config.llm_concurrency = 1
+        config.output_write_interval = 2.0
         config.check_groups = [
             CheckGroup(pattern="*.cpp", checks=["Check C++ files"]),
             CheckGroup(pattern="*.h", checks=["Check header files"]),
@@ -297,8 +309,12 @@ class TestIssueTracking:
         config.output_file = "results.md"
         config.log_file = "scanner.log"
         config.git_poll_interval = 1.0
+        config.git_idle_poll_max = 120
+        config.fs_watch_interval = 0
         config.llm_retry_interval = 1.0
         config.max_llm_retries = 2
+        config.llm_concurrency = 1
+        config.output_write_interval = 2.0
         config.check_groups = [
             CheckGroup(pattern="*.cpp", checks=["Check"]),
         ]
@@ -337,8 +353,12 @@ class TestIssueTracking:
         config.output_file = "results.md"
         config.log_file = "scanner.log"
         config.git_poll_interval = 1.0
+        config.git_idle_poll_max = 120
+        config.fs_watch_interval = 0
         config.llm_retry_interval = 1.0
         config.max_llm_retries = 2
+        config.llm_concurrency = 1
+        config.output_write_interval = 2.0
         config.check_groups = [
             CheckGroup(pattern="*.cpp", checks=["Check"]),
         ]
@@ -548,8 +568,12 @@ class TestErrorHandling:
         config.output_file = "results.md"
         config.log_file = "scanner.log"
         config.git_poll_interval = 1.0
+        config.git_idle_poll_max = 120
+        config.fs_watch_interval = 0
         config.llm_retry_interval = 0.1
         config.max_llm_retries = 1
+        config.llm_concurrency = 1
+        config.output_write_interval = 2.0
         config.check_groups = [
             CheckGroup(pattern="*.cpp", checks=["Check"]),
         ]
@@ -596,8 +620,12 @@ class TestErrorHandling:
         config.output_file = "results.md"
         config.log_file = "scanner.log"
         config.git_poll_interval = 1.0
+        config.git_idle_poll_max = 120
+        config.fs_watch_interval = 0
         config.llm_retry_interval = 1.0
         config.max_llm_retries = 2
+        config.llm_concurrency = 1
+        config.output_write_interval = 2.0
         config.check_groups = [
             CheckGroup(pattern="*.cpp", checks=["Check"]),
         ]
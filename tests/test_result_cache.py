@@ -0,0 +1,134 @@
+"""Tests for result_cache module."""
+
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+from code_scanner.result_cache import ResultCache
+
+ISSUE = {
+    "file": "main.py",
+    "line_number": 3,
+    "description": "Bug",
+    "suggested_fix": "Fix",
+    "code_snippet": "x()",
+}
+
+
+class TestMakeKey:
+    """Tests for ResultCache.make_key."""
+
+    def test_independent_of_batch_order(self):
+        """Test that file order within a batch does not change the key."""
+        key1 = ResultCache.make_key("Check", {"a.py": "1", "b.py": "2"}, "model")
+        key2 = ResultCache.make_key("Check", {"b.py": "2", "a.py": "1"}, "model")
+
+        assert key1 == key2
+
+    def test_depends_on_all_inputs(self):
+        """Test that check, content, path, model and prompt version all affect the key."""
+        base = ResultCache.make_key("Check", {"a.py": "1"}, "model")
+
+        assert ResultCache.make_key("Other", {"a.py": "1"}, "model") != base
+        assert ResultCache.make_key("Check", {"a.py": "2"}, "model") != base
+        assert ResultCache.make_key("Check", {"b.py": "1"}, "model") != base
+        assert ResultCache.make_key("Check", {"a.py": "1"}, "other-model") != base
+        assert ResultCache.make_key("Check", {"a.py": "1"}, "model", "v2") != base
+
+
+class TestResultCache:
+    """Tests for ResultCache get/set/save."""
+
+    @pytest.fixture
+    def cache_path(self, temp_dir: Path) -> Path:
+        """Path of the cache file."""
+        return temp_dir / "result_cache.json"
+
+    def test_miss_then_hit(self, cache_path: Path):
+        """Test that stored issues are returned and counted."""
+        cache = ResultCache(cache_path)
+
+        assert cache.get("key") is None
+        cache.set("key", [ISSUE])
+
+        assert cache.get("key") == [ISSUE]
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_persists_across_instances(self, cache_path: Path):
+        """Test that saved entries are loaded by a new instance."""
+        cache = ResultCache(cache_path)
+        cache.set("key", [ISSUE])
+        cache.set("empty", [])
+        cache.save()
+
+        reloaded = ResultCache(cache_path)
+
+        assert reloaded.get("key") == [ISSUE]
+        assert reloaded.get("empty") == []
+
+    def test_expired_entries_ignored(self, cache_path: Path):
+        """Test that entries older than the TTL are misses."""
+        cache_path.write_text(json.dumps({"key": [time.time() - 100, [ISSUE]]}))
+
+        cache = ResultCache(cache_path, ttl_seconds=10)
+
+        assert cache.get("key") is None
+
+    def test_save_keeps_newest_entries(self, cache_path: Path):
+        """Test that save trims to max_entries, keeping the newest."""
+        cache = ResultCache(cache_path, max_entries=2)
+        for i in range(4):
+            cache.set(f"key{i}", [])
+            cache._entries[f"key{i}"] = (1000.0 + i + time.time(), [])
+        cache.save()
+
+        data = json.loads(cache_path.read_text())
+        assert sorted(data) == ["key2", "key3"]
+
+    def test_save_keeps_recently_used_entries(self, cache_path: Path):
+        """Test that a cache hit protects an old entry from trimming."""
+        cache = ResultCache(cache_path, max_entries=2)
+        for key in ("a", "b", "c"):
+            cache.set(key, [])
+        cache.get("a")
+        cache.save()
+
+        reloaded = ResultCache(cache_path, max_entries=2)
+        assert reloaded.get("b") is None
+        assert reloaded.get("a") == []
+        assert reloaded.get("c") == []
+
+    def test_corrupt_file_ignored(self, cache_path: Path):
+        """Test that an unreadable cache file starts an empty cache."""
+        cache_path.write_text("{not json")
+
+        cache = ResultCache(cache_path)
+
+        assert cache.get("key") is None
+        cache.set("key", [ISSUE])
+        cache.save()
+        assert json.loads(cache_path.read_text())["key"][1] == [ISSUE]
+
+    def test_malformed_entries_skipped(self, cache_path: Path):
+        """Test that entries with a bad timestamp or shape are dropped on load."""
+        cache_path.write_text(json.dumps({
+            "bad_time": ["x", [ISSUE]],
+            "bad_shape": [time.time()],
+            "good": [time.time(), [ISSUE]],
+        }))
+
+        cache = ResultCache(cache_path)
+
+        assert cache.get("bad_time") is None
+        assert cache.get("bad_shape") is None
+        assert cache.get("good") == [ISSUE]
+
+    def test_save_without_changes_does_not_write(self, cache_path: Path):
+        """Test that an untouched cache does not create a file."""
+        cache = ResultCache(cache_path)
+        cache.get("key")
+        cache.save()
+
+        assert not cache_path.exists()
@@ -1,17 +1,19 @@
 """Coverage-focused tests for Scanner class - targeting uncovered lines."""
 
-import pytest
 import threading
 import time
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import MagicMock, patch, PropertyMock, call
+from unittest.mock import MagicMock, PropertyMock, call, patch
 
-from code_scanner.scanner import Scanner
-from code_scanner.config import Config, LLMConfig, CheckGroup
-from code_scanner.models import Issue, GitState, ChangedFile, IssueStatus
-from code_scanner.lmstudio_client import LLMClientError
+import pytest
+
+from code_scanner.config import CheckGroup, Config, LLMConfig
 from code_scanner.ctags_index import CtagsIndex
+from code_scanner.lmstudio_client import LLMClientError
+from code_scanner.models import ChangedFile, GitState, Issue, IssueStatus
+from code_scanner.scanner import _WATCH_MAX_PATHS, Scanner
+from code_scanner.utils import read_if_text
 
 
 @pytest.fixture
@@ -22,8 +24,12 @@ def mock_config():
     config.output_file = "results.md"
     config.log_file = "scanner.log"
     config.git_poll_interval = 0.1  # Fast for testing
+    config.git_idle_poll_max = 120
+    config.fs_watch_interval = 0
     config.llm_retry_interval = 0.1
     config.max_llm_retries = 2
+    config.llm_concurrency = 1
+    config.output_write_interval = 2.0
     config.check_groups = [
         CheckGroup(pattern="*.py", checks=["Check for bugs", "Check for style"]),
         CheckGroup(pattern="*.cpp, *.h", checks=["Check memory leaks"]),
@@ -113,6 +119,27 @@ class TestScannerRunLoop:
         
         assert call_count[0] >= 1
 
+    def test_run_loop_merge_wait_wakes_on_refresh(self, mock_dependencies):
+        """A refresh signal ends the merge wait without sleeping out the interval."""
+        mock_dependencies["config"].git_poll_interval = 60
+        scanner = Scanner(**mock_dependencies)
+        states = iter([GitState(is_merging=True)])
+
+        def get_state_side_effect():
+            state = next(states, None)
+            if state is None:
+                scanner._stop_event.set()
+                state = GitState(is_merging=True)
+            scanner._refresh_event.set()
+            return state
+
+        mock_dependencies["git_watcher"].get_state.side_effect = get_state_side_effect
+
+        start = time.monotonic()
+        scanner._run_loop()
+
+        assert time.monotonic() - start < 5
+
     def test_run_loop_waits_when_no_changes(self, mock_dependencies):
         """Run loop waits when no changes detected."""
         scanner = Scanner(**mock_dependencies)
@@ -130,6 +157,155 @@ class TestScannerRunLoop:
         
         assert call_count[0] >= 1
 
+    def test_run_loop_error_backoff_grows_and_resets(self, mock_dependencies):
+        """Consecutive loop errors double the retry delay; a clean pass resets it."""
+        scanner = Scanner(**mock_dependencies)
+
+        outcomes = [RuntimeError("a"), RuntimeError("b"), RuntimeError("c"), GitState()]
+        def get_state_side_effect():
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            scanner._stop_event.set()
+            return outcome
+
+        mock_dependencies["git_watcher"].get_state.side_effect = get_state_side_effect
+
+        with patch.object(scanner._stop_event, "wait", return_value=False) as mock_wait:
+            scanner._run_loop()
+
+        timeouts = [c.kwargs["timeout"] for c in mock_wait.call_args_list]
+        assert timeouts == [1.0, 2.0, 4.0]
+        assert scanner._error_backoff == 1.0
+
+    def test_run_loop_error_backoff_ignores_pending_refresh(self, mock_dependencies):
+        """A refresh signal left set does not cut the error backoff short."""
+        scanner = Scanner(**mock_dependencies)
+        scanner._error_backoff = 0.1
+        scanner._refresh_event.set()
+
+        call_count = [0]
+        def get_state_side_effect():
+            call_count[0] += 1
+            if call_count[0] >= 3:
+                scanner._stop_event.set()
+            raise RuntimeError("git unavailable")
+
+        mock_dependencies["git_watcher"].get_state.side_effect = get_state_side_effect
+
+        start = time.monotonic()
+        scanner._run_loop()
+
+        # Both backoffs (0.1s, then 0.2s) are slept out before the third attempt
+        assert call_count[0] == 3
+        assert time.monotonic() - start >= 0.25
+
+    def test_idle_wait_backs_off_up_to_cap(self, mock_dependencies):
+        """Idle timeouts double the poll interval up to git_idle_poll_max."""
+        mock_dependencies["config"].git_poll_interval = 10
+        mock_dependencies["config"].git_idle_poll_max = 35
+        scanner = Scanner(**mock_dependencies)
+
+        with patch.object(scanner._refresh_event, "wait", return_value=False) as mock_wait:
+            for _ in range(4):
+                assert scanner._wait_idle() is False
+
+        timeouts = [c.kwargs["timeout"] for c in mock_wait.call_args_list]
+        assert timeouts == [10, 20, 35, 35]
+
+    def test_idle_wait_resets_on_signal(self, mock_dependencies):
+        """A refresh signal resets the backoff to the base interval."""
+        mock_dependencies["config"].git_poll_interval = 10
+        scanner = Scanner(**mock_dependencies)
+        scanner._idle_ticks = 3
+
+        with patch.object(scanner._refresh_event, "wait", side_effect=[True, False]) as mock_wait:
+            assert scanner._wait_idle() is True
+            scanner._wait_idle()
+
+        assert mock_wait.call_args_list[1].kwargs["timeout"] == 10
+
+    def test_run_scan_resets_idle_backoff(self, mock_dependencies):
+        """Starting a scan resets the idle backoff."""
+        scanner = Scanner(**mock_dependencies)
+        scanner._idle_ticks = 5
+
+        scanner._run_scan(GitState())
+
+        assert scanner._idle_ticks == 0
+
+    def test_watch_loop_queues_changed_paths(self, mock_dependencies):
+        """Worktree changes queue their paths and wake the loop with a fresh git state."""
+        mock_dependencies["config"].fs_watch_interval = 0.01
+        scanner = Scanner(**mock_dependencies)
+        git_watcher = mock_dependencies["git_watcher"]
+
+        first = {"a.py": (1, 10), "b.py": (1, 10)}
+        second = {"a.py": (2, 12), "c.py": (1, 5)}
+        snapshots = iter([first, first, second])
+        def snapshot_side_effect():
+            try:
+                return next(snapshots)
+            except StopIteration:
+                scanner._stop_event.set()
+                return second
+
+        git_watcher.worktree_snapshot.side_effect = snapshot_side_effect
+
+        scanner._watch_loop()
+
+        assert scanner._refresh_event.is_set()
+        git_watcher.invalidate_cache.assert_called_once()
+        assert scanner._drain_changed_paths() == {"a.py", "b.py", "c.py"}
+
+    def test_watch_loop_disabled_on_large_worktree(self, mock_dependencies):
+        """Worktrees with too many files are left to git polling."""
+        mock_dependencies["config"].fs_watch_interval = 0.01
+        scanner = Scanner(**mock_dependencies)
+        git_watcher = mock_dependencies["git_watcher"]
+        git_watcher.worktree_snapshot.return_value = {
+            f"f{i}.py": (1, 1) for i in range(_WATCH_MAX_PATHS + 1)
+        }
+
+        scanner._watch_loop()
+
+        git_watcher.worktree_snapshot.assert_called_once()
+
+    def test_watch_loop_disabled_when_snapshots_slow(self, mock_dependencies):
+        """Watching stops once a snapshot's stretched wait exceeds git polling."""
+        mock_dependencies["config"].fs_watch_interval = 0.01
+        mock_dependencies["config"].git_poll_interval = 1
+        scanner = Scanner(**mock_dependencies)
+        git_watcher = mock_dependencies["git_watcher"]
+        git_watcher.worktree_snapshot.return_value = {"a.py": (1, 1)}
+
+        # First snapshot is instant, the second takes a whole second
+        with patch("code_scanner.scanner.time.monotonic", side_effect=[0.0, 0.0, 10.0, 11.0]):
+            scanner._watch_loop()
+
+        assert git_watcher.worktree_snapshot.call_count == 2
+
+    def test_drain_changed_paths_unknown_when_empty_or_full(self, mock_dependencies):
+        """An empty or overflowed queue means the changed paths are unknown."""
+        scanner = Scanner(**mock_dependencies)
+
+        assert scanner._drain_changed_paths() is None
+
+        scanner._changed_paths.extend(f"f{i}.py" for i in range(5000))
+        assert scanner._drain_changed_paths() is None
+        assert len(scanner._changed_paths) == 0
+
+    def test_start_skips_watch_thread_when_disabled(self, mock_dependencies):
+        """fs_watch_interval of 0 disables the worktree watcher thread."""
+        scanner = Scanner(**mock_dependencies)
+        mock_dependencies["git_watcher"].get_state.return_value = GitState()
+
+        scanner.start()
+        try:
+            assert scanner._watch_thread is None
+        finally:
+            scanner.stop()
+
     def test_run_loop_calls_run_scan_with_changes(self, mock_dependencies):
         """Run loop calls _run_scan when changes detected."""
         scanner = Scanner(**mock_dependencies)
@@ -211,6 +387,64 @@ class TestScannerRunScan:
         # Should query LLM for each check (2 py rules + 1 cpp rule = 3)
         assert mock_dependencies["llm_client"].query.call_count >= 1
 
+    def test_run_scan_orders_checks_by_issue_yield(self, mock_dependencies):
+        """Checks that found issues before run first; yields follow the results."""
+        scanner = Scanner(**mock_dependencies)
+        scanner._check_yield = {"Check for style": 3.0, "Check for bugs": 0.5}
+        state = GitState(changed_files=[ChangedFile(path="test.py", status="unstaged")])
+        run_order = []
+
+        def run_check(check_query, batches, concurrency=1):
+            run_order.append(check_query)
+            # Only the style check reaches the LLM; bugs is served without a query
+            if check_query == "Check for style":
+                scanner._queried_batches[check_query] = 1
+            return []
+
+        with patch.object(scanner, "_get_files_content", return_value={"test.py": "x = 1"}), \
+             patch.object(scanner, "_run_check", side_effect=run_check):
+            scanner._run_scan(state)
+
+        assert run_order == ["Check for style", "Check for bugs"]
+        assert scanner._check_yield["Check for style"] == pytest.approx(2.4)
+        assert scanner._check_yield["Check for bugs"] == 0.5
+        assert scanner._queried_batches == {}
+
+    def test_cached_batches_leave_check_yield_unchanged(self, mock_dependencies, tmp_path):
+        """A check answered entirely from the result cache keeps its yield."""
+        from code_scanner.result_cache import ResultCache
+
+        mock_dependencies["llm_client"].model_id = "test-model"
+        mock_dependencies["llm_client"].query.return_value = {"issues": []}
+        mock_dependencies["result_cache"] = ResultCache(tmp_path / "cache.json")
+        scanner = Scanner(**mock_dependencies)
+        state = GitState(changed_files=[ChangedFile(path="test.py", status="unstaged")])
+
+        with patch.object(scanner, "_get_files_content", return_value={"test.py": "x = 1"}):
+            scanner._run_scan(state)
+            queried_yield = dict(scanner._check_yield)
+            # Forget what was checked so the rescan hits the cache instead
+            scanner._checked_content.clear()
+            scanner._run_scan(state)
+
+        assert queried_yield == {"Check for bugs": 0.8, "Check for style": 0.8}
+        assert scanner._check_yield == queried_yield
+        assert mock_dependencies["llm_client"].query.call_count == 2
+
+    def test_run_scan_tracks_scanned_content(self, mock_dependencies):
+        """Files are read once per scan and the scanned content is what gets tracked."""
+        scanner = Scanner(**mock_dependencies)
+        state = GitState(changed_files=[ChangedFile(path="test.py", status="unstaged")])
+        mock_dependencies["llm_client"].query.return_value = {"issues": []}
+
+        with patch.object(
+            scanner, "_get_files_content", side_effect=[{"test.py": "x = 1"}, {"test.py": "x = 2"}]
+        ) as mock_get:
+            scanner._run_scan(state)
+
+        assert mock_get.call_count == 1
+        assert scanner._last_file_contents_hash == {"test.py": hash("x = 1")}
+
     def test_run_scan_handles_deleted_files(self, mock_dependencies):
         """Run scan resolves issues for deleted files."""
         scanner = Scanner(**mock_dependencies)
@@ -430,6 +664,107 @@ class TestScannerRunScan:
         # LLM should not be called since stop is set
         mock_dependencies["llm_client"].query.assert_not_called()
 
+    def test_run_scan_runs_checks_concurrently(self, mock_dependencies):
+        """Checks overlap their LLM calls when llm_concurrency > 1."""
+        mock_dependencies["config"].llm_concurrency = 3
+        scanner = Scanner(**mock_dependencies)
+
+        state = GitState(
+            changed_files=[
+                ChangedFile(path="test.py", status="unstaged"),
+                ChangedFile(path="main.cpp", status="unstaged"),
+            ]
+        )
+        files_content = {"test.py": "x = 1", "main.cpp": "int main() {}"}
+
+        # Each query blocks until all three checks are in flight at once
+        barrier = threading.Barrier(3, timeout=5)
+
+        def query(**kwargs):
+            barrier.wait()
+            return {"issues": []}
+
+        mock_dependencies["llm_client"].query.side_effect = query
+
+        with patch.object(scanner, "_get_files_content", return_value=files_content):
+            scanner._run_scan(state)
+
+        assert mock_dependencies["llm_client"].query.call_count == 3
+        assert scanner._scan_info["checks_run"] == 3
+
+    def test_pools_reused_across_scans(self, mock_dependencies):
+        """The check and batch pools persist between scans and are shut down on stop."""
+        mock_dependencies["config"].llm_concurrency = 2
+        scanner = Scanner(**mock_dependencies)
+        mock_dependencies["llm_client"].query.return_value = {"issues": []}
+
+        state = GitState(
+            changed_files=[ChangedFile(path="test.py", status="unstaged")]
+        )
+        with patch.object(scanner, "_get_files_content", return_value={"test.py": "x = 1"}):
+            scanner._run_scan(state)
+            pools = dict(scanner._pools)
+            scanner._run_scan(state)
+
+        assert set(pools) == {"check", "batch"}
+        assert scanner._pools == pools
+
+        scanner.stop()
+        assert scanner._pools == {}
+
+    def test_get_pool_creates_one_pool_under_contention(self, mock_dependencies):
+        """Threads racing for a pool all get the same executor."""
+        scanner = Scanner(**mock_dependencies)
+        barrier = threading.Barrier(8)
+        pools = []
+
+        def get_pool():
+            barrier.wait()
+            pools.append(scanner._get_pool("batch", 2))
+
+        threads = [threading.Thread(target=get_pool) for _ in range(8)]
+        with patch("code_scanner.scanner.ThreadPoolExecutor", side_effect=lambda **kw: MagicMock()) as mock_executor:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert mock_executor.call_count == 1
+        assert all(pool is pools[0] for pool in pools)
+
+    def test_llm_calls_bounded_by_concurrency(self, mock_dependencies):
+        """Overlapping checks and batches never exceed llm_concurrency LLM calls."""
+        mock_dependencies["config"].llm_concurrency = 2
+        scanner = Scanner(**mock_dependencies)
+
+        lock = threading.Lock()
+        in_flight = [0]
+        peak = [0]
+
+        def query(**kwargs):
+            with lock:
+                in_flight[0] += 1
+                peak[0] = max(peak[0], in_flight[0])
+            time.sleep(0.01)
+            with lock:
+                in_flight[0] -= 1
+            return {"issues": []}
+
+        mock_dependencies["llm_client"].query.side_effect = query
+        batches = [{f"f{i}.py": str(i)} for i in range(4)]
+
+        threads = [
+            threading.Thread(target=scanner._run_check, args=(f"Check {n}", batches, 2))
+            for n in range(3)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert mock_dependencies["llm_client"].query.call_count == 12
+        assert peak[0] == 2
+
 
 class TestScannerBatching:
     """Tests for Scanner batching functionality."""
@@ -529,13 +864,61 @@ class TestScannerFilesContent:
         
         assert len(result) == 0
 
+    def test_get_files_content_skips_scanner_files_with_normalized_paths(self, mock_dependencies):
+        """Scanner output files configured with a ./ prefix still match Git paths."""
+        mock_dependencies["config"].output_file = "./results.md"
+        scanner = Scanner(**mock_dependencies)
+
+        with patch("code_scanner.scanner.read_if_text", return_value="text") as mock_read:
+            result = scanner._get_files_content([ChangedFile(path="results.md", status="unstaged")])
+
+        assert result == {}
+        mock_read.assert_not_called()
+
+    def test_get_files_content_skips_oversized_without_reading(self, mock_dependencies, tmp_path):
+        """Files too large for any batch are skipped from their stat alone."""
+        mock_dependencies["config"].target_directory = tmp_path
+        mock_dependencies["llm_client"].context_limit = 100  # 55 tokens -> 880 bytes max
+        scanner = Scanner(**mock_dependencies)
+        (tmp_path / "big.py").write_text("x" * 1000)
+        (tmp_path / "small.py").write_text("y = 1")
+
+        with patch("code_scanner.scanner.read_if_text", wraps=read_if_text) as mock_read:
+            result = scanner._get_files_content([
+                ChangedFile(path="big.py", status="unstaged"),
+                ChangedFile(path="small.py", status="unstaged"),
+            ])
+
+        assert result == {"small.py": "y = 1"}
+        assert mock_read.call_count == 1
+
+    def test_run_scan_reports_oversized_files_as_skipped(self, mock_dependencies, tmp_path, caplog):
+        """Files skipped by their stat size are counted as skipped and warned about."""
+        mock_dependencies["config"].target_directory = tmp_path
+        mock_dependencies["llm_client"].context_limit = 100
+        mock_dependencies["llm_client"].query.return_value = {"issues": []}
+        scanner = Scanner(**mock_dependencies)
+        (tmp_path / "big.py").write_text("x" * 1000)
+        (tmp_path / "small.py").write_text("y = 1")
+        state = GitState(changed_files=[
+            ChangedFile(path="big.py", status="unstaged"),
+            ChangedFile(path="small.py", status="unstaged"),
+        ])
+
+        with caplog.at_level("WARNING", logger="code_scanner.scanner"):
+            scanner._run_scan(state)
+
+        assert scanner._scan_info["skipped_files"] == ["big.py"]
+        assert scanner._scan_info["files_scanned"] == ["small.py"]
+        assert "Skipping oversized file: big.py" in caplog.text
+
     def test_get_files_content_skips_binary(self, mock_dependencies):
         """Get files content skips binary files."""
         scanner = Scanner(**mock_dependencies)
         
         changed = [ChangedFile(path="image.png", status="unstaged")]
         
-        with patch("code_scanner.scanner.is_binary_file", return_value=True):
+        with patch("code_scanner.scanner.read_if_text", return_value=None):
             result = scanner._get_files_content(changed)
         
         assert len(result) == 0
@@ -546,8 +929,7 @@ class TestScannerFilesContent:
         
         changed = [ChangedFile(path="test.py", status="unstaged")]
         
-        with patch("code_scanner.scanner.is_binary_file", return_value=False), \
-             patch("code_scanner.scanner.read_file_content", return_value="content"):
+        with patch("code_scanner.scanner.read_if_text", return_value="content"):
             result = scanner._get_files_content(changed)
         
         assert "test.py" in result
@@ -559,12 +941,65 @@ class TestScannerFilesContent:
         
         changed = [ChangedFile(path="test.py", status="unstaged")]
         
-        with patch("code_scanner.scanner.is_binary_file", return_value=False), \
-             patch("code_scanner.scanner.read_file_content", return_value=None):
+        with patch("code_scanner.scanner.read_if_text", return_value=None):
             result = scanner._get_files_content(changed)
         
         assert "test.py" not in result
 
+    def test_get_files_content_reads_many_files_in_order(self, mock_dependencies, tmp_path):
+        """Get files content reads multiple files and keeps changed-file order."""
+        mock_dependencies["config"].target_directory = tmp_path
+        scanner = Scanner(**mock_dependencies)
+
+        names = [f"file{i}.py" for i in range(20)]
+        for name in names:
+            (tmp_path / name).write_text(f"# {name}")
+        (tmp_path / "image.bin").write_bytes(b"\x00\x01\x02")
+
+        changed = [ChangedFile(path=name, status="unstaged") for name in reversed(names)]
+        changed.append(ChangedFile(path="image.bin", status="unstaged"))
+
+        result = scanner._get_files_content(changed)
+
+        assert list(result) == list(reversed(names))
+        assert result["file3.py"] == "# file3.py"
+
+    def test_get_files_content_rereads_only_changed_files(self, mock_dependencies, tmp_path):
+        """Unchanged files are served from the previous read on rescans."""
+        import os
+
+        mock_dependencies["config"].target_directory = tmp_path
+        scanner = Scanner(**mock_dependencies)
+
+        old_ns = time.time_ns() - 60_000_000_000
+        for name in ("a.py", "b.py"):
+            (tmp_path / name).write_text(f"# {name}")
+            os.utime(tmp_path / name, ns=(old_ns, old_ns))
+        changed = [ChangedFile(path=name, status="unstaged") for name in ("a.py", "b.py")]
+
+        first = scanner._get_files_content(changed)
+        (tmp_path / "b.py").write_text("# edited")
+
+        with patch("code_scanner.scanner.read_if_text", wraps=read_if_text) as mock_read:
+            second = scanner._get_files_content(changed)
+
+        mock_read.assert_called_once_with(tmp_path / "b.py")
+        assert second["a.py"] is first["a.py"]
+        assert second["b.py"] == "# edited"
+
+    def test_get_files_content_rereads_recently_modified_files(self, mock_dependencies, tmp_path):
+        """Files modified within the racy window are never served from cache."""
+        mock_dependencies["config"].target_directory = tmp_path
+        scanner = Scanner(**mock_dependencies)
+        (tmp_path / "a.py").write_text("# a")
+        changed = [ChangedFile(path="a.py", status="unstaged")]
+
+        scanner._get_files_content(changed)
+        with patch("code_scanner.scanner.read_if_text", wraps=read_if_text) as mock_read:
+            scanner._get_files_content(changed)
+
+        mock_read.assert_called_once()
+
     def test_get_files_content_uses_file_filter(self, mock_dependencies):
         """Get files content uses unified FileFilter when provided."""
         from code_scanner.file_filter import FileFilter
@@ -582,8 +1017,7 @@ class TestScannerFilesContent:
             ChangedFile(path="README.md", status="unstaged"),
         ]
         
-        with patch("code_scanner.scanner.is_binary_file", return_value=False), \
-             patch("code_scanner.scanner.read_file_content", return_value="content"):
+        with patch("code_scanner.scanner.read_if_text", return_value="content"):
             result = scanner._get_files_content(changed)
         
         # FileFilter should be called for each file
@@ -676,6 +1110,83 @@ class TestScannerRunCheck:
         
         assert mock_dependencies["llm_client"].query.call_count == 2
 
+    def test_run_check_runs_batches_concurrently(self, mock_dependencies):
+        """Batches overlap their LLM calls when concurrency > 1."""
+        scanner = Scanner(**mock_dependencies)
+
+        # Each query blocks until all three batches are in flight at once
+        barrier = threading.Barrier(3, timeout=5)
+
+        def query(**kwargs):
+            barrier.wait()
+            return {"issues": []}
+
+        mock_dependencies["llm_client"].query.side_effect = query
+
+        batches = [{"a.py": "a"}, {"b.py": "b"}, {"c.py": "c"}]
+        scanner._run_check("Find bugs", batches, concurrency=3)
+
+        assert mock_dependencies["llm_client"].query.call_count == 3
+        assert mock_dependencies["issue_tracker"].add_issues.call_count == 0
+
+    def test_run_check_concurrent_keeps_batch_order(self, mock_dependencies):
+        """Concurrent batches return issues in batch order, not completion order."""
+        scanner = Scanner(**mock_dependencies)
+
+        def run_batch(check_query, batch, batch_idx, total_batches):
+            time.sleep(0.01 * (total_batches - batch_idx))
+            return [batch_idx]
+
+        with patch.object(scanner, "_run_batch", side_effect=run_batch):
+            issues = scanner._run_check("Find bugs", [{"a.py": "a"}] * 4, concurrency=4)
+
+        assert issues == [0, 1, 2, 3]
+
+    def test_run_check_concurrent_raises_on_llm_error(self, mock_dependencies):
+        """A failing batch propagates its error when batches run concurrently."""
+        scanner = Scanner(**mock_dependencies)
+        mock_dependencies["llm_client"].query.side_effect = LLMClientError("Connection failed")
+
+        with pytest.raises(LLMClientError):
+            scanner._run_check("Find bugs", [{"a.py": "a"}, {"b.py": "b"}], concurrency=2)
+
+    def test_run_check_concurrent_cancels_pending_batches_on_error(self, mock_dependencies):
+        """Batches not yet started are dropped once another batch of the check fails."""
+        scanner = Scanner(**mock_dependencies)
+        release = threading.Event()
+        started = []
+
+        def run_batch(check_query, batch, batch_idx, total_batches):
+            started.append(batch_idx)
+            if batch_idx == 0:
+                raise LLMClientError("Connection failed")
+            release.wait(5)
+            return []
+
+        with patch.object(scanner, "_run_batch", side_effect=run_batch):
+            with pytest.raises(LLMClientError):
+                scanner._run_check("Find bugs", [{"a.py": "a"}] * 6, concurrency=2)
+            release.set()
+            scanner._get_pool("batch", 2).shutdown(wait=True)
+
+        # The worker freed by batch 0 may pick up batch 2 before the cancel,
+        # but both workers are then blocked, so nothing later ever starts
+        assert set(started) <= {0, 1, 2}
+
+    def test_run_check_copies_issues_to_identical_files(self, mock_dependencies, tmp_path):
+        """Issues on a deduplicated file are reported for each identical copy."""
+        mock_dependencies["config"].target_directory = tmp_path
+        scanner = Scanner(**mock_dependencies)
+        for name in ("a.py", "b.py"):
+            (tmp_path / name).write_text("x = 1")
+        mock_dependencies["llm_client"].query.return_value = {
+            "issues": [{"file": "a.py", "line_number": 1, "description": "Bug"}]
+        }
+
+        issues = scanner._run_check("Find bugs", [{"a.py": "x = 1", "b.py": "x = 1"}])
+
+        assert sorted(issue.file_path for issue in issues) == ["a.py", "b.py"]
+
     def test_run_check_stops_on_stop_event(self, mock_dependencies):
         """Run check stops processing when stop event is set."""
         scanner = Scanner(**mock_dependencies)
@@ -698,6 +1209,165 @@ class TestScannerRunCheck:
         with pytest.raises(LLMClientError):
             scanner._run_check("Find bugs", batches)
 
+    def test_run_check_reuses_serialized_batch_across_checks(self, mock_dependencies):
+        """Checks on the same batch serialize its files only once."""
+        scanner = Scanner(**mock_dependencies)
+        mock_dependencies["llm_client"].query.return_value = {"issues": []}
+
+        batches = [{"test.py": "content"}]
+        with patch("code_scanner.scanner.serialize_files", return_value="FILES") as mock_serialize:
+            scanner._run_check("Find bugs", batches)
+            scanner._run_check("Find leaks", batches)
+
+        mock_serialize.assert_called_once_with(batches[0])
+        prompts = [c.kwargs["user_prompt"] for c in mock_dependencies["llm_client"].query.call_args_list]
+        assert prompts[0].startswith("FILES") and prompts[0].rstrip().endswith("Find bugs")
+        assert prompts[1].startswith("FILES") and prompts[1].rstrip().endswith("Find leaks")
+
+    def test_serialization_shared_across_check_groups(self, mock_dependencies):
+        """Groups whose filtered batches hold the same files share one serialization."""
+        from code_scanner.base_client import serialize_files
+
+        mock_dependencies["config"].check_groups = [
+            CheckGroup(pattern="*", checks=["Check all"]),
+            CheckGroup(pattern="*.py", checks=["Check python"]),
+        ]
+        scanner = Scanner(**mock_dependencies)
+        mock_dependencies["llm_client"].query.return_value = {"issues": []}
+
+        state = GitState(
+            changed_files=[ChangedFile(path="test.py", status="unstaged")]
+        )
+        with patch.object(scanner, "_get_files_content", return_value={"test.py": "x = 1"}), \
+             patch("code_scanner.scanner.serialize_files", side_effect=serialize_files) as mock_serialize:
+            scanner._run_scan(state)
+
+        assert mock_dependencies["llm_client"].query.call_count == 2
+        mock_serialize.assert_called_once()
+
+    def test_run_check_skips_files_unchanged_since_last_check(self, mock_dependencies):
+        """Only files edited since this check last ran on them are re-sent."""
+        scanner = Scanner(**mock_dependencies)
+        mock_dependencies["llm_client"].query.return_value = {"issues": []}
+
+        scanner._run_check("Find bugs", [{"a.py": "a = 1", "b.py": "b = 1"}])
+        scanner._run_check("Find bugs", [{"a.py": "a = 1", "b.py": "b = 1"}])
+        assert mock_dependencies["llm_client"].query.call_count == 1
+
+        scanner._run_check("Find bugs", [{"a.py": "a = 1", "b.py": "b = 2"}])
+        assert mock_dependencies["llm_client"].query.call_count == 2
+        prompt = mock_dependencies["llm_client"].query.call_args.kwargs["user_prompt"]
+        assert "b.py" in prompt and "a.py" not in prompt
+
+        # Another check has not seen either file yet
+        scanner._run_check("Find leaks", [{"a.py": "a = 1", "b.py": "b = 2"}])
+        assert mock_dependencies["llm_client"].query.call_count == 3
+
+    def test_run_check_failed_batch_is_not_marked_checked(self, mock_dependencies):
+        """A batch whose LLM call fails is sent again on the next run."""
+        scanner = Scanner(**mock_dependencies)
+        mock_dependencies["llm_client"].query.side_effect = [
+            LLMClientError("Connection failed"),
+            {"issues": []},
+        ]
+
+        with pytest.raises(LLMClientError):
+            scanner._run_check("Find bugs", [{"a.py": "a = 1"}])
+        scanner._run_check("Find bugs", [{"a.py": "a = 1"}])
+
+        assert mock_dependencies["llm_client"].query.call_count == 2
+
+    def test_run_check_uses_result_cache(self, mock_dependencies, tmp_path):
+        """A cached batch result is reused instead of querying the LLM."""
+        from code_scanner.result_cache import ResultCache
+
+        (tmp_path / "test.py").write_text("content")
+        mock_dependencies["config"].target_directory = tmp_path
+        mock_dependencies["llm_client"].model_id = "test-model"
+        mock_dependencies["llm_client"].query.return_value = {
+            "issues": [{"file_path": "test.py", "line": 1, "description": "Bug found"}]
+        }
+        cache = ResultCache(tmp_path / "cache.json")
+        scanner = Scanner(**mock_dependencies, result_cache=cache)
+
+        batches = [{"test.py": "content"}]
+        first = scanner._run_check("Find bugs", batches)
+        # A fresh scanner (e.g. after a restart) shares the cache
+        scanner = Scanner(**mock_dependencies, result_cache=cache)
+        second = scanner._run_check("Find bugs", batches)
+
+        assert mock_dependencies["llm_client"].query.call_count == 1
+        assert [(i.file_path, i.line_number, i.description) for i in second] == \
+            [(i.file_path, i.line_number, i.description) for i in first]
+        assert cache.hits == 1
+
+        # A different check on the same batch is a miss
+        scanner._run_check("Find leaks", batches)
+        assert mock_dependencies["llm_client"].query.call_count == 2
+
+    def test_run_check_does_not_cache_unanswered_batch(self, mock_dependencies, tmp_path):
+        """A batch the LLM never answered is not stored as "no issues"."""
+        from code_scanner.result_cache import ResultCache
+        from code_scanner.scanner import _PROMPT_VERSION
+
+        mock_dependencies["config"].target_directory = tmp_path
+        mock_dependencies["llm_client"].model_id = "test-model"
+        cache = ResultCache(tmp_path / "cache.json")
+        scanner = Scanner(**mock_dependencies, result_cache=cache)
+        batch = {"test.py": "content"}
+
+        with patch.object(scanner, "_run_check_with_tools", return_value=None):
+            assert scanner._run_check("Find bugs", [batch]) == []
+
+        key = ResultCache.make_key("Find bugs", batch, "test-model", _PROMPT_VERSION)
+        assert cache.get(key) is None
+
+    def test_run_check_splits_batch_too_large_for_model(self, mock_dependencies, tmp_path):
+        """A batch the client refuses as too large is checked in halves."""
+        from code_scanner.base_client import PromptTooLargeError
+
+        mock_dependencies["config"].target_directory = tmp_path
+        scanner = Scanner(**mock_dependencies)
+        sent = []
+
+        def run(check_query, batch, batch_idx):
+            sent.append(sorted(batch))
+            if len(batch) > 1:
+                raise PromptTooLargeError("too large")
+            return []
+
+        with patch.object(scanner, "_run_check_with_tools", side_effect=run):
+            issues = scanner._run_check("Find bugs", [{"a.py": "a", "b.py": "b", "c.py": "c"}])
+
+        assert issues == []
+        assert sent == [["a.py", "b.py", "c.py"], ["a.py"], ["b.py", "c.py"], ["b.py"], ["c.py"]]
+        assert all(("Find bugs", path) in scanner._checked_content for path in ("a.py", "b.py", "c.py"))
+
+    def test_run_check_skips_single_file_too_large_for_model(self, mock_dependencies, tmp_path):
+        """A single file the client refuses as too large is skipped, not failed."""
+        from code_scanner.base_client import PromptTooLargeError
+
+        mock_dependencies["config"].target_directory = tmp_path
+        scanner = Scanner(**mock_dependencies)
+
+        with patch.object(scanner, "_run_check_with_tools", side_effect=PromptTooLargeError("too large")):
+            assert scanner._run_check("Find bugs", [{"a.py": "a"}]) == []
+
+        assert ("Find bugs", "a.py") not in scanner._checked_content
+
+    def test_run_check_does_not_mark_unanswered_batch_checked(self, mock_dependencies, tmp_path):
+        """A batch the LLM never answered is queried again on the next scan."""
+        mock_dependencies["config"].target_directory = tmp_path
+        scanner = Scanner(**mock_dependencies)
+
+        with patch.object(scanner, "_run_check_with_tools", return_value=None):
+            scanner._run_check("Find bugs", [{"test.py": "content"}])
+        assert ("Find bugs", "test.py") not in scanner._checked_content
+
+        with patch.object(scanner, "_run_check_with_tools", return_value=[]):
+            scanner._run_check("Find bugs", [{"test.py": "content"}])
+        assert ("Find bugs", "test.py") in scanner._checked_content
+
 
 class TestScannerThreading:
     """Tests for Scanner threading functionality."""
@@ -877,6 +1547,37 @@ class TestScannerIncrementalOutput:
         # Last call should have checks_run=2 (both rules completed)
         assert write_calls_scan_info[-1] == 2
 
+    def test_incremental_writes_are_rate_limited(self, mock_dependencies):
+        """Incremental writes within output_write_interval collapse into one, plus the final write."""
+        mock_dependencies["config"].output_write_interval = 3600
+        mock_dependencies["config"].check_groups = [
+            CheckGroup(pattern="*.py", checks=[f"Check {i}" for i in range(5)]),
+        ]
+        scanner = Scanner(**mock_dependencies)
+
+        state = GitState(
+            changed_files=[ChangedFile(path="test.py", status="unstaged")]
+        )
+        mock_dependencies["llm_client"].query.return_value = {"issues": []}
+
+        with patch.object(scanner, "_get_files_content", return_value={"test.py": "x = 1"}):
+            scanner._run_scan(state)
+
+        # First incremental write goes through, the rest are debounced,
+        # and the end of the scan always flushes
+        assert mock_dependencies["output_generator"].write.call_count == 2
+
+    def test_write_output_force_bypasses_interval(self, mock_dependencies):
+        """Forced writes ignore the rate limit."""
+        mock_dependencies["config"].output_write_interval = 3600
+        scanner = Scanner(**mock_dependencies)
+
+        scanner._write_output()
+        scanner._write_output()
+        scanner._write_output(force=True)
+
+        assert mock_dependencies["output_generator"].write.call_count == 2
+
     def test_refresh_signal_continues_processing(self, mock_dependencies):
         """Refresh signal triggers rescan of earlier checks (watermark algorithm)."""
         scanner = Scanner(**mock_dependencies)
@@ -885,7 +1586,11 @@ class TestScannerIncrementalOutput:
             changed_files=[ChangedFile(path="test.py", status="unstaged")]
         )
         
-        files_content = {"test.py": "x = 1"}
+        # Each rebuild sees edited content, as it would after a real worktree change
+        reads = [0]
+        def get_content_side_effect(changed_files):
+            reads[0] += 1
+            return {"test.py": f"x = {reads[0]}"}
         
         # Set refresh signal after first query
         query_count = [0]
@@ -897,7 +1602,7 @@ class TestScannerIncrementalOutput:
         
         mock_dependencies["llm_client"].query.side_effect = query_side_effect
         
-        with patch.object(scanner, "_get_files_content", return_value=files_content):
+        with patch.object(scanner, "_get_files_content", side_effect=get_content_side_effect):
             scanner._run_scan(state)
         
         # With watermark algorithm: refresh after check 1 means check 0 was stale
@@ -938,6 +1643,7 @@ class TestScannerAdditionalCoverage:
         up the scanner, but actual file changes are determined by content/path comparison.
         """
         scanner = Scanner(**mock_dependencies)
+        scanner._error_backoff = 0.1
         scanner._refresh_event.set()
         scanner._last_scanned_files = set()  # Empty set matches current_files
 
@@ -986,6 +1692,42 @@ class TestScannerAdditionalCoverage:
         result = scanner._has_files_changed({"test.py"}, state)
         assert result is True
 
+    def test_has_files_changed_only_rereads_changed_paths(self, mock_dependencies):
+        """Known changed paths limit which files are re-read and compared."""
+        scanner = Scanner(**mock_dependencies)
+        scanner._last_scanned_files = {"a.py", "b.py"}
+        scanner._last_file_contents_hash = {"a.py": hash("a"), "b.py": hash("b")}
+        state = GitState(changed_files=[
+            ChangedFile(path="a.py", status="unstaged"),
+            ChangedFile(path="b.py", status="unstaged"),
+        ])
+
+        with patch("code_scanner.scanner.read_if_text", return_value="a") as mock_read:
+            changed = scanner._has_files_changed({"a.py", "b.py"}, state, {"a.py"})
+
+        assert changed is False
+        mock_read.assert_called_once_with(Path("/test/repo") / "a.py")
+
+    def test_has_files_changed_reuses_cached_reads(self, mock_dependencies, tmp_path):
+        """Unchanged files are not re-read on every idle change check."""
+        import os
+
+        mock_dependencies["config"].target_directory = tmp_path
+        scanner = Scanner(**mock_dependencies)
+        old_ns = time.time_ns() - 60_000_000_000
+        (tmp_path / "a.py").write_text("a = 1")
+        os.utime(tmp_path / "a.py", ns=(old_ns, old_ns))
+        changed = [ChangedFile(path="a.py", status="unstaged")]
+        scanner._last_scanned_files = {"a.py"}
+        scanner._last_file_contents_hash = {"a.py": hash("a = 1")}
+
+        scanner._get_files_content(changed)
+        with patch("code_scanner.scanner.read_if_text", wraps=read_if_text) as mock_read:
+            assert scanner._has_files_changed({"a.py"}, GitState(changed_files=changed)) is False
+            assert scanner._has_files_changed({"a.py"}, GitState(changed_files=changed)) is False
+
+        mock_read.assert_not_called()
+
     def test_has_files_changed_unreadable_file(self, mock_dependencies, tmp_path):
         """Test _has_files_changed returns True for unreadable files."""
         mock_dependencies["config"].target_directory = tmp_path
@@ -1082,6 +1824,58 @@ class TestScannerAdditionalCoverage:
         # Should have at least one batch
         assert len(batches) >= 1
 
+    def test_create_batches_packs_directories_first_fit_decreasing(self, mock_dependencies):
+        """Directories are packed largest-first into the earliest batch with room."""
+        mock_dependencies["llm_client"].context_limit = 1000  # 550 tokens per batch
+
+        scanner = Scanner(**mock_dependencies)
+
+        # 300 + 300 + 250 + 250 tokens: in directory order this needs three
+        # batches, first-fit decreasing needs two
+        files_content = {
+            "a/x.py": "a" * 1200,
+            "b/x.py": "b" * 1200,
+            "c/x.py": "c" * 1000,
+            "d/x.py": "d" * 1000,
+        }
+
+        batches = scanner._create_batches(files_content)
+
+        assert len(batches) == 2
+        assert sorted(sorted(b) for b in batches) == [["a/x.py", "c/x.py"], ["b/x.py", "d/x.py"]]
+
+    def test_create_batches_keeps_fitting_directory_together(self, mock_dependencies):
+        """Files of a directory that fits in one batch are not split up."""
+        mock_dependencies["llm_client"].context_limit = 1000  # 550 tokens per batch
+
+        scanner = Scanner(**mock_dependencies)
+
+        files_content = {
+            "big/x.py": "a" * 1600,  # 400 tokens
+            "pkg/one.py": "b" * 400,  # 100 tokens
+            "pkg/two.py": "c" * 400,  # 100 tokens
+        }
+
+        batches = scanner._create_batches(files_content)
+
+        pkg_batches = [i for i, b in enumerate(batches) if "pkg/one.py" in b or "pkg/two.py" in b]
+        assert len(set(pkg_batches)) == 1
+
+    def test_create_batches_estimates_each_file_once(self, mock_dependencies):
+        """Test that _create_batches estimates tokens once per file, even when splitting."""
+        mock_dependencies["llm_client"].context_limit = 1000
+
+        scanner = Scanner(**mock_dependencies)
+
+        files_content = {f"src/file{i}.py": "a" * 400 for i in range(5)}
+
+        from code_scanner.utils import estimate_tokens
+        with patch("code_scanner.scanner.estimate_tokens", side_effect=estimate_tokens) as mock_estimate:
+            batches = scanner._create_batches(files_content)
+
+        assert mock_estimate.call_count == len(files_content)
+        assert sum(len(b) for b in batches) == len(files_content)
+
     def test_format_tool_result_with_string_data(self, mock_dependencies):
         """Test _format_tool_result handles non-dict/list data."""
         scanner = Scanner(**mock_dependencies)
@@ -1223,6 +2017,27 @@ class TestScannerAdditionalCoverage:
         assert issues[0].file_path == "exists.py"
         assert issues[0].description == "Valid - file exists"
 
+    def test_parse_issues_stats_each_file_once(self, mock_dependencies, tmp_path):
+        """Test that repeated issues in one file reuse the existence check."""
+        (tmp_path / "main.py").write_text("content")
+        mock_dependencies["config"].target_directory = tmp_path
+
+        scanner = Scanner(**mock_dependencies)
+
+        response = {
+            "issues": [
+                {"file": "main.py", "line_number": i, "description": f"Issue {i}"}
+                for i in range(1, 4)
+            ]
+        }
+
+        with patch.object(Path, "is_file", autospec=True, return_value=True) as mock_is_file:
+            issues = scanner._parse_issues_from_response(response, "test check", 0)
+
+        assert len(issues) == 3
+        assert mock_is_file.call_count == 1
+        assert scanner._file_exists_cache == {"main.py": True}
+
 
 class TestFilterIgnoredFiles:
     """Tests for _filter_ignored_files method."""
@@ -1475,7 +2290,11 @@ class TestWatermarkRescan:
             changed_files=[ChangedFile(path="test.py", status="unstaged")]
         )
         
-        files_content = {"test.py": "x = 1"}
+        # Each rebuild sees edited content, as it would after a real worktree change
+        reads = [0]
+        def get_content_side_effect(changed_files):
+            reads[0] += 1
+            return {"test.py": f"x = {reads[0]}"}
         
         # Refresh fires after check 1 (index 0), so checks 0 needs rescan
         query_count = [0]
@@ -1487,7 +2306,7 @@ class TestWatermarkRescan:
         
         mock_dependencies["llm_client"].query.side_effect = query_side_effect
         
-        with patch.object(scanner, "_get_files_content", return_value=files_content):
+        with patch.object(scanner, "_get_files_content", side_effect=get_content_side_effect):
             scanner._run_scan(state)
         
         # Initial run: 3 checks, then rescan: 1 check (only check 0)
@@ -1524,7 +2343,11 @@ class TestWatermarkRescan:
             changed_files=[ChangedFile(path="test.py", status="unstaged")]
         )
         
-        files_content = {"test.py": "x = 1"}
+        # Each rebuild sees edited content, as it would after a real worktree change
+        reads = [0]
+        def get_content_side_effect(changed_files):
+            reads[0] += 1
+            return {"test.py": f"x = {reads[0]}"}
         
         # Refresh on iterations 1 and 2, then stop
         query_count = [0]
@@ -1537,7 +2360,7 @@ class TestWatermarkRescan:
         
         mock_dependencies["llm_client"].query.side_effect = query_side_effect
         
-        with patch.object(scanner, "_get_files_content", return_value=files_content):
+        with patch.object(scanner, "_get_files_content", side_effect=get_content_side_effect):
             scanner._run_scan(state)
         
         # Iteration 1: 2 checks (refresh at 1)
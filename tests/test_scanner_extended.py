@@ -19,8 +19,12 @@ def mock_config():
     config.output_file = "results.md"
     config.log_file = "scanner.log"
     config.git_poll_interval = 1.0
+    config.git_idle_poll_max = 120
+    config.fs_watch_interval = 0
     config.llm_retry_interval = 1.0
     config.max_llm_retries = 3
+    config.llm_concurrency = 1
+    config.output_write_interval = 2.0
     config.check_groups = [
         CheckGroup(pattern="*.py", checks=["Check for bugs"]),
     ]
@@ -216,7 +220,7 @@ class TestGetFilesContent:
             ChangedFile(path="image.png", status="modified"),
         ]
         
-        with patch("code_scanner.scanner.is_binary_file", return_value=True):
+        with patch("code_scanner.scanner.read_if_text", return_value=None):
             result = scanner._get_files_content(changed_files)
         
         assert len(result) == 0
@@ -229,8 +233,7 @@ class TestGetFilesContent:
             ChangedFile(path="test.py", status="modified"),
         ]
         
-        with patch("code_scanner.scanner.is_binary_file", return_value=False), \
-             patch("code_scanner.scanner.read_file_content", return_value="content"):
+        with patch("code_scanner.scanner.read_if_text", return_value="content"):
             result = scanner._get_files_content(changed_files)
         
         assert "test.py" in result
@@ -23,7 +23,11 @@ def mock_config(tmp_path):
     config.output_file = "results.md"
     config.log_file = "scanner.log"
     config.git_poll_interval = 1
+    config.git_idle_poll_max = 120
+    config.fs_watch_interval = 0
     config.max_llm_retries = 3
+    config.llm_concurrency = 1
+    config.output_write_interval = 2.0
     config.check_groups = [
         CheckGroup(pattern="*.py", checks=["Find bugs in this code"])
     ]
@@ -239,10 +243,10 @@ class TestScannerWithTools:
         )
 
         # Max iterations is dynamically calculated based on context window
-        # The loop should eventually stop and return empty issues
+        # The loop should eventually stop and report that there was no answer
         assert llm_client.query.call_count > 0  # At least one call
         assert llm_client.query.call_count <= 50  # Capped at 50 max
-        assert len(issues) == 0  # No final answer after max iterations
+        assert issues is None  # No final answer after max iterations
 
     def test_run_check_tool_failure_handling(self, mock_components, tmp_path):
         """Test handling of tool execution failures."""
@@ -300,6 +304,17 @@ class TestScannerWithTools:
         assert "a.py" in formatted
         assert "b.py" in formatted
 
+    def test_format_tool_result_compact(self, mock_components):
+        """Test that tool results are unindented and keep non-ASCII text."""
+        scanner = mock_components["scanner"]
+
+        result = Mock()
+        result.data = {"content": "naïve", "lines": [1, 2]}
+
+        formatted = scanner._format_tool_result(result)
+
+        assert formatted == '{"content": "naïve", "lines": [1, 2]}'
+
     def test_tool_result_includes_warning(self, mock_components, tmp_path):
         """Test that tool warnings are included in LLM messages."""
         scanner = mock_components["scanner"]
@@ -1,7 +1,9 @@
 """Unit tests for text utilities."""
 
+import os
 import pytest
 from pathlib import Path
+from unittest.mock import patch
 
 from code_scanner.text_utils import (
     levenshtein_distance,
@@ -48,6 +50,12 @@ class TestLevenshteinDistance:
         """Test multiple edits required."""
         assert levenshtein_distance("kitten", "sitting") == 3
 
+    def test_shared_prefix_and_suffix(self):
+        """Test distances where the strings share a prefix and suffix."""
+        assert levenshtein_distance("src/scanner_utils.py", "src/scanner_util.py") == 1
+        assert levenshtein_distance("aaa", "aa") == 1
+        assert levenshtein_distance("prefix_ab_suffix", "prefix_ba_suffix") == 2
+
 
 class TestSimilarityRatio:
     """Tests for similarity ratio calculation."""
@@ -70,6 +78,12 @@ class TestSimilarityRatio:
         """Test empty strings have ratio 1.0."""
         assert similarity_ratio("", "") == 1.0
 
+    def test_longest_common_subsequence_ratio(self):
+        """Test the ratio is 2 * LCS / total length."""
+        assert similarity_ratio("abcd", "acbd") == 0.75
+        assert similarity_ratio("main.py", "") == 0.0
+        assert similarity_ratio("kitten", "sitting") == pytest.approx(8 / 13)
+
 
 class TestFuzzyMatch:
     """Tests for fuzzy matching."""
@@ -123,6 +137,17 @@ class TestFindSimilarStrings:
         assert results[0][0] == "hello"
 
 
+    def test_scores_match_similarity_ratio(self):
+        """Test that scores equal similarity_ratio and ties keep candidate order."""
+        candidates = ["config.py", "scanner.py", "confg.py", "cfg.py", "config.pyi"]
+        results = find_similar_strings("config.py", candidates, max_results=10, threshold=0.3)
+
+        expected = [(c, similarity_ratio("config.py", c)) for c in candidates]
+        expected = [r for r in expected if r[1] >= 0.3]
+        expected.sort(key=lambda r: r[1], reverse=True)
+        assert results == expected
+
+
 class TestNormalizeWhitespace:
     """Tests for whitespace normalization."""
 
@@ -178,6 +203,21 @@ class TestTruncateOutput:
         assert len(result.split("\n")) == 50
 
 
+    def test_byte_limit_multibyte_characters(self):
+        """Test that multi-byte text under the character count is still cut by bytes."""
+        content = "é" * 30  # 60 bytes
+        result, was_truncated, _ = truncate_output(content, max_bytes=41)
+
+        assert was_truncated
+        assert result == "é" * 20
+
+    def test_exact_line_limit_not_truncated(self):
+        """Test that a trailing newline at the line limit is kept."""
+        content = "a\nb\n"
+        assert truncate_output(content, max_lines=3) == (content, False, "")
+        assert truncate_output(content, max_lines=2)[0] == "a\nb"
+
+
 class TestFormatValidationError:
     """Tests for validation error formatting."""
 
@@ -315,6 +355,29 @@ class TestSuggestSimilarFiles:
         # Should not find .git/config
         assert not any(".git" in s for s in suggestions)
 
+    def test_build_directories_not_walked(self, tmp_path):
+        """Test excluded directories are pruned instead of walked and filtered."""
+        (tmp_path / "node_modules" / "pkg").mkdir(parents=True)
+        (tmp_path / "node_modules" / "pkg" / "main.py").write_text("content")
+        (tmp_path / "main.py").write_text("content")
+
+        with patch("code_scanner.text_utils.os.scandir", wraps=os.scandir) as mock_scandir:
+            suggestions = suggest_similar_files("maim.py", tmp_path)
+
+        assert suggestions == ["main.py"]
+        assert mock_scandir.call_count == 1
+
+    def test_length_bound_skips_full_comparison(self, tmp_path):
+        """Test candidates that can't reach the cutoff are never fully compared."""
+        (tmp_path / "main.py").write_text("content")
+        (tmp_path / "a_very_long_unrelated_module_name.py").write_text("content")
+
+        with patch("code_scanner.text_utils.similarity_ratio", wraps=similarity_ratio) as mock_ratio:
+            suggestions = suggest_similar_files("maim.py", tmp_path)
+
+        assert suggestions == ["main.py"]
+        mock_ratio.assert_called_once_with("maim.py", "main.py")
+
     def test_max_suggestions(self, tmp_path):
         """Test max_suggestions parameter."""
         for i in range(10):
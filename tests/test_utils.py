@@ -13,7 +13,7 @@ from code_scanner.utils import (
     is_binary_file,
     estimate_tokens,
     read_file_content,
-
+    read_if_text,
     setup_logging,
     group_files_by_directory,
     CHARS_PER_TOKEN,
@@ -108,6 +108,35 @@ class TestReadFileContent:
 
 
 
+class TestReadIfText:
+    """Tests for read_if_text function."""
+
+    def test_null_byte_after_sniff_window_is_text(self, tmp_path):
+        """Only the sniffed prefix decides whether a file is binary."""
+        file_path = tmp_path / "data.txt"
+        file_path.write_bytes(b"a" * 16 + b"\x00")
+
+        assert read_if_text(file_path, sniff_bytes=8) == "a" * 16 + "\x00"
+        assert read_if_text(file_path, sniff_bytes=32) is None
+
+    def test_matches_text_mode_newlines(self, tmp_path):
+        """CRLF and CR line endings are normalized like a text-mode read."""
+        file_path = tmp_path / "crlf.py"
+        file_path.write_bytes(b"a\r\nb\rc\n")
+
+        assert read_if_text(file_path) == "a\nb\nc\n"
+
+    def test_opens_file_once(self, tmp_path):
+        """The binary sniff and the read share one open call."""
+        file_path = tmp_path / "test.py"
+        file_path.write_text("x = 1")
+
+        with patch("builtins.open", wraps=open) as mock_open:
+            assert read_if_text(file_path) == "x = 1"
+
+        assert mock_open.call_count == 1
+
+
 class TestGroupFilesByDirectory:
     """Tests for group_files_by_directory function."""
 